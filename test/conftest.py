@@ -1,56 +1,857 @@
 # tests/conftest.py
 
+import time
+
+# Inicio de la importación del conftest (ver el resumen de arranque)
+CONFTEST_IMPORT_START = time.perf_counter()
+
 import pytest
 import pytest_html.extras 
 import os # Necesario para la manipulación de rutas en el hook
-from utils.base_page import setup_driver, teardown_driver, BasePage
+import sys
+import subprocess
+# Los módulos de navegador (Selenium: base_page, driver_pool, session) se importan
+# recién dentro de las fixtures de UI y de BrowserReporter, que se registra solo si
+# algún test seleccionado pide la fixture 'driver'. Una ejecución solo de API no los carga.
+from utils.ui_settings import (
+    BASE_URL, set_base_url, get_base_url, WAIT_SETTINGS, configure_waits,
+    FORM_FILL_MODES, FORM_SETTINGS, configure_form_fill,
+    ELEMENT_CACHE_SETTINGS, ELEMENT_CACHE_STATS, configure_element_cache,
+)
+from utils.driver_resolver import configure_driver_resolution, STARTUP_TIMINGS
+from utils.browser_profiles import BROWSER_PROFILES, DEFAULT_PROFILE, set_active_profile, get_active_profile
+from utils.local_server import LocalSiteServer
+from utils.api_stub import ApiStubServer, StubConfig, mount_stub, INPROCESS_BASE_URL
+from utils.api_client import ApiClient, DEFAULT_TIMEOUT, DEFAULT_RETRIES
+from utils.parallel import REPORTS_DIR, worker_id, is_xdist_worker
+from utils.scheduler import DurationHistory, DEFAULT_HISTORY_PATH, longest_first, plan_shards
+from utils.impact import (
+    IMPACT_RECORDER, ImpactMap, DEFAULT_MAP_PATH, DEFAULT_FULL_RUN_EVERY, git_changes, select_tests,
+)
+from utils.page_timing import PAGE_TIMINGS, TIMING_SETTINGS, configure_page_timing
+from utils.log_config import CATEGORIES, configure_logging, get_logger, parse_levels, set_test_context, shutdown_logging
+from utils.network import NETWORK_SETTINGS, NETWORK_RECORDER, RESOURCE_TYPE_PATTERNS, THROTTLE_PROFILES, configure_network
+from utils.command_tracer import COMMAND_TRACER, TRACE_SETTINGS, configure_tracing, latency_table, format_latency_table
+from utils.artifact_store import ARTIFACT_STORE, ARTIFACTS_DIR, RETENTION_SETTINGS
+from utils.screenshots import SCREENSHOT_MODES, SCREENSHOT_SETTINGS, SCREENSHOT_WRITER, configure_screenshots
+from utils.startup_report import BROWSER_MODULES, DEFAULT_BUDGET_PATH, load_budget
+
+logger = get_logger('tests')
+CONFTEST_IMPORT_S = time.perf_counter() - CONFTEST_IMPORT_START
+
+# API por defecto de las pruebas de test_api.py (JSONPlaceholder, estable para CRUD)
+API_BASE_URL = "https://jsonplaceholder.typicode.com"
+
+DRIVER_POOL_KEY = pytest.StashKey()
+# Reporte de la fase 'call' de cada test (el pool descarta los drivers de tests fallidos)
+CALL_REPORT_KEY = pytest.StashKey()
+API_CLIENT_KEY = pytest.StashKey()
+# Estadísticas de cada proceso (en paralelo, las envía cada worker al controlador)
+FRAMEWORK_STATS_KEY = pytest.StashKey()
+# Historial de duraciones y registrador de las duraciones de esta ejecución
+DURATION_HISTORY_KEY = pytest.StashKey()
+DURATION_RECORDER_KEY = pytest.StashKey()
+# Estimaciones previas a la ejecución de los tests que corrieron (para el resumen)
+PREDICTIONS_KEY = pytest.StashKey()
+# Mapa test -> dependencias, su registrador y el resultado de la selección por impacto
+IMPACT_MAP_KEY = pytest.StashKey()
+IMPACT_TRACKER_KEY = pytest.StashKey()
+IMPACT_SELECTION_KEY = pytest.StashKey()
+# Tiempos de arranque del proceso (importación del conftest, colección y módulos de navegador)
+BOOT_STATS_KEY = pytest.StashKey()
+
+# ====================================================================
+# --- OPCIONES DE LÍNEA DE COMANDOS ---
+# ====================================================================
+
+def pytest_addoption(parser):
+    group = parser.getgroup("saucedemo", "Opciones del framework de automatización")
+    group.addoption(
+        "--driver-mode",
+        choices=("function", "pooled"),
+        default=os.environ.get("DRIVER_MODE", "function"),
+        help="'function' abre un navegador por test; 'pooled' reutiliza navegadores "
+             "entre tests (env: DRIVER_MODE).",
+    )
+    group.addoption(
+        "--site-url",
+        default=os.environ.get("SITE_URL", BASE_URL),
+        help="URL base del sitio bajo prueba; 'local' levanta la réplica incluida en "
+             "utils/saucedemo_local (env: SITE_URL).",
+    )
+    group.addoption(
+        "--api-url",
+        default=os.environ.get("API_URL", API_BASE_URL),
+        help="URL base de la API para test_api.py; 'stub' levanta el stub local de "
+             "/posts en un puerto efímero e 'inprocess' lo monta como adaptador de "
+             "transporte, sin sockets (env: API_URL).",
+    )
+    group.addoption(
+        "--api-timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help=f"Timeout en segundos de cada request del ApiClient (por defecto {DEFAULT_TIMEOUT}).",
+    )
+    group.addoption(
+        "--api-retries",
+        type=int,
+        default=DEFAULT_RETRIES,
+        help=f"Reintentos con backoff ante errores 429/502/503/504 (por defecto {DEFAULT_RETRIES}).",
+    )
+    group.addoption(
+        "--api-stub-latency",
+        type=float,
+        default=0.0,
+        help="Latencia inyectada por el stub de la API, en milisegundos.",
+    )
+    group.addoption(
+        "--api-stub-error-rate",
+        type=float,
+        default=0.0,
+        help="Probabilidad (0 a 1) de que el stub de la API responda 500.",
+    )
+    group.addoption(
+        "--api-stub-payload-size",
+        type=int,
+        default=0,
+        help="Bytes de relleno que el stub agrega a cada post devuelto.",
+    )
+    group.addoption(
+        "--load",
+        action="store_true",
+        default=False,
+        help="Habilita test_api_load.py: replica los escenarios de API como carga "
+             "concurrente y falla si se superan los SLOs del config.",
+    )
+    group.addoption(
+        "--load-config",
+        default=os.environ.get("LOAD_CONFIG"),
+        help="Archivo JSON de workload y SLOs para el modo carga (por defecto data/load_config.json).",
+    )
+    group.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="Habilita test_benchmarks.py: mide el costo del framework y falla si "
+             "alguna métrica empeora respecto de data/benchmark_baseline.json.",
+    )
+    group.addoption(
+        "--benchmark-tolerance",
+        type=float,
+        default=None,
+        help="Tolerancia relativa de los benchmarks (0.25 = 25%%); por defecto la del baseline.",
+    )
+    group.addoption(
+        "--schedule",
+        choices=("collection", "duration"),
+        default=os.environ.get("TEST_SCHEDULE", "collection"),
+        help="'duration' ejecuta los tests del más largo al más corto según el historial "
+             "de duraciones (con xdist reparte mejor la carga) (env: TEST_SCHEDULE).",
+    )
+    group.addoption(
+        "--shard-count",
+        type=int,
+        default=int(os.environ.get("SHARD_COUNT", 1)),
+        help="Cantidad de shards de CI; los tests se reparten por duración estimada (env: SHARD_COUNT).",
+    )
+    group.addoption(
+        "--shard-index",
+        type=int,
+        default=int(os.environ.get("SHARD_INDEX", 0)),
+        help="Shard que ejecuta este proceso, de 0 a --shard-count - 1 (env: SHARD_INDEX).",
+    )
+    group.addoption(
+        "--durations-file",
+        default=os.environ.get("DURATIONS_FILE", DEFAULT_HISTORY_PATH),
+        help="Historial de duraciones por test que se actualiza al terminar cada ejecución.",
+    )
+    group.addoption(
+        "--impact-record",
+        action="store_true",
+        default=os.environ.get("IMPACT_RECORD", "0") == "1",
+        help="Registra qué módulos, Page Objects y locators de utils/ ejercita cada test "
+             "y actualiza el mapa de impacto (env: IMPACT_RECORD=1).",
+    )
+    group.addoption(
+        "--impact-changed",
+        default=os.environ.get("IMPACT_CHANGED"),
+        help="Archivos cambiados separados por coma: ejecuta solo los tests afectados "
+             "según el mapa de impacto (env: IMPACT_CHANGED).",
+    )
+    group.addoption(
+        "--impact-diff",
+        default=os.environ.get("IMPACT_DIFF"),
+        help="Rango de git (por ejemplo origin/main...HEAD): ejecuta solo los tests "
+             "afectados por ese diff (env: IMPACT_DIFF).",
+    )
+    group.addoption(
+        "--impact-full-every",
+        type=int,
+        default=int(os.environ.get("IMPACT_FULL_EVERY", DEFAULT_FULL_RUN_EVERY)),
+        help="Con selección por impacto, cada cuántas ejecuciones se corre la suite "
+             f"completa como red de seguridad; 0 nunca (env: IMPACT_FULL_EVERY, por defecto {DEFAULT_FULL_RUN_EVERY}).",
+    )
+    group.addoption(
+        "--impact-map",
+        default=os.environ.get("IMPACT_MAP", DEFAULT_MAP_PATH),
+        help="Archivo del mapa de impacto (test -> dependencias).",
+    )
+    group.addoption(
+        "--browser-profile",
+        choices=sorted(BROWSER_PROFILES),
+        default=os.environ.get("BROWSER_PROFILE", DEFAULT_PROFILE),
+        help="Perfil del navegador: 'fast' (headless, carga eager, sin imágenes), "
+             "'debug' o 'faithful' (env: BROWSER_PROFILE).",
+    )
+    group.addoption(
+        "--wait-timeout",
+        type=float,
+        default=None,
+        help=f"Timeout por defecto de las esperas explícitas en segundos "
+             f"(env: WAIT_TIMEOUT, por defecto {WAIT_SETTINGS['timeout']:g}).",
+    )
+    group.addoption(
+        "--poll-interval",
+        type=float,
+        default=None,
+        help=f"Intervalo de sondeo de las esperas en segundos "
+             f"(env: WAIT_POLL_INTERVAL, por defecto {WAIT_SETTINGS['poll_frequency']:g}).",
+    )
+    group.addoption(
+        "--wait-budget",
+        type=float,
+        default=float(os.environ.get("WAIT_BUDGET", 30)),
+        help="Segundos totales que un test de UI puede pasar esperando antes de "
+             "fallar de inmediato; 0 lo desactiva (env: WAIT_BUDGET).",
+    )
+    group.addoption(
+        "--form-fill",
+        choices=FORM_FILL_MODES,
+        default=FORM_SETTINGS['mode'],
+        help="'keys' tipea los formularios carácter por carácter; 'fast' asigna los "
+             "valores por script en una sola llamada (env: FORM_FILL_MODE).",
+    )
+    group.addoption(
+        "--element-cache",
+        action="store_true",
+        default=ELEMENT_CACHE_SETTINGS['enabled'],
+        help="Cachea los elementos por locator dentro de cada Page Object "
+             "(env: ELEMENT_CACHE=1).",
+    )
+    group.addoption(
+        "--screenshot-mode",
+        choices=SCREENSHOT_MODES,
+        default=SCREENSHOT_SETTINGS['mode'],
+        help="Captura ante fallos: 'viewport', 'full' (página completa) o 'element' "
+             "(el elemento del marker screenshot_element) (env: SCREENSHOT_MODE).",
+    )
+    group.addoption(
+        "--page-timing",
+        action="store_true",
+        default=TIMING_SETTINGS['enabled'],
+        help="Mide Navigation/Paint Timing en cada transición de página y los guarda en "
+             "reports/timings/<worker>/ y en el reporte HTML (env: PAGE_TIMING=1).",
+    )
+    group.addoption(
+        "--webdriver-trace",
+        action="store_true",
+        default=TRACE_SETTINGS['enabled'],
+        help="Registra cada comando de WebDriver (método del Page Object y locator): una "
+             "traza Chrome trace-event por test en reports/traces/<worker>/ y latencias "
+             "p50/p95 por locator en el resumen (env: WEBDRIVER_TRACE=1).",
+    )
+    group.addoption(
+        "--block-urls",
+        default=",".join(NETWORK_SETTINGS['block_patterns']),
+        help="Patrones de URL separados por coma que el navegador no descarga, con '*' "
+             "como comodín (por ejemplo '*google-analytics*') (env: NETWORK_BLOCK).",
+    )
+    group.addoption(
+        "--block-resource-types",
+        default=",".join(NETWORK_SETTINGS['block_types']),
+        help=f"Tipos de recurso que no se descargan, separados por coma: "
+             f"{', '.join(sorted(RESOURCE_TYPE_PATTERNS))} (env: NETWORK_BLOCK_TYPES).",
+    )
+    group.addoption(
+        "--throttle",
+        choices=("none", *sorted(THROTTLE_PROFILES)),
+        default=NETWORK_SETTINGS['throttle'] or "none",
+        help="Emula un enlace lento en el navegador (env: NETWORK_THROTTLE).",
+    )
+    group.addoption(
+        "--har",
+        action="store_true",
+        default=NETWORK_SETTINGS['har'],
+        help="Registra un HAR con los requests, tamaños y tiempos de cada test de UI en "
+             "reports/har/<worker>/ (env: NETWORK_HAR=1).",
+    )
+    group.addoption(
+        "--log-categories",
+        default=os.environ.get("LOG_CATEGORIES", ""),
+        help=f"Nivel de log por categoría, por ejemplo 'pages=DEBUG,api=WARNING'. Categorías: "
+             f"{', '.join(CATEGORIES)}; el resto usa LOG_LEVEL (INFO) (env: LOG_CATEGORIES).",
+    )
+    group.addoption(
+        "--log-jsonl",
+        action="store_true",
+        default=os.environ.get("LOG_JSONL", "0") == "1",
+        help="Escribe los logs del framework como JSONL (test, worker, Page Object, duración "
+             "del paso) en reports/logs/<worker>/, desde un hilo de fondo (env: LOG_JSONL=1).",
+    )
+    group.addoption(
+        "--artifact-root",
+        default=os.environ.get("ARTIFACT_ROOT", ARTIFACTS_DIR),
+        help="Directorio del almacén de artefactos; la retención también poda los archivos "
+             "por ejecución de sus directorios hermanos (env: ARTIFACT_ROOT).",
+    )
+    group.addoption(
+        "--artifact-max-age-days",
+        type=float,
+        default=RETENTION_SETTINGS['max_age_days'],
+        help="Retención: borra las ejecuciones guardadas en reports/artifacts con más "
+             "días que este valor (env: ARTIFACT_MAX_AGE_DAYS).",
+    )
+    group.addoption(
+        "--artifact-max-runs",
+        type=int,
+        default=RETENTION_SETTINGS['max_runs'],
+        help="Retención: cantidad de ejecuciones que se conservan (env: ARTIFACT_MAX_RUNS).",
+    )
+    group.addoption(
+        "--artifact-max-mb",
+        type=float,
+        default=RETENTION_SETTINGS['max_mb'],
+        help="Retención: MB máximos del almacén de artefactos; se descartan las "
+             "ejecuciones más viejas hasta entrar (env: ARTIFACT_MAX_MB).",
+    )
+    group.addoption(
+        "--startup-report",
+        action="store_true",
+        default=os.environ.get("STARTUP_REPORT", "0") == "1",
+        help="Muestra el tiempo de importación del conftest, el de colección y si se "
+             "cargaron módulos de navegador, contra el presupuesto de data/startup_budget.json "
+             "(detalle por módulo: python -m utils.startup_report) (env: STARTUP_REPORT=1).",
+    )
+    group.addoption(
+        "--chromedriver",
+        default=None,
+        help="Ruta explícita al binario de chromedriver (env: CHROMEDRIVER_PATH).",
+    )
+    group.addoption(
+        "--driver-cache",
+        default=None,
+        help="Directorio con un chromedriver pre-descargado, para ejecutar sin red "
+             "(env: CHROMEDRIVER_CACHE).",
+    )
+
+
+def pytest_configure(config):
+    config.stash[BOOT_STATS_KEY] = {'conftest_import_s': CONFTEST_IMPORT_S, 'collection_s': None, 'ui_tests': None}
+    # Los valores por defecto vienen del entorno y argparse no los valida contra 'choices'
+    try:
+        set_active_profile(config.getoption("--browser-profile"))
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+    configure_waits(
+        timeout=config.getoption("--wait-timeout"),
+        poll_frequency=config.getoption("--poll-interval"),
+    )
+    try:
+        configure_form_fill(config.getoption("--form-fill"))
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+    configure_element_cache(config.getoption("--element-cache"))
+    configure_screenshots(config.getoption("--screenshot-mode"))
+    configure_page_timing(config.getoption("--page-timing"))
+    configure_tracing(config.getoption("--webdriver-trace"))
+    try:
+        configure_network(
+            block_patterns=[p for p in config.getoption("--block-urls").split(",") if p],
+            block_types=[t for t in config.getoption("--block-resource-types").split(",") if t],
+            throttle=config.getoption("--throttle"),
+            har=config.getoption("--har"),
+        )
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+    ARTIFACT_STORE.set_root(os.path.abspath(config.getoption("--artifact-root")))
+    # Todos los workers de xdist escriben sus manifiestos bajo el run_id del controlador
+    if is_xdist_worker(config):
+        ARTIFACT_STORE.run_id = config.workerinput['artifact_run_id']
+    # Logging del framework: niveles por categoría y sink JSONL en cola (una sola vez por proceso)
+    try:
+        configure_logging(
+            levels=parse_levels(config.getoption("--log-categories")),
+            jsonl_run_id=ARTIFACT_STORE.run_id if config.getoption("--log-jsonl") else None,
+        )
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+    config.addinivalue_line(
+        "markers",
+        "screenshot_element(by, value): elemento a capturar si el test falla con --screenshot-mode=element",
+    )
+    configure_driver_resolution(
+        driver_path=config.getoption("--chromedriver"),
+        cache_dir=config.getoption("--driver-cache"),
+    )
+    shard_count, shard_index = config.getoption("--shard-count"), config.getoption("--shard-index")
+    if shard_count < 1 or not 0 <= shard_index < shard_count:
+        raise pytest.UsageError(f"--shard-index debe estar entre 0 y {shard_count - 1}.")
+    config.stash[DURATION_HISTORY_KEY] = DurationHistory(config.getoption("--durations-file"))
+    recorder = DurationRecorder()
+    config.stash[DURATION_RECORDER_KEY] = recorder
+    config.pluginmanager.register(recorder, "duration-recorder")
+    # Con selección por impacto también se registra: el mapa se mantiene al día
+    if _impact_selection_requested(config) or config.getoption("--impact-record"):
+        config.stash[IMPACT_MAP_KEY] = ImpactMap(config.getoption("--impact-map"))
+        tracker = ImpactTracker()
+        config.stash[IMPACT_TRACKER_KEY] = tracker
+        config.pluginmanager.register(tracker, "impact-tracker")
+
+
+def pytest_report_header(config):
+    """Muestra en la cabecera de la sesión el perfil del navegador y el modo del driver."""
+    return f"perfil del navegador: {get_active_profile()}  modo del driver: {config.getoption('--driver-mode')}"
+
+
+def pytest_unconfigure(config):
+    # Vacía la cola de logs y detiene el hilo que escribe el JSONL
+    shutdown_logging()
+
+
+def pytest_runtest_logstart(nodeid, location):
+    set_test_context(nodeid)
+
+
+def pytest_runtest_logfinish(nodeid, location):
+    set_test_context(None)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Hook de xdist: comparte el run_id de los artefactos con cada worker."""
+    node.workerinput['artifact_run_id'] = ARTIFACT_STORE.run_id
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionstart(session):
+    """Aplica la retención del almacén de artefactos una sola vez, antes de lanzar los workers."""
+    config = session.config
+    if is_xdist_worker(config):
+        return
+    ARTIFACT_STORE.apply_retention(
+        max_age_days=config.getoption("--artifact-max-age-days"),
+        max_runs=config.getoption("--artifact-max-runs"),
+        max_mb=config.getoption("--artifact-max-mb"),
+    )
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_collection(session):
+    """Mide la colección (incluye la selección de tests y, si hace falta, la carga de Selenium)."""
+    start = time.perf_counter()
+    yield
+    session.config.stash[BOOT_STATS_KEY]['collection_s'] = time.perf_counter() - start
+
+# ====================================================================
+# --- PLANIFICACIÓN POR DURACIÓN (shards de CI y workers de xdist) ---
+# ====================================================================
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Con --impact-changed o --impact-diff deja solo los tests afectados por los
+    cambios (ver _select_by_impact). Con --shard-count > 1 deja solo los tests asignados a este shard (reparto
+    LPT por duración estimada). Con --schedule=duration, o al usar shards,
+    ordena los tests del más largo al más corto: xdist los envía en ese orden
+    a los workers libres, lo que se aproxima al mismo reparto.
+    """
+    history = config.stash[DURATION_HISTORY_KEY]
+    shard_count = config.getoption("--shard-count")
+    selected = _select_by_impact(config, items) if _impact_selection_requested(config) else items
+    if shard_count > 1:
+        # Se reparten solo los tests que quedaron tras la selección por impacto
+        # (los que ésta descartó ya se informaron como deseleccionados)
+        plan = plan_shards([item.nodeid for item in selected], shard_count, history.estimate)
+        assigned = set(plan[config.getoption("--shard-index")]['tests'])
+        deselected = [item for item in selected if item.nodeid not in assigned]
+        selected = [item for item in selected if item.nodeid in assigned]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+    if _duration_scheduling(config):
+        order = {nodeid: index for index, nodeid in enumerate(longest_first([item.nodeid for item in selected], history.estimate))}
+        selected = sorted(selected, key=lambda item: order[item.nodeid])
+    items[:] = selected
+
+
+def _duration_scheduling(config):
+    """Indica si la ejecución se planificó por duración (--schedule=duration o shards)."""
+    return config.getoption("--shard-count") > 1 or config.getoption("--schedule") == "duration"
+
+
+class DurationRecorder:
+    """
+    Plugin que acumula la duración de setup + call + teardown de cada test y
+    el worker que lo ejecutó ({nodeid: (segundos, worker)}). En paralelo, el
+    controlador recibe los reportes de todos los workers.
+    """
+
+    def __init__(self):
+        self.measured = {}
+
+    def pytest_runtest_logreport(self, report):
+        node = getattr(report, 'node', None)
+        worker = node.gateway.id if node is not None else worker_id()
+        seconds, _ = self.measured.get(report.nodeid, (0.0, worker))
+        self.measured[report.nodeid] = (seconds + report.duration, worker)
+
+# ====================================================================
+# --- SELECCIÓN POR IMPACTO DE LOS CAMBIOS ---
+# ====================================================================
+
+def _impact_selection_requested(config):
+    return bool(config.getoption("--impact-changed") or config.getoption("--impact-diff"))
+
+
+def _select_by_impact(config, items):
+    """
+    Deja los tests que ejercitaron algo de lo que cambió, según el mapa de
+    impacto. Corre la suite completa si no hay mapa todavía o si le toca la
+    ejecución completa periódica (--impact-full-every). Todos los procesos
+    (controlador y workers) leen el mismo mapa, así que deciden lo mismo.
+    """
+    impact_map = config.stash[IMPACT_MAP_KEY]
+    full_every = config.getoption("--impact-full-every")
+    nodeids = [item.nodeid for item in items]
+    if not impact_map.tests:
+        selection = {'full': True, 'reason': "todavía no hay mapa de impacto"}
+    elif full_every and impact_map.runs_since_full + 1 >= full_every:
+        selection = {'full': True, 'reason': f"ejecución completa periódica (cada {full_every})"}
+    else:
+        if config.getoption("--impact-diff"):
+            try:
+                changes = git_changes(config.getoption("--impact-diff"))
+            except (OSError, subprocess.CalledProcessError) as e:
+                raise pytest.UsageError(f"No se pudo obtener el diff de git: {e}")
+        else:
+            changes = {}
+        for path in (config.getoption("--impact-changed") or "").split(","):
+            if path.strip():
+                changes.setdefault(os.path.normpath(path.strip()).replace(os.path.sep, '/'), set())
+        chosen, reason = select_tests(nodeids, impact_map, changes)
+        selection = {'full': len(chosen) == len(nodeids), 'reason': reason}
+        nodeids = chosen
+
+    selection.update(selected=len(nodeids), total=len(items))
+    config.stash[IMPACT_SELECTION_KEY] = selection
+    if selection['full']:
+        return items
+    keep = set(nodeids)
+    deselected = [item for item in items if item.nodeid not in keep]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    return [item for item in items if item.nodeid in keep]
+
+
+class ImpactTracker:
+    """
+    Plugin que registra las dependencias de cada test solo durante su setup,
+    call y teardown (no durante los hooks del reporte, que son del framework).
+    Si el test falla, lo registrado se suma a lo que ya había en el mapa: una
+    ejecución interrumpida no debe achicar sus dependencias.
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.failed = set()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        IMPACT_RECORDER.start()
+        try:
+            yield
+        finally:
+            entry = IMPACT_RECORDER.stop()
+            if entry is not None:
+                self.entries[item.nodeid] = entry
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        yield from self._recording()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        yield from self._recording()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item, nextitem):
+        yield from self._recording()
+
+    @staticmethod
+    def _recording():
+        IMPACT_RECORDER.resume()
+        try:
+            yield
+        finally:
+            IMPACT_RECORDER.suspend()
+
+    def pytest_runtest_logreport(self, report):
+        if report.failed:
+            self.failed.add(report.nodeid)
+
+    def merge_into(self, impact_map):
+        for nodeid, entry in self.entries.items():
+            previous = impact_map.tests.get(nodeid)
+            if nodeid in self.failed and previous:
+                entry = {key: sorted(set(entry[key]) | set(previous.get(key, ()))) for key in entry}
+            impact_map.tests[nodeid] = entry
 
 # ====================================================================
 # --- FIXTURES OBLIGATORIAS DE SELENIUM ---
 # ====================================================================
 
+@pytest.fixture(scope="session")
+def base_url(request):
+    """
+    URL base de la sesión. Con --site-url=local levanta la réplica de Sauce Demo
+    en un servidor local (sin red, cargas de pocos milisegundos).
+    """
+    target = request.config.getoption("--site-url")
+    if target != "local":
+        set_base_url(target)
+        yield get_base_url()
+        return
+
+    server = LocalSiteServer().start()
+    set_base_url(server.base_url)
+    yield server.base_url
+    server.stop()
+    set_base_url(BASE_URL)
+
+@pytest.fixture(scope="session")
+def api_stub(request):
+    """
+    Stub local de JSONPlaceholder (/posts) en un puerto efímero, con la
+    latencia, tasa de errores y tamaño de payload indicados por línea de comandos.
+    """
+    with ApiStubServer(_stub_config(request.config)) as server:
+        yield server
+
+@pytest.fixture(scope="session")
+def api_stub_config(request):
+    """StubConfig con la latencia, tasa de errores y payload de las opciones --api-stub-*."""
+    return _stub_config(request.config)
+
+def _stub_config(config):
+    return StubConfig(
+        latency=config.getoption("--api-stub-latency") / 1000,
+        error_rate=config.getoption("--api-stub-error-rate"),
+        payload_size=config.getoption("--api-stub-payload-size"),
+    )
+
+@pytest.fixture(scope="session")
+def api_base_url(request):
+    """URL base de la API: la real por defecto o el stub local con --api-url=stub/inprocess."""
+    target = request.config.getoption("--api-url")
+    if target == "stub":
+        return request.getfixturevalue("api_stub").base_url
+    if target == "inprocess":
+        return INPROCESS_BASE_URL
+    return target.rstrip('/')
+
+@pytest.fixture(scope="session")
+def shared_api_client(request, api_base_url):
+    """
+    ApiClient compartido por toda la sesión, para que las pruebas de API
+    reutilicen las conexiones del pool.
+    """
+    client = ApiClient(
+        api_base_url,
+        timeout=request.config.getoption("--api-timeout"),
+        retries=request.config.getoption("--api-retries"),
+    )
+    if request.config.getoption("--api-url") == "inprocess":
+        mount_stub(client.session, _stub_config(request.config), base_url=api_base_url)
+    request.config.stash[API_CLIENT_KEY] = client
+    yield client
+    client.close()
+
+@pytest.fixture(scope="function")
+def api_client(shared_api_client):
+    """ApiClient de la sesión, con las métricas del test en curso reiniciadas."""
+    shared_api_client.begin_test()
+    return shared_api_client
+
+@pytest.fixture(scope="session")
+def driver_pool(request, base_url):
+    """
+    Pool de navegadores compartido por toda la sesión (solo en modo 'pooled').
+    """
+    from utils.driver_pool import DriverPool
+
+    pool = DriverPool(base_url=base_url)
+    request.config.stash[DRIVER_POOL_KEY] = pool
+    yield pool
+    pool.close()
+
 @pytest.fixture(scope="function")
 def driver(request):
     """
     Fixture principal que inicializa el WebDriver antes de cada test 
     y lo cierra al finalizar.
+    En modo 'pooled' el driver se toma del pool y se devuelve limpio al terminar.
     """
-    driver = setup_driver()
+    from utils.base_page import setup_driver, teardown_driver, start_wait_budget, clear_wait_budget
+
+    pooled = request.config.getoption("--driver-mode") == "pooled"
+    if pooled:
+        pool = request.getfixturevalue("driver_pool")
+        driver = pool.acquire()
+    else:
+        driver = setup_driver()
     
+    # Se registra el perfil del navegador para poder comparar tiempos entre perfiles
+    profile = get_active_profile()
+    request.node.user_properties.append(("browser_profile", profile))
+    request.node.user_properties.append(("worker", worker_id()))
+    logger.info("%s se ejecuta con el perfil de navegador '%s'.", request.node.nodeid, profile)
+
     # FIX: Se añade la verificación 'if request.cls' para evitar el AttributeError.
     # Esto asegura que el driver solo se adjunte al objeto de la clase de prueba si existe.
     if request.cls:
         request.cls.driver = driver
+
+    # Presupuesto de espera y registros de tiempos de página propios de cada test
+    start_wait_budget(request.config.getoption("--wait-budget"))
+    PAGE_TIMINGS.begin_test()
+    if TRACE_SETTINGS['enabled']:
+        COMMAND_TRACER.install(driver)
+        COMMAND_TRACER.begin_test()
+    NETWORK_RECORDER.begin_test(driver)
         
     yield driver
-    teardown_driver(driver)
+    clear_wait_budget()
+    if pooled:
+        # Un test fallido (o que no llegó a ejecutarse) puede dejar alertas o modales
+        # abiertos: ese navegador no vuelve al pool
+        call_report = request.node.stash.get(CALL_REPORT_KEY, None)
+        pool.release(driver, poisoned=call_report is None or call_report.failed)
+    else:
+        teardown_driver(driver)
 
 @pytest.fixture(scope="function")
-def login_setup(driver):
+def login_setup(driver, base_url):
     """
     Fixture que navega a la URL de Sauce Demo antes de cada test de login.
     """
-    driver.get("https://www.saucedemo.com/")
+    PAGE_TIMINGS.get(driver, base_url)
     return driver
 
+@pytest.fixture(scope="function")
+def page_timings(request):
+    """
+    Tiempos de carga de las transiciones del test en curso, para verificar
+    presupuestos por página. Solo disponible con --page-timing.
+    """
+    if not TIMING_SETTINGS['enabled']:
+        pytest.skip("Los tiempos de página requieren --page-timing.")
+    return PAGE_TIMINGS
+
+@pytest.fixture(scope="function")
+def authenticated_driver(request, login_setup):
+    """
+    Fixture que deja al usuario 'standard_user' logueado en el inventario sin
+    pasar por la UI de login (cookie de sesión, con login por UI como respaldo).
+    Para tests donde el login no es lo que se está probando.
+    """
+    from utils.session import authenticate
+
+    method = authenticate(login_setup, "standard_user", "secret_sauce")
+    request.node.user_properties.append(("auth_method", method))
+    return login_setup
+
 # ====================================================================
-# --- HOOK PARA CAPTURA DE PANTALLA EN FALLO (OBLIGATORIO) ---
+# --- HOOKS DE REPORTE (API siempre; captura de pantalla solo con tests de UI) ---
 # ====================================================================
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
-    Hook de Pytest que intercepta el resultado de la prueba.
-    Si la prueba de UI falla, se toma una captura de pantalla y se adjunta al reporte HTML.
+    Hook de Pytest que intercepta el resultado de la prueba y adjunta al reporte
+    las métricas de los requests de API. Los adjuntos de UI (captura en fallo,
+    tiempos de página, traza y HAR) los agrega BrowserReporter.
     """
     # Ejecuta el método de reporte estándar de Pytest primero
     outcome = yield
     report = outcome.get_result()
+    if report.when == 'call':
+        item.stash[CALL_REPORT_KEY] = report
+
+    # Métricas de los requests de API hechos por el test (latencia, status, bytes)
+    if report.when == 'call' and 'api_client' in item.funcargs:
+        records = list(item.funcargs['api_client'].test_records)
+        report.user_properties.append(("api_requests", records))
+        report.extras = getattr(report, 'extras', []) + [pytest_html.extras.json(records, name="API requests")]
+
+
+def pytest_collection_finish(session):
+    """
+    Registra BrowserReporter (y con él importa Selenium) solo si algún test
+    seleccionado pide la fixture 'driver'. En paralelo lo decide cada worker.
+    """
+    ui_tests = sum('driver' in getattr(item, 'fixturenames', ()) for item in session.items)
+    session.config.stash[BOOT_STATS_KEY]['ui_tests'] = ui_tests
+    if ui_tests and not session.config.pluginmanager.has_plugin("browser-reporter"):
+        session.config.pluginmanager.register(BrowserReporter(), "browser-reporter")
+
+
+class BrowserReporter:
+    """
+    Plugin con los adjuntos de los tests de UI. Si la prueba de UI falla, se
+    toma una captura de pantalla y se adjunta al reporte HTML; además adjunta
+    los tiempos de página, la traza de comandos de WebDriver y el HAR.
+    """
+
+    def __init__(self):
+        # Único punto donde el reporte necesita Selenium
+        from utils.base_page import BasePage
+        self.page_class = BasePage
+
+    @pytest.hookimpl(tryfirst=True, hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if report.when != 'call' or 'driver' not in item.funcargs:
+            return
+
+        # Tiempos de carga de cada transición de página del test (con --page-timing)
+        if TIMING_SETTINGS['enabled']:
+            PAGE_TIMINGS.collect(item.funcargs['driver'])
+            records = list(PAGE_TIMINGS.test_records)
+            if records:
+                PAGE_TIMINGS.write_jsonl(item.nodeid, ARTIFACT_STORE.run_id)
+                report.user_properties.append(("page_timings", records))
+                report.extras = getattr(report, 'extras', []) + [pytest_html.extras.json(records, name="Page timings")]
+
+        # Línea de tiempo de los comandos de WebDriver del test (con --webdriver-trace)
+        if TRACE_SETTINGS['enabled']:
+            trace_path = COMMAND_TRACER.write_trace(item.nodeid, ARTIFACT_STORE.run_id)
+            if trace_path:
+                relative = os.path.relpath(trace_path, os.path.dirname(REPORTS_DIR)).replace(os.path.sep, '/')
+                report.user_properties.append(("webdriver_trace", relative))
+                report.extras = getattr(report, 'extras', []) + [pytest_html.extras.url(f"../{relative}", name="WebDriver trace")]
+
+        # HAR con los requests del test: tamaños, tiempos y recursos bloqueados (con --har)
+        if NETWORK_SETTINGS['har']:
+            try:
+                har_path, summary = NETWORK_RECORDER.write_har(item.funcargs['driver'], item.nodeid, ARTIFACT_STORE.run_id)
+            except Exception as e:
+                har_path = None
+                logger.warning("No se pudo registrar el HAR de %s: %s", item.nodeid, e)
+            if har_path:
+                relative = os.path.relpath(har_path, os.path.dirname(REPORTS_DIR)).replace(os.path.sep, '/')
+                report.user_properties.append(("network", dict(summary, har=relative)))
+                report.extras = getattr(report, 'extras', []) + [pytest_html.extras.url(f"../{relative}", name="HAR")]
 
-    # 1. Chequea si la prueba falló (report.failed) y si estaba en la fase 'call' (ejecución)
-    if report.when == 'call' and report.failed:
-        # 2. Verifica si el test usa la fixture 'driver' (es decir, es una prueba de UI)
-        if 'driver' in item.funcargs:
+        # Captura de pantalla si la prueba de UI falló en la fase 'call' (ejecución)
+        if report.failed:
             try:
                 # El driver es accesible a través de item.funcargs, lo que funciona 
                 # para pruebas de función o de clase.
@@ -59,18 +860,286 @@ def pytest_runtest_makereport(item, call):
                 # Obtiene el nombre completo del test para el archivo
                 test_name = item.nodeid.replace("::", "_").replace("/", "_")
                 
-                # Crea una instancia de BasePage para llamar al método take_screenshot
-                base_page = BasePage(driver)
-                # El método toma la captura y devuelve la ruta relativa
-                screenshot_path = base_page.take_screenshot(test_name)
+                # Con --screenshot-mode=element se captura el elemento del marker
+                marker = item.get_closest_marker('screenshot_element')
+                locator = tuple(marker.args) if marker else None
+
+                # Crea una instancia de BasePage para llamar al método take_screenshot.
+                # La captura queda en memoria; el disco lo escribe un hilo de fondo.
+                base_page = self.page_class(driver)
+                screenshot = base_page.take_screenshot(test_name, locator=locator)
                 
-                # 3. Adjuntar la captura al reporte HTML
-                if screenshot_path:
-                    # Crea la etiqueta HTML para incrustar la imagen en el reporte
-                    # Nota: El path.sep debe reemplazarse por '/' en HTML
-                    html = f'<div><img src="../{screenshot_path.replace(os.path.sep, "/")}" alt="screenshot" style="width:300px; height:200px;" onclick="window.open(\'../{screenshot_path.replace(os.path.sep, "/")}\')"/></div>'
-                    report.extra = [pytest_html.extras.html(html)]
+                # Registrar la captura en el manifiesto y adjuntarla al reporte HTML
+                if screenshot:
+                    ARTIFACT_STORE.record(item.nodeid, 'screenshot', screenshot.path)
+                    if screenshot.thumbnail:
+                        ARTIFACT_STORE.record(item.nodeid, 'thumbnail', screenshot.thumbnail)
+                    # El reporte muestra la miniatura (si hay Pillow) y abre la imagen completa al hacer clic
+                    # (las rutas del almacén ya usan '/', como requiere el HTML)
+                    thumb_src = screenshot.thumbnail or screenshot.path
+                    html = f'<div><img src="../{thumb_src}" alt="screenshot" style="max-width:300px; max-height:200px;" onclick="window.open(\'../{screenshot.path}\')"/></div>'
+                    # pytest-html 4 lee 'report.extras' ('report.extra' ya no se muestra)
+                    report.extras = getattr(report, 'extras', []) + [pytest_html.extras.html(html)]
 
             except Exception as e:
                 # Si falla la toma de captura, lo imprime pero no detiene la ejecución
-                print(f"\n[ERROR] Fallo al intentar tomar/adjuntar la captura de pantalla: {e}")
\ No newline at end of file
+                print(f"\n[ERROR] Fallo al intentar tomar/adjuntar la captura de pantalla: {e}")
+
+# ====================================================================
+# --- RESUMEN DE LA SESIÓN (con soporte para pytest-xdist) ---
+# ====================================================================
+
+def _local_stats(config):
+    """Estadísticas de arranque y del pool de drivers de este proceso."""
+    pool = config.stash.get(DRIVER_POOL_KEY, None)
+    api_client = config.stash.get(API_CLIENT_KEY, None)
+    return {
+        'worker': worker_id(),
+        'startup': STARTUP_TIMINGS.summary(),
+        'pool': pool.stats() if pool is not None else None,
+        'api': api_client.stats() if api_client is not None else None,
+        'element_cache': dict(ELEMENT_CACHE_STATS) if ELEMENT_CACHE_SETTINGS['enabled'] else None,
+        'screenshots': dict(SCREENSHOT_WRITER.stats),
+        'page_timings': [(record['step'], record['transition_ms']) for record in PAGE_TIMINGS.records],
+        'webdriver_commands': COMMAND_TRACER.latency_stats(),
+        'network': NETWORK_RECORDER.summaries,
+        'boot': dict(config.stash[BOOT_STATS_KEY], browser_modules=[name for name in BROWSER_MODULES if name in sys.modules]),
+    }
+
+
+def pytest_sessionfinish(session, exitstatus):
+    # Espera a que el hilo de fondo termine de escribir las capturas pendientes
+    # y deja el manifiesto de la ejecución (test -> artefactos)
+    SCREENSHOT_WRITER.flush()
+    ARTIFACT_STORE.write_manifest()
+
+    tracker = session.config.stash.get(IMPACT_TRACKER_KEY, None)
+
+    # Cada worker envía sus estadísticas al controlador a través de xdist
+    if is_xdist_worker(session.config):
+        session.config.workeroutput['framework_stats'] = _local_stats(session.config)
+        if tracker is not None:
+            session.config.workeroutput['impact'] = {'entries': tracker.entries, 'failed': sorted(tracker.failed)}
+        return
+
+    # El mapa de impacto lo guarda solo el controlador, con lo registrado por todos
+    if tracker is not None:
+        impact_map = session.config.stash[IMPACT_MAP_KEY]
+        tracker.merge_into(impact_map)
+        selection = session.config.stash.get(IMPACT_SELECTION_KEY, None)
+        if selection is not None:
+            impact_map.runs_since_full = 0 if selection['full'] else impact_map.runs_since_full + 1
+        impact_map.save()
+
+    # El historial de duraciones lo actualiza solo el controlador (o el proceso único)
+    measured = session.config.stash[DURATION_RECORDER_KEY].measured
+    if measured:
+        history = session.config.stash[DURATION_HISTORY_KEY]
+        # El resumen de la planificación solo se muestra si la ejecución se planificó por duración
+        if _duration_scheduling(session.config):
+            session.config.stash[PREDICTIONS_KEY] = {nodeid: history.estimate(nodeid) for nodeid in measured}
+        history.update({nodeid: seconds for nodeid, (seconds, _) in measured.items()})
+        history.save()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Hook de xdist: recoge las estadísticas de cada worker al terminar."""
+    output = getattr(node, 'workeroutput', {})
+    stats = output.get('framework_stats')
+    if stats:
+        node.config.stash.setdefault(FRAMEWORK_STATS_KEY, []).append(stats)
+    tracker = node.config.stash.get(IMPACT_TRACKER_KEY, None)
+    if tracker is not None and output.get('impact'):
+        tracker.entries.update(output['impact']['entries'])
+        tracker.failed.update(output['impact']['failed'])
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """
+    Muestra los tiempos de arranque del navegador, las estadísticas del pool
+    de drivers si se usó el modo 'pooled', la reutilización de conexiones del
+    ApiClient, los aciertos de la caché de elementos, las capturas escritas,
+    los tiempos de carga por página, el tráfico de red registrado en los HAR y
+    la latencia de los comandos de WebDriver y, con --startup-report, el arranque.
+    En ejecuciones paralelas se suman los valores de todos los workers.
+    """
+    all_stats = config.stash.get(FRAMEWORK_STATS_KEY, None) or [_local_stats(config)]
+
+    launches = sum(stats['startup']['launch_count'] for stats in all_stats)
+    if launches:
+        launch_total = sum(stats['startup']['launch_total_s'] for stats in all_stats)
+        resolutions = [stats['startup']['resolution_s'] for stats in all_stats
+                       if stats['startup']['resolution_s'] is not None]
+        terminalreporter.write_sep("-", "startup del navegador")
+        if resolutions:
+            terminalreporter.write_line(f"resolución del driver: {max(resolutions):.2f}s")
+        terminalreporter.write_line(
+            f"lanzamientos: {launches}  total: {launch_total:.2f}s  "
+            f"promedio: {launch_total / launches:.2f}s"
+        )
+
+    pools = [stats for stats in all_stats if stats['pool'] is not None]
+    if pools:
+        terminalreporter.write_sep("-", "driver pool")
+        totals = {key: sum(stats['pool'][key] for stats in pools) for key in ('hits', 'misses', 'discarded')}
+        terminalreporter.write_line(
+            f"hits: {totals['hits']}  misses: {totals['misses']}  descartados: {totals['discarded']}"
+        )
+        if len(pools) > 1:
+            for stats in pools:
+                terminalreporter.write_line(
+                    f"  {stats['worker']}: hits {stats['pool']['hits']}  misses {stats['pool']['misses']}"
+                )
+
+    apis = [stats['api'] for stats in all_stats if stats['api'] and stats['api']['requests']]
+    if apis:
+        requests_count = sum(api['requests'] for api in apis)
+        new_connections = sum(api['new_connections'] for api in apis)
+        mean_ms = sum(api['mean_ms'] * api['requests'] for api in apis) / requests_count
+        terminalreporter.write_sep("-", "api client")
+        terminalreporter.write_line(
+            f"requests: {requests_count}  conexiones nuevas: {new_connections}  "
+            f"reutilización: {1 - new_connections / requests_count:.0%}  "
+            f"latencia media: {mean_ms:.1f} ms  máx: {max(api['max_ms'] for api in apis):.1f} ms"
+        )
+
+    caches = [stats['element_cache'] for stats in all_stats if stats['element_cache']]
+    if caches:
+        totals = {key: sum(cache[key] for cache in caches) for key in caches[0]}
+        lookups = totals['hits'] + totals['misses']
+        terminalreporter.write_sep("-", "element cache")
+        terminalreporter.write_line(
+            f"hits: {totals['hits']}  misses: {totals['misses']}  "
+            f"tasa de acierto: {totals['hits'] / lookups if lookups else 0:.0%}  "
+            f"invalidaciones: {totals['invalidations']}  elementos stale re-buscados: {totals['stale_refreshes']}"
+        )
+
+    shots = [stats['screenshots'] for stats in all_stats
+             if stats['screenshots']['queued'] or stats['screenshots']['deduplicated']]
+    if shots:
+        totals = {key: sum(shot[key] for shot in shots) for key in shots[0]}
+        terminalreporter.write_sep("-", "capturas de pantalla")
+        terminalreporter.write_line(
+            f"capturas: {totals['written']}  repetidas (no reescritas): {totals['deduplicated']}  "
+            f"fallidas: {totals['failed']}  "
+            f"{totals['bytes'] / 1024:.0f} KB escritos en segundo plano en {totals['write_s']:.2f}s"
+        )
+
+    timings = {}
+    for stats in all_stats:
+        for step, transition_ms in stats['page_timings']:
+            if transition_ms is not None:
+                timings.setdefault(step, []).append(transition_ms)
+    if timings:
+        terminalreporter.write_sep("-", "tiempos de página")
+        for step, values in sorted(timings.items()):
+            values.sort()
+            terminalreporter.write_line(
+                f"{step:<20} transiciones: {len(values):>3}  "
+                f"p50: {values[(len(values) - 1) // 2]:>7.1f} ms  máx: {values[-1]:>7.1f} ms"
+            )
+
+    networks = [summary for stats in all_stats for summary in stats['network']]
+    if networks:
+        by_type = {}
+        for summary in networks:
+            for resource_type, count in summary['by_type'].items():
+                by_type[resource_type] = by_type.get(resource_type, 0) + count
+        terminalreporter.write_sep("-", "red")
+        terminalreporter.write_line(
+            f"tests con HAR: {len(networks)}  requests: {sum(s['requests'] for s in networks)}  "
+            f"bloqueados: {sum(s['blocked'] for s in networks)}  fallidos: {sum(s['failed'] for s in networks)}  "
+            f"transferido: {sum(s['bytes'] for s in networks) / 1024:.0f} KB"
+        )
+        terminalreporter.write_line(
+            "por tipo: " + "  ".join(f"{name} {count}" for name, count in sorted(by_type.items(), key=lambda item: -item[1]))
+        )
+
+    commands = [entry for stats in all_stats for entry in stats['webdriver_commands']]
+    if commands:
+        terminalreporter.write_sep("-", f"comandos de webdriver ({sum(entry[3] for entry in commands)})")
+        for key in ('strategy', 'locator', 'method'):
+            for line in format_latency_table(latency_table(commands, key=key), limit=10):
+                terminalreporter.write_line(line)
+            terminalreporter.write_line("")
+
+    selection = config.stash.get(IMPACT_SELECTION_KEY, None)
+    if selection is not None:
+        terminalreporter.write_sep("-", "selección por impacto")
+        terminalreporter.write_line(
+            f"{selection['selected']} de {selection['total']} tests  "
+            f"({'suite completa: ' if selection['full'] else ''}{selection['reason']})"
+        )
+
+    _write_schedule_summary(terminalreporter, config)
+    if config.getoption("--startup-report"):
+        _write_startup_summary(terminalreporter, all_stats)
+
+
+def _write_startup_summary(terminalreporter, all_stats):
+    """
+    Importación del conftest y colección de cada proceso (en paralelo, de cada
+    worker). Si ningún test pidió la fixture 'driver', compara con el presupuesto
+    'api_only' de data/startup_budget.json y avisa si se cargó Selenium.
+    """
+    boots = [dict(stats['boot'], worker=stats['worker']) for stats in all_stats
+             if stats['boot']['collection_s'] is not None]
+    if not boots:
+        return
+    terminalreporter.write_sep("-", "arranque")
+    for boot in boots:
+        terminalreporter.write_line(
+            f"{boot['worker'] + '  ' if len(boots) > 1 else ''}"
+            f"importación del conftest: {boot['conftest_import_s'] * 1000:.0f} ms  "
+            f"colección: {boot['collection_s'] * 1000:.0f} ms  tests de UI: {boot['ui_tests']}  "
+            f"navegador: {', '.join(boot['browser_modules']) or 'no cargado'}"
+        )
+    if any(boot['ui_tests'] for boot in boots):
+        return
+    budget = ((load_budget(DEFAULT_BUDGET_PATH) or {}).get('scenarios') or {}).get('api_only', {})
+    for boot in boots:
+        collection_ms = boot['collection_s'] * 1000
+        if budget.get('max_collection_ms') is not None and collection_ms > budget['max_collection_ms']:
+            terminalreporter.write_line(
+                f"AVISO: colección de {collection_ms:.0f} ms sobre el presupuesto de {budget['max_collection_ms']:.0f} ms",
+                yellow=True,
+            )
+        loaded = [name for name in budget.get('forbidden_modules', ()) if name in boot['browser_modules']]
+        if loaded:
+            terminalreporter.write_line(
+                f"AVISO: ejecución sin tests de UI que cargó {', '.join(loaded)}", yellow=True,
+            )
+
+
+def _write_schedule_summary(terminalreporter, config):
+    """Makespan previsto (según el historial previo) y real de cada shard o worker."""
+    predictions = config.stash.get(PREDICTIONS_KEY, None)
+    measured = config.stash[DURATION_RECORDER_KEY].measured
+    if not predictions:
+        return
+    actual = {}
+    for seconds, worker in measured.values():
+        actual[worker] = actual.get(worker, 0.0) + seconds
+
+    terminalreporter.write_sep("-", "planificación por duración")
+    shard_count = config.getoption("--shard-count")
+    if shard_count > 1:
+        terminalreporter.write_line(
+            f"shard {config.getoption('--shard-index')}/{shard_count}: {len(measured)} tests  "
+            f"previsto: {sum(predictions.values()):.1f}s  real: {sum(actual.values()):.1f}s"
+        )
+    workers = sorted(actual)
+    plan = plan_shards(list(predictions), len(workers), predictions.get)
+    predicted = sorted((shard['predicted_s'] for shard in plan), reverse=True)
+    terminalreporter.write_line(
+        f"makespan previsto: {max(predicted):.1f}s  real: {max(actual.values()):.1f}s  "
+        f"({len(workers)} {'workers' if len(workers) > 1 else 'proceso'})"
+    )
+    if len(workers) > 1:
+        terminalreporter.write_line(
+            "  previsto por worker: " + "  ".join(f"{value:.1f}s" for value in predicted)
+        )
+        terminalreporter.write_line(
+            "  real por worker:     " + "  ".join(f"{worker} {actual[worker]:.1f}s" for worker in workers)
+        )
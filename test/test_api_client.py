@@ -0,0 +1,45 @@
+# tests/test_api_client.py
+from datetime import timedelta
+
+from utils.api_client import ApiClient
+
+# ====================================================================
+# --- CLIENTE DE API (reintentos) ---
+# ====================================================================
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.content = b"{}"
+        self.elapsed = timedelta(milliseconds=1)
+
+
+def _scripted(client, statuses):
+    """Reemplaza el envío de la sesión por respuestas con los status indicados; retorna los métodos enviados."""
+    sent = []
+    responses = iter(statuses)
+
+    def request(method, url, **kwargs):
+        sent.append(method)
+        return FakeResponse(next(responses))
+
+    client.session.request = request
+    return sent
+
+
+def test_urllib3_solo_reintenta_metodos_idempotentes():
+    retry = ApiClient("http://api.test").adapter.max_retries
+    assert retry.is_retry("GET", 503) and retry.is_retry("PUT", 502)
+    assert not retry.is_retry("POST", 503) and not retry.is_retry("PATCH", 503)
+
+
+def test_reintento_de_post_solo_si_se_pide():
+    client = ApiClient("http://api.test", retries=2, backoff=0)
+    sent = _scripted(client, [503, 201])
+    assert client.post("/posts", json={}).status_code == 503
+    assert sent == ["POST"]
+
+    sent = _scripted(client, [503, 503, 201])
+    assert client.post("/posts", json={}, retry_unsafe=True).status_code == 201
+    assert sent == ["POST", "POST", "POST"]
@@ -0,0 +1,28 @@
+# tests/test_api_load.py
+import pytest
+
+from utils.load_runner import load_config, run_from_config, format_summary, DEFAULT_CONFIG_PATH
+from utils.log_config import get_logger
+
+logger = get_logger('tests')
+
+# ====================================================================
+# --- MODO CARGA DE LA API (solo con --load) ---
+# ====================================================================
+
+def test_carga_api_cumple_slo(request, api_base_url, api_stub_config):
+    """
+    Replica los escenarios de test_api.py (GET, POST, PUT) como carga concurrente
+    contra la API configurada y valida los SLOs de latencia y errores del config.
+    """
+    if not request.config.getoption("--load"):
+        pytest.skip("El modo carga se habilita con --load.")
+
+    config = load_config(request.config.getoption("--load-config") or DEFAULT_CONFIG_PATH)
+    summary, violations = run_from_config(api_base_url, config, stub_config=api_stub_config)
+
+    request.node.user_properties.append(("load_summary", summary))
+    logger.info("Resultado de la carga:\n%s", format_summary(summary))
+    print("\n" + format_summary(summary))
+
+    assert not violations, "ERROR: SLOs incumplidos:\n" + "\n".join(violations)
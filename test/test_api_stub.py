@@ -0,0 +1,57 @@
+# tests/test_api_stub.py
+import requests
+
+from utils.api_client import ApiClient
+from utils.api_stub import ApiStubServer, StubConfig, mount_stub, INPROCESS_BASE_URL
+
+# ====================================================================
+# --- STUB DE JSONPLACEHOLDER (adaptador en proceso y servidor HTTP) ---
+# ====================================================================
+
+def _session(config=None):
+    session = requests.Session()
+    mount_stub(session, config)
+    return session
+
+
+def test_crud_completo_en_proceso():
+    """El stub responde como JSONPlaceholder a POST, PATCH, DELETE y listado."""
+    session = _session()
+    endpoint = f"{INPROCESS_BASE_URL}/posts"
+
+    created = session.post(endpoint, json={"title": "nuevo", "userId": 1})
+    assert created.status_code == 201
+    assert created.json()["id"] == 101
+
+    patched = session.patch(f"{endpoint}/101", json={"title": "editado"})
+    assert patched.status_code == 200
+    assert patched.json() == {"title": "editado", "userId": 1, "id": 101}
+
+    assert session.delete(f"{endpoint}/101").status_code == 200
+    assert session.get(f"{endpoint}/101").status_code == 404
+    assert len(session.get(endpoint, params={"userId": 1}).json()) == 10
+
+
+def test_errores_y_payload_inyectados():
+    """La tasa de errores y el tamaño de payload configurados se aplican."""
+    failing = _session(StubConfig(error_rate=1.0))
+    assert failing.get(f"{INPROCESS_BASE_URL}/posts/1").status_code == 500
+
+    padded = _session(StubConfig(payload_size=2048))
+    assert len(padded.get(f"{INPROCESS_BASE_URL}/posts/1").json()["padding"]) == 2048
+
+
+def test_servidor_http_con_keep_alive_sin_demoras():
+    """Sobre HTTP real, los requests reutilizan la conexión y no sufren la demora de Nagle (~40 ms)."""
+    with ApiStubServer() as server:
+        client = ApiClient(server.base_url)
+        try:
+            assert client.get("/posts/1").json()["id"] == 1
+            assert client.post("/posts", json={"title": "nuevo"}).status_code == 201
+            for _ in range(20):
+                client.get("/posts/1")
+            stats = client.stats()
+        finally:
+            client.close()
+    assert stats["new_connections"] == 1
+    assert stats["mean_ms"] < 20, f"Latencia media del stub: {stats['mean_ms']:.1f} ms"
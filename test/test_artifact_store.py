@@ -0,0 +1,82 @@
+# tests/test_artifact_store.py
+import os
+import time
+
+from utils.artifact_store import ArtifactStore
+
+# ====================================================================
+# --- ALMACÉN DE ARTEFACTOS: DEDUPLICACIÓN Y RETENCIÓN ---
+# ====================================================================
+
+DAY = 86400
+
+
+def _run(tmp_path, run_id, created, contents):
+    """Simula una ejecución de hace un tiempo que guardó 'contents' y escribió su manifiesto."""
+    store = ArtifactStore(root=str(tmp_path / "artifacts"), run_id=run_id, base_dir=str(tmp_path))
+    for index, data in enumerate(contents):
+        store.record(f"test_{index}", "screenshot", store.put(data, "png"))
+    os.utime(store.write_manifest(), (created, created))
+    return store
+
+
+def test_contenido_repetido_se_guarda_una_vez(tmp_path):
+    store = ArtifactStore(root=str(tmp_path / "artifacts"), base_dir=str(tmp_path))
+    first = store.put(b"captura", "png")
+    second = store.put(b"captura", "png")
+    assert first == second
+    assert store.stats == {'stored': 1, 'deduplicated': 1}
+
+
+def test_retencion_por_antiguedad_cantidad_y_tamano(tmp_path):
+    now = time.time()
+    _run(tmp_path, "vieja", now - 30 * DAY, [b"a" * 10])
+    _run(tmp_path, "r1", now - 3 * DAY, [b"b" * 600, b"compartido"])
+    _run(tmp_path, "r2", now - 2 * DAY, [b"c" * 600, b"compartido"])
+    store = _run(tmp_path, "r3", now - 1 * DAY, [b"d" * 600, b"compartido"])
+
+    # Antigüedad: se va 'vieja' y su objeto exclusivo
+    result = store.apply_retention(max_age_days=14, now=now)
+    assert result['removed_runs'] == ["vieja"] and result['freed_bytes'] == 10
+
+    # Cantidad: quedan las 2 más recientes; el objeto compartido sobrevive
+    result = store.apply_retention(max_runs=2, now=now)
+    assert result['removed_runs'] == ["r1"]
+    assert os.path.exists(os.path.join(str(tmp_path), store.put(b"compartido", "png")))
+
+    # Tamaño: r2 + r3 ocupan más de 1 KB, se conserva sólo la última
+    result = store.apply_retention(max_mb=1 / 1024, now=now)
+    assert result['removed_runs'] == ["r2"] and result['kept_runs'] == 1
+
+
+def _run_file(tmp_path, kind, name, created):
+    """Simula un archivo por ejecución escrito con artifact_dir(kind)."""
+    path = tmp_path / kind / "main" / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * 100)
+    os.utime(path, (created, created))
+    return path
+
+
+def test_retencion_de_trazas_har_logs_y_tiempos(tmp_path):
+    now = time.time()
+    old_run, recent_run, last_run = "20260101-100000-aaaaaa", "20260110-100000-bbbbbb", "20260111-100000-cccccc"
+    old_trace = _run_file(tmp_path, "traces", f"test_login_{old_run}.json", now - 30 * DAY)
+    old_log = _run_file(tmp_path, "logs", f"framework_{old_run}.jsonl", now - 30 * DAY)
+    recent_har = _run_file(tmp_path, "har", f"test_login_{recent_run}.har", now - 2 * DAY)
+    store = _run(tmp_path, last_run, now - DAY, [b"captura"])
+    last_timings = _run_file(tmp_path, "timings", f"page_timings_{last_run}.jsonl", now - DAY)
+
+    # Antigüedad: la ejecución vieja no guardó artefactos, pero sus archivos se borran igual
+    result = store.apply_retention(max_age_days=14, now=now)
+    assert result['removed_runs'] == [old_run] and result['freed_bytes'] == 200
+    assert not old_trace.exists() and not old_log.exists()
+
+    # Cantidad: se conserva sólo la última ejecución, con su manifiesto y sus tiempos
+    result = store.apply_retention(max_runs=1, now=now)
+    assert result['removed_runs'] == [recent_run]
+    assert not recent_har.exists() and last_timings.exists()
+
+
+def test_run_id_distingue_ejecuciones_del_mismo_segundo():
+    assert len({ArtifactStore().run_id for _ in range(20)}) == 20
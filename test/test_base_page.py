@@ -0,0 +1,192 @@
+# tests/test_base_page.py
+import time
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+
+from utils.base_page import BasePage, ELEMENT_CACHE_STATS, WAIT_SETTINGS, WaitBudget, WaitBudgetExceeded, clear_wait_budget, start_wait_budget
+from utils.checkout_page_step1 import CheckoutPageStep1
+from utils.inventory_page import InventoryPage
+
+# ====================================================================
+# --- BASEPAGE (driver simulado) ---
+# ====================================================================
+
+
+class FakeElement:
+    def __init__(self, driver, value):
+        self.driver = driver
+        self.value = value
+
+    def send_keys(self, text):
+        self.driver.typed.append((self.value, text))
+
+    def click(self):
+        self.driver.typed.append((self.value, 'click'))
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+
+class FakeDriver:
+    """
+    Driver mínimo: execute_script retorna en orden los resultados indicados y
+    find_element encuentra cualquier locator (registra los buscados y lo tipeado).
+    """
+
+    def __init__(self, script_results=()):
+        self.script_results = list(script_results)
+        self.scripts = []
+        self.found = []
+        self.typed = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append((script, args))
+        return self.script_results.pop(0)
+
+    def find_element(self, by, value):
+        self.found.append((by, value))
+        return FakeElement(self, value)
+
+
+@pytest.fixture
+def fast_polling(monkeypatch):
+    monkeypatch.setitem(WAIT_SETTINGS, 'poll_frequency', 0.01)
+    yield
+    clear_wait_budget()
+
+
+def test_presupuesto_de_espera():
+    budget = WaitBudget(1.0)
+    budget.consume(0.4)
+    assert budget.remaining() == pytest.approx(0.6)
+    budget.consume(1.0)
+    assert budget.remaining() == 0.0
+    assert start_wait_budget(0) is None
+    clear_wait_budget()
+
+
+def test_espera_recortada_por_el_presupuesto(fast_polling):
+    page = BasePage(FakeDriver(), timeout=5)
+    assert page._wait_until(lambda driver: "listo") == "listo"
+
+    budget = start_wait_budget(0.2)
+    start = time.perf_counter()
+    with pytest.raises(WaitBudgetExceeded):
+        page._wait_until(lambda driver: False)
+    assert time.perf_counter() - start < 1, "La espera debía cortarse al agotar el presupuesto, no al timeout"
+    assert budget.remaining() == 0.0
+
+    # Agotado el presupuesto, la siguiente espera falla sin esperar
+    start = time.perf_counter()
+    with pytest.raises(WaitBudgetExceeded):
+        page._wait_until(lambda driver: "listo")
+    assert time.perf_counter() - start < 0.05
+
+
+def test_timeout_propio_menor_que_el_presupuesto(fast_polling):
+    page = BasePage(FakeDriver())
+    start_wait_budget(10)
+    with pytest.raises(TimeoutException) as error:
+        page._wait_until(lambda driver: False, timeout=0.05)
+    assert not isinstance(error.value, WaitBudgetExceeded)
+
+
+# --- Lecturas en lote ---
+
+CATALOG = [{'name': 'Sauce Labs Backpack', 'price': '$29.99'}, {'name': 'Sauce Labs Bike Light', 'price': '$9.99'}]
+
+
+def test_lectura_en_lote_con_un_solo_round_trip():
+    driver = FakeDriver([CATALOG])
+    page = InventoryPage(driver)
+    assert page.get_first_product_details() == {'nombre': 'Sauce Labs Backpack', 'precio': '$29.99'}
+    assert len(driver.scripts) == 1 and driver.found == []
+
+
+def test_catalogo_vacio_falla_con_mensaje_claro():
+    with pytest.raises(AssertionError, match="no lista ningún producto"):
+        InventoryPage(FakeDriver([[]])).get_first_product_details()
+
+
+def test_lectura_en_lote_espera_si_la_pagina_no_esta_lista():
+    driver = FakeDriver([None, CATALOG])
+    assert InventoryPage(driver).get_catalog() == CATALOG
+    assert len(driver.scripts) == 2
+    assert driver.found == [InventoryPage.INVENTORY_CONTAINER]
+
+
+# --- Formularios ---
+
+FORM = {CheckoutPageStep1.FIRST_NAME_INPUT: "Ana", CheckoutPageStep1.LAST_NAME_INPUT: "Gómez"}
+
+
+def test_formulario_rapido_espera_al_campo_que_falta():
+    # La primera ejecución no encuentra 'first-name' (la página aún carga); la segunda completa todo
+    driver = FakeDriver([list(CheckoutPageStep1.FIRST_NAME_INPUT), None])
+    BasePage(driver).fill_form(FORM, submit=CheckoutPageStep1.CONTINUE_BUTTON, mode='fast')
+    assert driver.found == [CheckoutPageStep1.FIRST_NAME_INPUT]
+    script, (fields, submit) = driver.scripts[-1]
+    assert fields == [[list(locator), value] for locator, value in FORM.items()]
+    assert submit == list(CheckoutPageStep1.CONTINUE_BUTTON)
+
+
+def test_formulario_rapido_falla_si_el_campo_no_aparece():
+    missing = list(CheckoutPageStep1.LAST_NAME_INPUT)
+    driver = FakeDriver([missing, missing])
+    with pytest.raises(AssertionError, match="No se encontró el elemento del formulario"):
+        BasePage(driver).fill_form(FORM, mode='fast')
+
+
+def test_formulario_tecla_por_tecla():
+    driver = FakeDriver()
+    BasePage(driver).fill_form(FORM, submit=CheckoutPageStep1.CONTINUE_BUTTON, mode='keys')
+    assert driver.scripts == []
+    assert driver.typed == [("first-name", "Ana"), ("last-name", "Gómez"), ("continue", "click")]
+
+
+# --- Caché de elementos ---
+
+class StaleAwareDriver:
+    """Cada búsqueda crea un elemento nuevo; los comandos sobre ids anteriores fallan como stale."""
+
+    def __init__(self):
+        self.searches = 0
+        self.current_id = None
+
+    def find_element(self, by, value):
+        self.searches += 1
+        self.current_id = f"element-{self.searches}"
+        return RawElement(self, self.current_id)
+
+    def execute(self, command, params=None):
+        if params['id'] != self.current_id:
+            raise StaleElementReferenceException("re-render")
+        return {'value': f"texto de {params['id']}"}
+
+
+class RawElement:
+    def __init__(self, parent, id_):
+        self.parent = parent
+        self.id = id_
+
+
+def test_cache_de_elementos_y_refresco_tras_stale():
+    driver = StaleAwareDriver()
+    page = BasePage(driver, cache_elements=True)
+    stats_before = dict(ELEMENT_CACHE_STATS)
+
+    element = page.find_element(CheckoutPageStep1.FIRST_NAME_INPUT)
+    assert page.find_element(CheckoutPageStep1.FIRST_NAME_INPUT) is element
+    assert driver.searches == 1
+
+    # La página se re-renderizó: el comando falla como stale, se re-busca y se reintenta
+    driver.current_id = "otro-render"
+    assert element.text == "texto de element-2"
+    assert driver.searches == 2
+    assert page.find_element(CheckoutPageStep1.FIRST_NAME_INPUT) is element
+    assert ELEMENT_CACHE_STATS['stale_refreshes'] - stats_before['stale_refreshes'] == 1
+    assert ELEMENT_CACHE_STATS['hits'] - stats_before['hits'] == 2
@@ -0,0 +1,67 @@
+# tests/test_benchmarks.py
+import os
+import warnings
+
+import pytest
+
+from utils.ui_settings import BASE_URL
+from utils.benchmarks import run_benchmarks, load_baseline, compare, format_results, missing_from_baseline, BASELINE_VERSION
+
+# ====================================================================
+# --- BENCHMARKS DEL FRAMEWORK (solo con --benchmark) ---
+# ====================================================================
+
+def test_framework_sin_regresiones(request):
+    """
+    Mide los componentes del framework y falla si alguna mediana supera la del
+    baseline más la tolerancia. Los benchmarks de UI corren sobre la réplica
+    local salvo que se indique otro sitio con --site-url o SITE_URL.
+    """
+    if not request.config.getoption("--benchmark"):
+        pytest.skip("Los benchmarks se habilitan con --benchmark.")
+
+    baseline = load_baseline()
+    if baseline is None:
+        pytest.skip("No hay baseline: generarlo con 'python -m utils.benchmarks --update-baseline'.")
+
+    site_url = request.config.getoption("--site-url")
+    if site_url == BASE_URL and "SITE_URL" not in os.environ:
+        site_url = "local"
+
+    results = run_benchmarks(site_url=site_url)
+    request.node.user_properties.append(("benchmarks", results))
+    print("\n" + format_results(results, baseline))
+
+    for name in missing_from_baseline(results, baseline):
+        warnings.warn(f"La métrica '{name}' no tiene entrada en el baseline; regenerarlo con --update-baseline.")
+    regressions = compare(results, baseline, request.config.getoption("--benchmark-tolerance"))
+    assert not regressions, "ERROR: Regresiones de rendimiento:\n" + "\n".join(regressions)
+
+
+def test_comparacion_con_tolerancia_y_piso():
+    """Solo cuenta como regresión lo que supera la tolerancia relativa y el piso absoluto."""
+    baseline = {
+        'version': BASELINE_VERSION,
+        'tolerance': 0.25,
+        'tolerances': {'collection': 0.5},
+        'metrics': {
+            'csv_load': {'median_ms': 0.05},
+            'collection': {'median_ms': 700.0},
+            'checkout_flow': {'median_ms': 2000.0},
+        },
+    }
+    results = {
+        'csv_load': {'median_ms': 0.5},            # x10, pero debajo del piso de 1 ms
+        'collection': {'median_ms': 1000.0},       # +43%, dentro de su tolerancia propia
+        'checkout_flow': {'median_ms': 2600.0},    # +30%: regresión
+        'driver_startup': {'skipped': 'sin navegador'},
+    }
+    regressions = compare(results, baseline)
+    assert len(regressions) == 1 and regressions[0].startswith("checkout_flow")
+
+
+def test_metrica_sin_baseline_se_advierte_sin_fallar():
+    baseline = {'version': BASELINE_VERSION, 'tolerance': 0.25, 'metrics': {'csv_load': {'median_ms': 0.05}}}
+    results = {'csv_load': {'median_ms': 0.05}, 'find_element': {'median_ms': 3.0}, 'driver_startup': {'skipped': 'sin navegador'}}
+    assert compare(results, baseline) == []
+    assert missing_from_baseline(results, baseline) == ['find_element']
@@ -0,0 +1,80 @@
+# tests/test_command_tracer.py
+import pytest
+
+from utils.inventory_page import InventoryPage
+from utils.command_tracer import CommandTracer, configure_tracing, latency_table, latency_bucket
+
+# ====================================================================
+# --- TRAZA DE COMANDOS DE WEBDRIVER (driver simulado) ---
+# ====================================================================
+
+
+class FakeDriver:
+    """Implementa los comandos como lo hace Selenium: todo pasa por execute()."""
+
+    def execute(self, command, params=None):
+        if command == 'executeScript':
+            return {'value': [{'name': 'Sauce Labs Backpack', 'price': '$29.99'}]}
+        return {'value': []}
+
+    def execute_script(self, script, *args):
+        return self.execute('executeScript', {'script': script, 'args': list(args)})['value']
+
+    def find_elements(self, by, value):
+        return self.execute('findElements', {'using': by, 'value': value})['value']
+
+
+@pytest.fixture
+def tracer():
+    configure_tracing(True)
+    tracer = CommandTracer()
+    yield tracer
+    configure_tracing(False)
+
+
+def test_comandos_con_metodo_y_locator(tracer):
+    driver = tracer.install(FakeDriver())
+    tracer.begin_test()
+    page = InventoryPage(driver)
+    page.get_catalog()
+    page.is_present_now(InventoryPage.FIRST_PRODUCT_PRICE)
+
+    script, find = tracer.events
+    # El script de read_batch no se atribuye a su 'ready_locator'
+    assert (script['command'], script['method'], script['strategy'], script['locator']) == (
+        'executeScript', 'InventoryPage.get_catalog', 'SCRIPT', None)
+    assert (find['method'], find['strategy'], find['locator']) == (
+        'InventoryPage.is_present_now', 'XPATH', InventoryPage.FIRST_PRODUCT_PRICE[1])
+
+    trace = tracer.trace_events("test/x.py::test_a")
+    commands = [event for event in trace if event.get('cat') == 'webdriver']
+    spans = [event['name'] for event in trace if event.get('cat') == 'page-object']
+    assert [event['name'] for event in commands] == ['executeScript', 'findElements']
+    assert spans == ['InventoryPage.get_catalog', 'InventoryPage.is_present_now']
+    assert all(event['ph'] == 'X' and event['dur'] >= 0 for event in commands)
+
+
+def test_tabla_de_latencias_por_locator_y_estrategia():
+    tracer = CommandTracer()
+    for strategy, locator, method, ms in [('XPATH', '//a', 'P.m', 10), ('XPATH', '//a', 'P.m', 20), ('ID', 'x', 'P.n', 2.0), (None, None, None, 5.0)]:
+        tracer._add_stat(strategy, locator, method, ms)
+    other_worker = CommandTracer()
+    for ms in (30, 40):
+        other_worker._add_stat('XPATH', '//a', 'P.m', ms)
+    stats = tracer.latency_stats() + other_worker.latency_stats()
+
+    by_locator = latency_table(stats)
+    assert [row['group'] for row in by_locator] == [('XPATH', '//a'), ('ID', 'x')]
+    assert (by_locator[0]['commands'], by_locator[0]['p50_ms'], by_locator[0]['p95_ms'], by_locator[0]['total_ms']) == (4, 20, 40, 100)
+    assert [row['group'] for row in latency_table(stats, key='strategy')] == [('XPATH', '*'), ('ID', '*')]
+    assert ('', '(fuera de Page Objects)') in [row['group'] for row in latency_table(stats, key='method')]
+
+
+def test_acumulado_acotado_por_locator():
+    """Miles de comandos del mismo locator ocupan unos pocos buckets, no una muestra por comando."""
+    tracer = CommandTracer()
+    for index in range(5000):
+        tracer._add_stat('ID', 'x', 'P.m', 1 + index % 90 / 10)  # 1.0 a 9.9 ms
+    (entry,) = tracer.latency_stats()
+    assert entry[3] == 5000 and len(entry[5]) == 90
+    assert latency_bucket(123.4) == 120.0 and latency_bucket(0.456) == 0.46
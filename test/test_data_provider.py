@@ -0,0 +1,65 @@
+# tests/test_data_provider.py
+import os
+import json
+import pytest
+
+from utils import data_provider
+from utils.data_provider import DataSet, DataFileError, boolean
+
+# ====================================================================
+# --- PROVEEDOR DE DATOS DE PRUEBA ---
+# ====================================================================
+
+
+def test_csv_filtrado_y_tipado():
+    """test_04 toma solo los casos de error de data/users.csv, por nombre de columna."""
+    rows = DataSet("data/users.csv").where(expected_result="Error").rows()
+    assert [row.test_case for row in rows] == ["Login_Bloqueado", "Login_Fallido"]
+    assert rows[0]._fields == ("username", "password", "expected_result", "test_case")
+
+
+def test_jsonl_en_streaming_con_esquema_y_predicado(tmp_path):
+    path = tmp_path / "checkout.jsonl"
+    path.write_text("\n".join(json.dumps({"sku": f"p{i}", "qty": str(i), "gift": "si" if i % 2 else "no"})
+                              for i in range(100_000)))
+    data = DataSet(str(path), schema={"qty": int, "gift": boolean})
+
+    stream = data.where(lambda row: row["qty"] >= 99_998, gift=False).select("sku", "qty").stream()
+    assert next(stream) == ("p99998", 99998)
+    assert list(stream) == []
+
+
+def test_cache_se_invalida_al_cambiar_el_archivo(tmp_path):
+    path = tmp_path / "users.json"
+    path.write_text(json.dumps([{"username": "a"}]))
+    data = DataSet(str(path))
+    first = data.rows()
+    assert data.rows() is first
+
+    path.write_text(json.dumps({"rows": [{"username": "a"}, {"username": "b"}]}))
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+    assert [row.username for row in data.rows()] == ["a", "b"]
+    # La lectura de la versión anterior se descartó de la caché
+    assert len([key for key in data_provider._cache if key[0] == str(path)]) == 1
+
+
+def test_predicados_no_se_cachean(tmp_path):
+    path = tmp_path / "users.json"
+    path.write_text(json.dumps([{"username": "a"}, {"username": "b"}]))
+    data = DataSet(str(path))
+    for _ in range(3):
+        assert [row.username for row in data.where(lambda row: row["username"] == "b").rows()] == ["b"]
+    assert not [key for key in data_provider._cache if key[0] == str(path)]
+
+
+def test_columnas_que_no_son_identificadores(tmp_path):
+    path = tmp_path / "users.csv"
+    path.write_text("first name,class,username\nAna,admin,ana\n")
+    (row,) = DataSet(str(path)).rows()
+    assert row == ("Ana", "admin", "ana") and row.username == "ana"
+    assert row._fields == ("_0", "_1", "username")
+
+
+def test_archivo_faltante_falla_explicitamente():
+    with pytest.raises(DataFileError):
+        DataSet("data/no_existe.csv").rows()
@@ -0,0 +1,101 @@
+# tests/test_driver_pool.py
+from selenium.common.exceptions import WebDriverException
+from urllib3.exceptions import MaxRetryError
+
+from utils.driver_pool import DriverPool
+
+# ====================================================================
+# --- POOL DE WEBDRIVERS (drivers simulados) ---
+# ====================================================================
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self._driver = driver
+
+    def window(self, handle):
+        self._driver.current = handle
+
+
+class FakeDriver:
+    """Registra los comandos de limpieza que el pool envía al navegador."""
+
+    def __init__(self, windows=1, broken=False, dead=False):
+        self.window_handles = [f"w{index}" for index in range(windows)]
+        self.broken = broken
+        self.dead = dead
+        self.current = self.window_handles[0]
+        self.switch_to = FakeSwitchTo(self)
+        self.commands = []
+        self.quit_called = False
+
+    def close(self):
+        self.window_handles.remove(self.current)
+        self.commands.append(('close', self.current))
+
+    def get(self, url):
+        if self.dead:
+            raise MaxRetryError(None, url, "chromedriver no responde")
+        if self.broken:
+            raise WebDriverException("la sesión no responde")
+        self.commands.append(('get', url))
+
+    def delete_all_cookies(self):
+        self.commands.append(('delete_all_cookies',))
+
+    def execute_script(self, script, *args):
+        self.commands.append(('script', script))
+
+    def quit(self):
+        self.quit_called = True
+        if self.dead:
+            raise ConnectionRefusedError("chromedriver no responde")
+
+
+def _pool(**kwargs):
+    created = []
+
+    def factory():
+        created.append(FakeDriver())
+        return created[-1]
+
+    return DriverPool(factory=factory, base_url="http://site.test/", **kwargs), created
+
+
+def test_reutiliza_el_driver_devuelto_y_lo_deja_limpio():
+    pool, created = _pool()
+    driver = pool.acquire()
+    driver.window_handles.append("w1")
+    pool.release(driver)
+
+    assert pool.acquire() is driver and len(created) == 1
+    assert pool.stats() == {'hits': 1, 'misses': 1, 'discarded': 0}
+    assert driver.window_handles == ["w0"] and driver.current == "w0"
+    assert [command[0] for command in driver.commands] == ['close', 'get', 'delete_all_cookies', 'script']
+    assert driver.commands[1] == ('get', "http://site.test/")
+    assert "localStorage.clear()" in driver.commands[-1][1]
+
+
+def test_descarta_drivers_envenenados_rotos_o_de_sobra():
+    pool, _ = _pool(max_idle=1)
+    poisoned, broken, first, extra = FakeDriver(), FakeDriver(broken=True), FakeDriver(), FakeDriver()
+
+    pool.release(poisoned, poisoned=True)
+    pool.release(broken)
+    pool.release(first)
+    pool.release(extra)  # el pool ya tiene max_idle drivers libres
+
+    assert pool.stats()['discarded'] == 3
+    assert poisoned.quit_called and broken.quit_called and extra.quit_called
+    assert not first.quit_called
+
+    pool.close()
+    assert first.quit_called and pool.acquire() is not first
+
+
+def test_descarta_drivers_con_el_chromedriver_muerto():
+    pool, _ = _pool()
+    dead = FakeDriver(dead=True)
+    pool.release(dead)
+    assert pool.stats()['discarded'] == 1 and dead.quit_called
+    assert pool._idle == []
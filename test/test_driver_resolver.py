@@ -0,0 +1,57 @@
+# tests/test_driver_resolver.py
+import os
+
+import pytest
+
+from utils import driver_resolver
+from utils.driver_resolver import DriverSetupError, configure_driver_resolution, resolve_driver_path
+
+# ====================================================================
+# --- RESOLUCIÓN DEL CHROMEDRIVER (sin red) ---
+# ====================================================================
+
+
+@pytest.fixture
+def resolver(monkeypatch):
+    """Configuración de resolución limpia; se restaura la de la sesión al terminar."""
+    monkeypatch.setattr(driver_resolver, '_config', {'driver_path': None, 'cache_dir': None})
+    monkeypatch.setattr(driver_resolver, '_resolved_path', None)
+    monkeypatch.setattr(driver_resolver, '_resolution_error', None)
+    monkeypatch.setattr(driver_resolver, 'STARTUP_TIMINGS', driver_resolver.StartupTimings())
+
+
+def test_ruta_explicita_se_resuelve_una_sola_vez(resolver, tmp_path):
+    binary = tmp_path / "chromedriver"
+    binary.write_bytes(b"")
+    configure_driver_resolution(driver_path=str(binary))
+
+    assert resolve_driver_path() == str(binary)
+    binary.unlink()  # ya resuelta: no se vuelve a verificar
+    assert resolve_driver_path() == str(binary)
+    assert driver_resolver.STARTUP_TIMINGS.resolution is not None
+
+
+def test_cache_local_usa_el_driver_mas_reciente(resolver, tmp_path):
+    for version, mtime in (("114", 1000), ("120", 2000)):
+        binary = tmp_path / version / "chromedriver"
+        binary.parent.mkdir()
+        binary.write_bytes(b"")
+        os.utime(binary, (mtime, mtime))
+    configure_driver_resolution(cache_dir=str(tmp_path))
+    assert resolve_driver_path() == str(tmp_path / "120" / "chromedriver")
+
+
+def test_el_error_se_cachea_para_fallar_rapido(resolver, tmp_path, monkeypatch):
+    configure_driver_resolution(cache_dir=str(tmp_path))
+    with pytest.raises(DriverSetupError, match="caché local"):
+        resolve_driver_path()
+
+    # Aunque aparezca un driver, el error de la sesión se repite sin volver a buscar
+    monkeypatch.setattr(driver_resolver, '_find_in_cache', lambda cache_dir: pytest.fail("no debería buscar otra vez"))
+    with pytest.raises(DriverSetupError):
+        resolve_driver_path()
+
+    # Reconfigurar invalida el error cacheado
+    configure_driver_resolution(driver_path=str(tmp_path / "no-existe"))
+    with pytest.raises(DriverSetupError, match="no existe"):
+        resolve_driver_path()
@@ -0,0 +1,158 @@
+# tests/test_impact.py
+import os
+import sys
+import inspect
+import subprocess
+
+from selenium.common.exceptions import NoSuchElementException
+
+from utils.api_client import ApiClient
+from utils.cart_page import CartPage
+from utils.impact import IMPACT_RECORDER, ImpactRecorder, ImpactMap, changed_symbols, select_tests
+from utils.inventory_page import InventoryPage
+from utils.login_page import LoginPage
+from utils.session import is_session_active, seed_cart
+
+# ====================================================================
+# --- SELECCIÓN POR IMPACTO ---
+# ====================================================================
+
+CHECKOUT = "test/test_saucedemo.py::test_05_checkout_completo"
+LOGIN = "test/test_saucedemo.py::test_01_login_exitoso"
+API = "test/test_api.py::test_01_get_list_resources"
+
+
+def _line_of(cls, text):
+    """Número de línea (en el archivo) de la primera línea de la clase que contiene 'text'."""
+    lines, start = inspect.getsourcelines(cls)
+    return start + next(index for index, line in enumerate(lines) if text in line)
+
+
+def test_registro_de_page_objects_y_locators():
+    recorder = ImpactRecorder()
+    recorder.start()
+    recorder.resume()
+    page = CartPage(driver=None)
+    recorder.note_page(page)
+    recorder.note_locator(CartPage.CHECKOUT_BUTTON)
+    entry = recorder.stop()
+
+    assert "utils/base_page.py" in entry['modules']
+    assert entry['classes'] == ["utils/base_page.py::BasePage", "utils/cart_page.py::CartPage"]
+    assert entry['locators'] == ["utils/cart_page.py::CartPage.CHECKOUT_BUTTON"]
+
+
+class FakeElement:
+    text = "1"
+
+
+class FakeDriver:
+    """Página de inventario simulada: sólo existen el contenedor y el badge del carrito."""
+
+    def find_element(self, by, value):
+        if value not in (LoginPage.INVENTORY_CONTAINER[1], InventoryPage.CART_BADGE[1]):
+            raise NoSuchElementException(value)
+        return FakeElement()
+
+    def find_elements(self, by, value):
+        return [FakeElement()] if value == LoginPage.INVENTORY_CONTAINER[1] else []
+
+    def execute_script(self, script, *args):
+        return None
+
+    def get(self, url):
+        pass
+
+
+def test_locators_de_las_ayudas_de_sesion_y_de_las_condiciones():
+    """is_session_active y seed_cart usan un BasePage genérico y EC.any_of: sus locators igual se registran."""
+    IMPACT_RECORDER.start()
+    IMPACT_RECORDER.resume()
+    try:
+        driver = FakeDriver()
+        assert is_session_active(driver)
+        seed_cart(driver, ["sauce-labs-backpack"], base_url="http://site.test/")
+    finally:
+        entry = IMPACT_RECORDER.stop()
+
+    assert set(entry['locators']) >= {
+        "utils/login_page.py::LoginPage.INVENTORY_CONTAINER",
+        "utils/inventory_page.py::InventoryPage.INVENTORY_CONTAINER",
+        "utils/login_page.py::LoginPage.LOGIN_BUTTON",
+        "utils/inventory_page.py::InventoryPage.CART_BADGE",
+    }
+
+
+def test_seleccion_segun_lo_que_cambio(tmp_path):
+    impact_map = ImpactMap(str(tmp_path / "impact_map.json"))
+    impact_map.update({
+        CHECKOUT: {'modules': ["utils/base_page.py", "utils/cart_page.py"],
+                   'classes': ["utils/base_page.py::BasePage", "utils/cart_page.py::CartPage"],
+                   'locators': ["utils/cart_page.py::CartPage.CHECKOUT_BUTTON"]},
+        LOGIN: {'modules': ["utils/base_page.py", "utils/login_page.py"],
+                'classes': ["utils/base_page.py::BasePage", "utils/login_page.py::LoginPage"],
+                'locators': ["utils/login_page.py::LoginPage.LOGIN_BUTTON"]},
+        API: {'modules': ["utils/api_client.py"], 'classes': [], 'locators': []},
+    })
+    nodeids = [LOGIN, CHECKOUT, API, "test/test_api.py::test_nuevo"]
+
+    # Solo cambió un locator: los tests que lo usaron (y los que el mapa no conoce)
+    locator_line = _line_of(CartPage, "CHECKOUT_BUTTON =")
+    assert changed_symbols("utils/cart_page.py", {locator_line}) == {"utils/cart_page.py::CartPage.CHECKOUT_BUTTON"}
+    selected, _ = select_tests(nodeids, impact_map, {"utils/cart_page.py": {locator_line}})
+    assert selected == [CHECKOUT, "test/test_api.py::test_nuevo"]
+
+    # Archivo sin líneas (o cambio fuera de las clases): todos los que ejecutaron el módulo
+    selected, _ = select_tests(nodeids, impact_map, {"utils/base_page.py": set()})
+    assert selected == [LOGIN, CHECKOUT, "test/test_api.py::test_nuevo"]
+
+    # Un cambio dentro de una clase que no es Page Object (no figura en 'classes')
+    # selecciona los tests que ejecutaron su módulo
+    request_line = _line_of(ApiClient, "def request(")
+    assert changed_symbols("utils/api_client.py", {request_line + 2}) == {"utils/api_client.py::ApiClient"}
+    selected, _ = select_tests(nodeids, impact_map, {"utils/api_client.py": {request_line + 2}})
+    assert selected == [API, "test/test_api.py::test_nuevo"]
+
+    # Un test modificado se ejecuta; la documentación no selecciona nada
+    selected, _ = select_tests(nodeids, impact_map, {"test/test_api.py": set(), "README.md": set()})
+    assert selected == [API, "test/test_api.py::test_nuevo"]
+
+    # Lo que el mapa no modela obliga a la suite completa
+    selected, _ = select_tests(nodeids, impact_map, {"test/conftest.py": set()})
+    assert selected == nodeids
+
+    impact_map.save()
+    assert ImpactMap(impact_map.path).tests == impact_map.tests
+
+
+def _collect(tmp_path, *args):
+    """Node ids que recolecta pytest en un proceso nuevo, con los artefactos en tmp_path."""
+    completed = subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider", "--api-url=inprocess",
+         "--artifact-root", str(tmp_path / "artifacts"), "--durations-file", str(tmp_path / "durations.json"), *args],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        capture_output=True, text=True, check=True,
+    )
+    return [line for line in completed.stdout.splitlines() if "::" in line]
+
+
+def _collect_shard(tmp_path, map_path, shard_index):
+    """Tests que recolecta un shard con selección por impacto."""
+    return _collect(
+        tmp_path, "test/test_api.py", "test/test_api_stub.py",
+        "--impact-map", map_path, "--impact-changed", "utils/api_client.py", "--impact-full-every", "0",
+        "--shard-count", "2", "--shard-index", str(shard_index),
+    )
+
+
+def test_shards_reparten_solo_lo_seleccionado_por_impacto(tmp_path):
+    api_tests, stub_tests = _collect(tmp_path, "test/test_api.py"), _collect(tmp_path, "test/test_api_stub.py")
+    assert api_tests and stub_tests
+    impact_map = ImpactMap(str(tmp_path / "impact_map.json"))
+    impact_map.update({nodeid: {'modules': ["utils/api_client.py"], 'classes': [], 'locators': []} for nodeid in api_tests})
+    impact_map.update({nodeid: {'modules': ["utils/api_stub.py"], 'classes': [], 'locators': []} for nodeid in stub_tests})
+    impact_map.save()
+
+    shards = [_collect_shard(tmp_path, impact_map.path, index) for index in (0, 1)]
+    assert sorted(shards[0] + shards[1]) == sorted(api_tests)
+    assert shards[0] and shards[1]
@@ -0,0 +1,53 @@
+# tests/test_load_runner.py
+import asyncio
+
+import pytest
+
+from utils.api_stub import INPROCESS_BASE_URL, SEED_POSTS, PostsApi, StubConfig
+from utils.load_runner import build_client, check_slo, percentile, run_load
+
+# ====================================================================
+# --- MODO CARGA: CÁLCULOS Y CORRIDA CORTA EN PROCESO ---
+# ====================================================================
+
+
+def test_percentil_por_rango_mas_cercano():
+    values = list(range(1, 101))
+    assert percentile(values, 0.50) == 50
+    assert percentile(values, 0.95) == 95
+    assert percentile([7], 0.99) == 7
+    assert percentile([], 0.5) is None
+
+
+def test_violaciones_de_slo():
+    summary = {
+        'all': {'requests': 10, 'p95_ms': 900.0, 'error_rate': 0.1},
+        'get_post': {'requests': 0, 'p95_ms': None, 'error_rate': 0.0},
+    }
+    slo = {'all': {'p95_ms': 800, 'max_error_rate': 0.2}, 'get_post': {'p95_ms': 1}, 'create_post': {'p95_ms': 1}}
+    # Los escenarios sin requests (o ausentes) no se evalúan
+    assert check_slo(summary, slo) == ["all: p95_ms=900.00 supera el umbral 800"]
+
+    with pytest.raises(ValueError, match="p59_ms"):
+        check_slo(summary, {'all': {'p59_ms': 800}})
+
+
+def test_carga_corta_en_proceso_con_un_cliente_por_hilo():
+    # Un único stub configurado para todos los hilos: misma latencia inyectada y mismo estado
+    stub_api = PostsApi(StubConfig(latency=0.002))
+    created = []
+
+    def client_factory():
+        created.append(build_client(INPROCESS_BASE_URL, stub_api))
+        return created[-1]
+
+    workload = {'get_post': 2, 'create_post': 1, 'update_post': 1}
+    result = asyncio.run(run_load(client_factory, workload, duration_s=0.3, concurrency=3, seed=1))
+    summary = result.summary()
+
+    assert summary['all']['requests'] > 0
+    assert summary['all']['error_rate'] == 0.0, summary['all']['errors']
+    assert 1 <= len(created) <= 3
+    assert sum(len(client.records) for client in created) == summary['all']['requests']
+    assert summary['all']['p50_ms'] >= 2
+    assert stub_api._next_id == SEED_POSTS + 1 + summary['create_post']['requests']
@@ -0,0 +1,65 @@
+# tests/test_local_site.py
+import re
+import pytest
+import urllib.request
+
+from utils.inventory_page import InventoryPage
+from utils.local_server import LocalSiteServer
+from utils.session import CART_STORAGE_KEY, PRODUCT_IDS
+
+# ====================================================================
+# --- RÉPLICA LOCAL DE SAUCE DEMO (sin navegador) ---
+# ====================================================================
+
+# Página -> ids que los Page Objects buscan y que están en el HTML estático
+PAGES = {
+    "": ["user-name", "password", "login-button"],
+    "inventory.html": ["inventory_container"],
+    "cart.html": ["checkout", "continue-shopping"],
+    "checkout-step-one.html": ["first-name", "last-name", "postal-code", "continue"],
+    "checkout-step-two.html": ["finish"],
+    "checkout-complete.html": ["back-to-products"],
+}
+
+# Clases que usan los Page Objects y que sólo existen una vez que app.js renderiza la página
+RENDERED_CLASSES = ["inventory_item", "inventory_item_name", "inventory_item_price", "inventory_item_desc",
+                    "shopping_cart_badge", "cart_item"]
+
+
+@pytest.fixture(scope="module")
+def local_site():
+    with LocalSiteServer() as server:
+        yield server
+
+
+@pytest.mark.parametrize("page,element_ids", PAGES.items(), ids=lambda value: str(value) or "index")
+def test_pagina_servida_con_localizadores(local_site, page, element_ids):
+    """Cada página de la réplica responde 200 y expone los ids usados en utils/."""
+    with urllib.request.urlopen(local_site.base_url + page) as response:
+        assert response.status == 200
+        html = response.read().decode("utf-8")
+
+    for element_id in element_ids:
+        assert f'id="{element_id}"' in html, f"ERROR: Falta el id '{element_id}' en '{page or 'index'}'."
+    assert '<script src="app.js"></script>' in html
+
+
+def test_app_js_renderiza_los_localizadores_dinamicos(local_site):
+    """El inventario, el badge y los ítems del carrito los crea app.js: se verifica su código y su catálogo."""
+    with urllib.request.urlopen(local_site.base_url + "app.js") as response:
+        assert response.status == 200
+        app_js = response.read().decode("utf-8")
+
+    for class_name in RENDERED_CLASSES:
+        assert f'"class": "{class_name}"' in app_js, f"ERROR: app.js no renderiza la clase '{class_name}'."
+
+    # El catálogo de app.js coincide con los ids que precarga utils/session.py
+    catalog = {slug: int(product_id) for product_id, slug in re.findall(r'\{id: (\d+), slug: "([^"]+)"', app_js)}
+    assert catalog == PRODUCT_IDS
+    assert f'CART_KEY = "{CART_STORAGE_KEY}"' in app_js
+
+    # Los ids de los botones y del primer producto se arman a partir del catálogo
+    assert '"add-to-cart-"' in app_js and '"item_" + product.id + "_title_link"' in app_js
+    for locator in (InventoryPage.ADD_TO_CART_BACKPACK, InventoryPage.ADD_TO_CART_BIKE_LIGHT):
+        assert locator[1].startswith("add-to-cart-") and locator[1][len("add-to-cart-"):] in catalog
+    assert InventoryPage.FIRST_PRODUCT_NAME[1] == f"item_{next(iter(catalog.values()))}_title_link"
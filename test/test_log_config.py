@@ -0,0 +1,65 @@
+# tests/test_log_config.py
+import json
+import logging
+import pytest
+
+from utils.log_config import JsonLineFormatter, get_logger, page_logger, parse_levels, set_test_context, timed_step
+
+# ====================================================================
+# --- LOGGING DEL FRAMEWORK ---
+# ====================================================================
+
+
+class FakePage:
+    pass
+
+
+@pytest.fixture
+def records():
+    """Registros de la categoría 'pages' a nivel DEBUG, sin tocar la configuración de la sesión."""
+    logger = get_logger('pages')
+    captured = []
+    handler = logging.Handler()
+    handler.emit = captured.append
+    previous = logger.level
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    yield captured
+    logger.removeHandler(handler)
+    logger.setLevel(previous)
+
+
+def test_niveles_por_categoria():
+    assert parse_levels("pages=debug, api=WARNING") == {'pages': 'DEBUG', 'api': 'WARNING'}
+    assert parse_levels("") == {}
+    with pytest.raises(ValueError):
+        parse_levels("paginas=DEBUG")
+    with pytest.raises(ValueError):
+        parse_levels("pages=MUCHO")
+
+
+def test_registro_jsonl_con_page_object_y_duracion(records):
+    log = page_logger(FakePage())
+    set_test_context("test/x.py::test_a")
+    try:
+        with timed_step(log, "login"):
+            pass
+    finally:
+        set_test_context(None)
+
+    record, = records
+    record.test, record.worker = "test/x.py::test_a", "gw1"
+    data = json.loads(JsonLineFormatter().format(record))
+    assert data['category'] == 'pages' and data['level'] == 'DEBUG'
+    assert (data['page'], data['step'], data['test'], data['worker']) == ('FakePage', 'login', "test/x.py::test_a", "gw1")
+    assert data['duration_ms'] >= 0 and data['message'].startswith("Paso login:")
+
+
+def test_formato_diferido_si_el_nivel_lo_descarta(records):
+    class Costly:
+        def __str__(self):
+            raise AssertionError("No debería formatearse")
+
+    get_logger('pages').setLevel(logging.INFO)
+    page_logger(FakePage()).debug("valor: %s", Costly())
+    assert records == []
@@ -0,0 +1,95 @@
+# tests/test_network.py
+import os
+import sys
+import json
+import subprocess
+import pytest
+
+from utils.base_page import setup_driver, teardown_driver, DriverSetupError
+from utils.local_server import LocalSiteServer
+from utils.network import NETWORK_SETTINGS, build_har, summarize_har, blocked_url_patterns, configure_network
+
+# ====================================================================
+# --- CONTROL DE RED Y HAR ---
+# ====================================================================
+
+
+def _event(method, **params):
+    """Entrada de driver.get_log('performance') con un evento de DevTools."""
+    return {'level': 'INFO', 'timestamp': 0, 'message': json.dumps({'message': {'method': method, 'params': params}})}
+
+
+PERFORMANCE_LOG = [
+    _event('Network.requestWillBeSent', requestId='1', timestamp=100.0, wallTime=1700000000.0, type='Document',
+           request={'url': 'http://127.0.0.1:8000/', 'method': 'GET'}),
+    _event('Page.frameNavigated', frame={}),
+    _event('Network.responseReceived', requestId='1', timestamp=100.05, type='Document', response={
+        'status': 200, 'statusText': 'OK', 'mimeType': 'text/html', 'protocol': 'http/1.1',
+        'timing': {'requestTime': 100.0, 'dnsStart': -1, 'dnsEnd': -1, 'connectStart': 1.0, 'connectEnd': 3.0,
+                   'sslStart': -1, 'sslEnd': -1, 'sendStart': 3.5, 'sendEnd': 4.0, 'receiveHeadersEnd': 40.0},
+    }),
+    _event('Network.loadingFinished', requestId='1', timestamp=100.06, encodedDataLength=2048),
+    _event('Network.requestWillBeSent', requestId='2', timestamp=100.07, wallTime=1700000000.07, type='Image',
+           request={'url': 'http://127.0.0.1:8000/backpack.jpg', 'method': 'GET'}),
+    _event('Network.loadingFailed', requestId='2', timestamp=100.071, errorText='net::ERR_BLOCKED_BY_CLIENT',
+           blockedReason='inspector'),
+]
+
+
+@pytest.fixture
+def network_settings():
+    saved = dict(NETWORK_SETTINGS)
+    yield
+    NETWORK_SETTINGS.update(saved)
+
+
+def test_har_desde_el_log_de_rendimiento():
+    har = build_har(PERFORMANCE_LOG, page_id="test_a")
+    document, image = har['log']['entries']
+
+    assert har['log']['version'] == '1.2' and har['log']['pages'][0]['id'] == "test_a"
+    assert (document['response']['status'], document['response']['_transferSize'], document['time']) == (200, 2048, 60.0)
+    assert document['timings'] == {'blocked': 1.0, 'dns': -1, 'connect': 2.0, 'ssl': -1,
+                                   'send': 0.5, 'wait': 36.0, 'receive': 20.0}
+    assert (image['_resourceType'], image['_blocked'], image['response']['status']) == ('Image', 'inspector', 0)
+
+    summary = summarize_har(har)
+    assert (summary['requests'], summary['blocked'], summary['failed'], summary['bytes']) == (2, 1, 0, 2048)
+    assert summary['by_type'] == {'Document': 1, 'Image': 1}
+
+
+def test_patrones_de_bloqueo(network_settings):
+    configure_network(block_patterns=["*analytics*"], block_types=["font"])
+    assert blocked_url_patterns()[0] == "*analytics*" and "*.woff2" in blocked_url_patterns()
+    with pytest.raises(ValueError):
+        configure_network(block_types=["video"])
+
+
+def test_tipos_invalidos_del_entorno_fallan_al_importar():
+    completed = subprocess.run(
+        [sys.executable, "-c", "import utils.network"],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env=dict(os.environ, NETWORK_BLOCK_TYPES="image,video"),
+        capture_output=True, text=True,
+    )
+    assert completed.returncode != 0
+    assert "Tipos de recurso desconocidos: ['video']" in completed.stderr
+
+
+def test_bloqueo_y_har_contra_la_replica_local(network_settings):
+    """Con Chrome disponible: la hoja de estilos se bloquea y queda registrada en el HAR."""
+    configure_network(block_patterns=[], block_types=["stylesheet"], har=True)
+    with LocalSiteServer() as server:
+        try:
+            driver = setup_driver()
+        except DriverSetupError as e:
+            pytest.skip(f"No hay navegador disponible: {e}")
+        try:
+            driver.get(server.base_url)
+            har = build_har(driver.get_log('performance'))
+        finally:
+            teardown_driver(driver)
+
+    entries = {entry['request']['url'].rsplit('/', 1)[-1]: entry for entry in har['log']['entries']}
+    assert entries[''].get('_blocked') is None and entries['']['response']['status'] == 200
+    assert entries['style.css']['_blocked']
@@ -0,0 +1,63 @@
+# tests/test_page_timing.py
+import pytest
+
+from utils.page_timing import PageTimings, MARK_SCRIPT, configure_page_timing, step_name
+
+# ====================================================================
+# --- TIEMPOS DE CARGA POR TRANSICIÓN (driver simulado) ---
+# ====================================================================
+
+
+class FakeDriver:
+    """Responde a los scripts de marca y lectura con los valores de un navegador."""
+
+    def __init__(self, url, time_origin):
+        self.url = url
+        self.time_origin = time_origin
+        self.transition = None
+        self.navigation = {'ttfb': 40.0, 'dom_interactive': 150.0, 'dom_content_loaded': 180.0,
+                           'load': 0, 'transfer_size': 2048}
+
+    def execute_script(self, script, *args):
+        if script == MARK_SCRIPT:
+            self.transition = {'start': 1000.0, 'end': None}
+            return {'url': self.url, 'time_origin': self.time_origin, 'start': 1000.0}
+        return {'url': self.url, 'time_origin': self.time_origin, 'transition': self.transition,
+                'navigation': self.navigation, 'paint': {'first-contentful-paint': 210.0}}
+
+
+@pytest.fixture
+def timings():
+    configure_page_timing(True)
+    yield PageTimings()
+    configure_page_timing(False)
+
+
+def test_nombre_del_paso_por_url():
+    assert step_name("https://www.saucedemo.com/") == "login"
+    assert step_name("https://www.saucedemo.com/checkout-step-two.html") == "checkout-step-two"
+
+
+def test_navegacion_y_cambio_de_ruta(timings):
+    driver = FakeDriver("https://www.saucedemo.com/", time_origin=1_000_000.0)
+
+    # Documento nuevo: Navigation Timing del documento cargado
+    timings.mark(driver)
+    driver.url, driver.time_origin, driver.transition = "https://www.saucedemo.com/cart.html", 1_002_000.0, None
+    record = timings.collect(driver)
+    assert record['kind'] == 'navigation' and record['step'] == 'cart'
+    assert record['transition_ms'] == 1180.0 and record['load_ms'] is None
+    assert record['first_contentful_paint_ms'] == 210.0
+
+    # Misma URL: la transición queda pendiente
+    timings.mark(driver)
+    assert timings.collect(driver) is None
+
+    # Cambio de ruta de la SPA en el mismo documento
+    driver.url = "https://www.saucedemo.com/checkout-step-one.html"
+    driver.transition['end'] = 1085.0
+    assert timings.collect(driver)['transition_ms'] == 85.0
+
+    timings.assert_budget("checkout-step-one", transition_ms=100)
+    with pytest.raises(AssertionError, match="Presupuesto superado"):
+        timings.assert_budget("cart", dom_content_loaded_ms=100)
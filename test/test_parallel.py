@@ -0,0 +1,22 @@
+# tests/test_parallel.py
+import os
+
+from utils import parallel
+from utils.parallel import artifact_dir, worker_id
+
+# ====================================================================
+# --- EJECUCIÓN EN PARALELO (artefactos por worker) ---
+# ====================================================================
+
+
+def test_directorio_por_worker(monkeypatch, tmp_path):
+    monkeypatch.setattr(parallel, 'REPORTS_DIR', str(tmp_path))
+
+    monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+    assert worker_id() == "main"
+    assert artifact_dir("traces") == os.path.join(str(tmp_path), "traces", "main")
+
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+    assert worker_id() == "gw3"
+    path = artifact_dir("traces")
+    assert path == os.path.join(str(tmp_path), "traces", "gw3") and os.path.isdir(path)
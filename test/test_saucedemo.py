@@ -1,21 +1,25 @@
 import pytest
-import logging
 
 # Importar funciones y clases auxiliares
-from utils.base_page import get_csv_data 
+from utils.data_provider import DataSet
 from utils.login_page import LoginPage
 from utils.inventory_page import InventoryPage
 from utils.cart_page import CartPage
 from utils.checkout_page import CheckoutPage
+from utils.session import seed_cart
+from utils.log_config import get_logger
 
-# Usar el logger configurado en base_page
-logger = logging.getLogger(__name__)
+# Logger de la categoría 'tests' (configurada una sola vez en conftest)
+logger = get_logger('tests')
+
+# Credenciales de prueba (columnas: username, password, expected_result, test_case)
+USERS = DataSet("data/users.csv")
 
 # ====================================================================
 # --- TEST SUITE: SAUCE DEMO UI TESTING ---
 # ====================================================================
 
-def test_01_login_exitoso(driver, login_setup):
+def test_01_login_exitoso(driver, login_setup, base_url):
     """
     CONSIGNA: Validar el login con el usuario 'standard_user' y verificar la URL.
     """
@@ -30,22 +34,16 @@ def test_01_login_exitoso(driver, login_setup):
     assert login_page.wait_for_inventory_page(), "ERROR: La página de inventario no cargó después del login."
     
     # 2. Validación final de la URL
-    assert driver.current_url == "https://www.saucedemo.com/inventory.html", "ERROR: La URL no es la esperada después del login."
+    assert driver.current_url == base_url + "inventory.html", "ERROR: La URL no es la esperada después del login."
     logger.info("Login Exitoso completado. URL validada.")
 
 
-def test_02_verificacion_catalogo(driver, login_setup):
+def test_02_verificacion_catalogo(authenticated_driver):
     """
     CONSIGNA: Verificar la presencia de elementos UI y obtener detalles del primer producto.
     """
-    driver = login_setup
-
-    # Login
-    login_page = LoginPage(driver)
-    login_page.login("standard_user", "secret_sauce")
-    
-    # CORRECCIÓN CRÍTICA: Esperar la carga del inventario antes de proceder
-    login_page.wait_for_inventory_page()
+    # La sesión ya viene establecida por la fixture (el login se prueba en test_01 y test_04)
+    driver = authenticated_driver
 
     inventory_page = InventoryPage(driver)
 
@@ -57,20 +55,20 @@ def test_02_verificacion_catalogo(driver, login_setup):
 
     assert primer_producto['nombre'] == "Sauce Labs Backpack", "ERROR: El nombre del primer producto no coincide."
     assert primer_producto['precio'] == "$29.99", "ERROR: El precio del primer producto no coincide."
+
+    # 3. Validar el catálogo completo con una sola lectura del navegador
+    catalogo = inventory_page.get_catalog()
+    assert len(catalogo) == 6, f"ERROR: Se esperaban 6 productos en el catálogo, se obtuvieron {len(catalogo)}."
+    assert all(producto['name'] and producto['price'].startswith("$") for producto in catalogo), "ERROR: Hay productos sin nombre o precio."
     
-    logger.info(f"Catálogo verificado. Primer producto: {primer_producto['nombre']} - {primer_producto['precio']}")
+    logger.info("Catálogo verificado. Primer producto: %s - %s", primer_producto['nombre'], primer_producto['precio'])
 
 
-def test_03_agregar_y_verificar_carrito(driver, login_setup):
+def test_03_agregar_y_verificar_carrito(authenticated_driver):
     """
     CONSIGNA: Añadir dos productos y verificar el badge del carrito y su contenido.
     """
-    driver = login_setup
-
-    # Login
-    login_page = LoginPage(driver)
-    login_page.login("standard_user", "secret_sauce")
-    login_page.wait_for_inventory_page()
+    driver = authenticated_driver
 
     inventory_page = InventoryPage(driver)
 
@@ -93,7 +91,7 @@ def test_03_agregar_y_verificar_carrito(driver, login_setup):
 
 @pytest.mark.parametrize(
     "username,password,expected_result,test_case",
-    get_csv_data("data/users.csv")[1:] # Salta el primer registro, toma los de error
+    USERS.where(expected_result="Error").rows() # Solo los casos de error
 )
 def test_04_login_fallido_y_bloqueado(login_setup, username, password, expected_result, test_case):
     """
@@ -101,7 +99,7 @@ def test_04_login_fallido_y_bloqueado(login_setup, username, password, expected_
     """
     driver = login_setup
 
-    logger.info(f"Iniciando prueba de Login Fallido para caso: {test_case}")
+    logger.info("Iniciando prueba de Login Fallido para caso: %s", test_case)
     login_page = LoginPage(driver)
     login_page.login(username, password)
 
@@ -114,22 +112,17 @@ def test_04_login_fallido_y_bloqueado(login_setup, username, password, expected_
     elif test_case == "Login_Fallido":
         assert "Epic sadface: Username and password do not match any user in this service" in error_message
     
-    logger.info(f"Caso {test_case} validado. Mensaje de error correcto: {error_message[:40]}...")
+    logger.info("Caso %s validado. Mensaje de error correcto: %.40s...", test_case, error_message)
 
 
-def test_05_checkout_completo(driver, login_setup):
+def test_05_checkout_completo(authenticated_driver):
     """
     CONSIGNA FINAL: Automatizar el flujo completo de compra (añadir, checkout, finalizar).
     """
-    driver = login_setup
+    driver = authenticated_driver
 
-    # --- 1. Preparación: Login y Añadir Productos ---
-    logger.info("Iniciando flujo de Checkout completo: Login y añadir items.")
-    login_page = LoginPage(driver)
-    login_page.login("standard_user", "secret_sauce")
-
-    # CORRECCIÓN CRÍTICA: Esperar la carga del inventario
-    login_page.wait_for_inventory_page() 
+    # --- 1. Preparación: Añadir Productos (la sesión ya viene establecida) ---
+    logger.info("Iniciando flujo de Checkout completo: añadir items.")
 
     inventory_page = InventoryPage(driver)
     inventory_page.add_two_items_to_cart()
@@ -152,4 +145,56 @@ def test_05_checkout_completo(driver, login_setup):
     success_message = checkout_page.get_success_message()
     assert success_message == "Thank you for your order!", "ERROR: Mensaje de confirmación incorrecto."
     
-    logger.info("Checkout completo validado exitosamente.")
\ No newline at end of file
+    logger.info("Checkout completo validado exitosamente.")
+
+
+def test_06_checkout_con_carrito_precargado(authenticated_driver):
+    """
+    Checkout partiendo de un carrito precargado en el navegador: arranca en
+    cart.html sin recorrer el inventario.
+    """
+    driver = authenticated_driver
+
+    seed_cart(driver, ["sauce-labs-backpack", "sauce-labs-bike-light"])
+
+    cart_page = CartPage(driver)
+    assert cart_page.get_cart_item_count() == 2, "ERROR: El carrito precargado no muestra 2 items."
+    cart_page.click_checkout()
+
+    checkout_page = CheckoutPage(driver)
+    checkout_page.enter_user_info("Ezequiel", "Cañete", "1600")
+    checkout_page.finish_checkout()
+
+    assert checkout_page.get_success_message() == "Thank you for your order!", "ERROR: Mensaje de confirmación incorrecto."
+    logger.info("Checkout desde carrito precargado validado.")
+
+
+def test_07_presupuestos_de_carga_del_flujo_de_compra(page_timings, login_setup):
+    """
+    Recorre login -> inventario -> carrito -> checkout (paso 1, paso 2, completo)
+    y verifica el tiempo de cada transición medido en el navegador.
+    Se ejecuta con --page-timing.
+    """
+    driver = login_setup
+
+    login_page = LoginPage(driver)
+    login_page.login("standard_user", "secret_sauce")
+    assert login_page.wait_for_inventory_page(), "ERROR: La página de inventario no cargó después del login."
+
+    inventory_page = InventoryPage(driver)
+    inventory_page.add_two_items_to_cart()
+    inventory_page.go_to_cart()
+
+    cart_page = CartPage(driver)
+    assert cart_page.get_cart_item_count() == 2, "ERROR: El carrito no muestra 2 items."
+    cart_page.click_checkout()
+
+    checkout_page = CheckoutPage(driver)
+    checkout_page.enter_user_info("Ezequiel", "Cañete", "1600")
+    checkout_page.finish_checkout()
+    assert checkout_page.get_success_message() == "Thank you for your order!", "ERROR: Mensaje de confirmación incorrecto."
+
+    page_timings.assert_budget("login", dom_content_loaded_ms=3000)
+    for step in ("inventory", "cart", "checkout-step-one", "checkout-step-two", "checkout-complete"):
+        page_timings.assert_budget(step, transition_ms=3000)
+    logger.info("Tiempos por transición: %s", [(r['step'], r['transition_ms']) for r in page_timings.test_records])
@@ -0,0 +1,29 @@
+# tests/test_scheduler.py
+from utils.scheduler import DurationHistory, plan_shards, DEFAULT_ESTIMATE_S
+
+# ====================================================================
+# --- PLANIFICACIÓN POR DURACIÓN ---
+# ====================================================================
+
+
+def test_estimacion_para_tests_nuevos(tmp_path):
+    history = DurationHistory(str(tmp_path / "durations.json"))
+    assert history.estimate("test/test_ui.py::test_a") == DEFAULT_ESTIMATE_S
+
+    history.update({"test/test_ui.py::test_login[a]": 4.0, "test/test_ui.py::test_cart": 8.0,
+                    "test/test_api.py::test_get": 0.1})
+    history.save()
+    history = DurationHistory(history.path)
+    assert history.estimate("test/test_ui.py::test_login[b]") == 4.0     # otra parametrización
+    assert history.estimate("test/test_ui.py::test_nuevo") == 6.0        # mediana del módulo
+    assert history.estimate("test/test_otro.py::test_x") == 4.0          # mediana global
+
+    history.update({"test/test_ui.py::test_cart": 4.0})
+    assert history.estimate("test/test_ui.py::test_cart") == 6.0         # promedio móvil
+
+
+def test_reparto_lpt_equilibra_los_shards():
+    durations = {"a": 7, "b": 5, "c": 4, "d": 3, "e": 3, "f": 2}
+    plan = plan_shards(list(durations), 2, durations.get)
+    assert sorted(shard['predicted_s'] for shard in plan) == [12, 12]
+    assert sorted(test for shard in plan for test in shard['tests']) == sorted(durations)
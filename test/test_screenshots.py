@@ -0,0 +1,32 @@
+# tests/test_screenshots.py
+import os
+
+from utils import screenshots
+from utils.artifact_store import ArtifactStore
+from utils.screenshots import ScreenshotWriter
+
+# ====================================================================
+# --- ESCRITOR DE CAPTURAS EN SEGUNDO PLANO ---
+# ====================================================================
+
+# PNG de 1x1 píxel
+PIXEL_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000154a24f5d0000000049454e44ae426082"
+)
+
+
+def test_escritor_guarda_las_capturas_al_hacer_flush(tmp_path):
+    """submit() retorna las rutas de inmediato, flush() deja los archivos escritos y
+    las capturas idénticas se guardan una sola vez."""
+    store = ArtifactStore(root=str(tmp_path / "reports" / "artifacts"), base_dir=str(tmp_path))
+    writer = ScreenshotWriter(store)
+    jobs = [writer.submit(PIXEL_PNG) for _ in range(3)]
+    writer.flush()
+
+    assert writer.stats['written'] == 1 and writer.stats['deduplicated'] == 2
+    assert len({job.path for job in jobs}) == 1
+    with open(tmp_path / jobs[0].path, 'rb') as file:
+        assert file.read() == PIXEL_PNG
+    if screenshots.Image is not None:
+        assert os.path.exists(tmp_path / jobs[0].thumbnail)
@@ -0,0 +1,134 @@
+# tests/test_session.py
+import json
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+
+from utils.inventory_page import InventoryPage
+from utils.login_page import LoginPage
+from utils.session import CART_STORAGE_KEY, SESSION_COOKIE, authenticate, is_session_active, seed_cart
+from utils.ui_settings import FORM_SETTINGS
+
+# ====================================================================
+# --- SESIÓN POR COOKIE (driver simulado) ---
+# ====================================================================
+
+
+class FakeElement:
+    def __init__(self, text="", driver=None, value=None):
+        self.text = text
+        self.driver = driver
+        self.value = value
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+    def send_keys(self, text):
+        self.driver.typed.append((self.value, text))
+
+    def click(self):
+        self.driver.click(self.value)
+
+
+class FakeDriver:
+    """Sitio simulado: 'present' son los ids que existen en la página actual."""
+
+    def __init__(self, present=(), texts=None):
+        self.present = set(present)
+        self.texts = texts or {}
+        self.cookies = []
+        self.visited = []
+        self.scripts = []
+        self.typed = []
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+    def delete_cookie(self, name):
+        self.cookies = [cookie for cookie in self.cookies if cookie['name'] != name]
+
+    def click(self, value):
+        pass
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def find_element(self, by, value):
+        if value not in self.present:
+            raise NoSuchElementException(value)
+        return FakeElement(self.texts.get(value, ""), self, value)
+
+    def execute_script(self, script, *args):
+        self.scripts.append(args)
+
+    def find_elements(self, by, value):
+        return [FakeElement()] if value in self.present else []
+
+
+def test_sesion_por_cookie():
+    driver = FakeDriver(present={LoginPage.INVENTORY_CONTAINER[1]})
+    assert authenticate(driver, "standard_user", "secret_sauce", base_url="http://site.test/") == 'cookie'
+    assert driver.cookies == [{"name": SESSION_COOKIE, "value": "standard_user", "path": "/"}]
+    assert driver.visited == ["http://site.test/inventory.html"]
+
+
+LOGIN_FORM = {LoginPage.USERNAME_INPUT[1], LoginPage.PASSWORD_INPUT[1], LoginPage.LOGIN_BUTTON[1]}
+
+
+class CookieRejectingDriver(FakeDriver):
+    """Sitio que ignora la cookie (siempre redirige al login) y acepta el login por UI."""
+
+    def get(self, url):
+        super().get(url)
+        self.present = set(LOGIN_FORM)
+
+    def click(self, value):
+        if value == LoginPage.LOGIN_BUTTON[1] and self.typed == [("user-name", "standard_user"), ("password", "secret_sauce")]:
+            self.present = {LoginPage.INVENTORY_CONTAINER[1]}
+
+
+def test_cookie_rechazada_vuelve_al_login(monkeypatch):
+    # El sitio redirigió al login: la sesión no está activa y se decide sin agotar el timeout
+    assert is_session_active(FakeDriver(present={LoginPage.LOGIN_BUTTON[1]})) is False
+
+    # authenticate() recurre al login por UI y deja el navegador en el inventario
+    monkeypatch.setitem(FORM_SETTINGS, 'mode', 'keys')
+    driver = CookieRejectingDriver()
+    assert authenticate(driver, "standard_user", "secret_sauce", base_url="http://site.test/") == 'ui'
+    assert driver.cookies == []
+    assert driver.visited == ["http://site.test/inventory.html", "http://site.test/"]
+    assert driver.present == {LoginPage.INVENTORY_CONTAINER[1]}
+
+# ====================================================================
+# --- PRECARGA DEL CARRITO ---
+# ====================================================================
+
+
+def test_seed_cart_escribe_el_storage_y_verifica_el_badge():
+    badge = InventoryPage.CART_BADGE[1]
+    driver = FakeDriver(present={badge}, texts={badge: "2"})
+    assert seed_cart(driver, ["sauce-labs-backpack", "sauce-labs-onesie"], base_url="http://site.test/") == "2"
+    assert driver.scripts == [(CART_STORAGE_KEY, json.dumps([4, 2]))]
+    assert driver.visited == ["http://site.test/cart.html"]
+
+    # La aplicación no reconoció el carrito: el badge no coincide
+    driver = FakeDriver(present={badge}, texts={badge: "1"})
+    with pytest.raises(AssertionError, match="no fue reconocido"):
+        seed_cart(driver, ["sauce-labs-backpack", "sauce-labs-onesie"], base_url="http://site.test/")
+
+
+def test_seed_cart_rechaza_productos_desconocidos_sin_tocar_el_navegador():
+    driver = FakeDriver()
+    with pytest.raises(ValueError, match="mochila"):
+        seed_cart(driver, ["sauce-labs-backpack", "mochila"])
+    assert driver.scripts == [] and driver.visited == []
+
+
+def test_seed_cart_vacio_limpia_el_carrito_sin_esperar_el_badge():
+    driver = FakeDriver()
+    assert seed_cart(driver, [], base_url="http://site.test/") == ""
+    assert driver.scripts == [(CART_STORAGE_KEY,)]
+    assert driver.visited == ["http://site.test/cart.html"]
@@ -0,0 +1,56 @@
+# tests/test_startup.py
+import os
+import sys
+import subprocess
+
+import pytest
+
+from utils.startup_report import check_budget, load_budget, measure_startup, package_times, parse_importtime
+
+# ====================================================================
+# --- ARRANQUE DE PYTEST (importaciones y colección) ---
+# ====================================================================
+
+IMPORTTIME_SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:      1200 |       1200 |     selenium.common
+import time:      3000 |       4200 |   selenium.webdriver
+import time:       500 |       4700 | selenium
+import time:       800 |        800 | utils.ui_settings
+"""
+
+
+def test_tiempos_por_paquete_y_presupuesto():
+    entries = parse_importtime(IMPORTTIME_SAMPLE)
+    assert [entry['module'] for entry in entries] == ['selenium.common', 'selenium.webdriver', 'selenium', 'utils.ui_settings']
+    assert [entry['depth'] for entry in entries] == [2, 1, 0, 0]
+    assert package_times(entries) == {'selenium': 4.7, 'utils': 0.8}
+
+    result = {'total_ms': 900.0, 'import_ms': 5.5, 'collection_ms': 40.0, 'packages': package_times(entries)}
+    violations = check_budget(result, {'max_total_ms': 1000, 'max_collection_ms': 30, 'forbidden_modules': ['selenium']})
+    assert violations == ["colección: 40 ms (presupuesto 30 ms)", "módulos no permitidos cargados: selenium"]
+
+
+def test_ejecucion_solo_de_api_no_carga_selenium():
+    """Recolectar solo los tests de API en un proceso nuevo no importa los módulos de navegador."""
+    scenario = load_budget()['scenarios']['api_only']
+    result = measure_startup(scenario['args'])
+    assert result['tests'] > 0
+    assert result['browser_modules'] == [], f"Se cargaron módulos de navegador: {result['browser_modules']}"
+    assert 'utils.base_page' not in {entry['module'] for entry in result['modules']}
+
+
+@pytest.mark.parametrize("variable,value,message", [
+    ("BROWSER_PROFILE", "rapido", "Perfil de navegador desconocido: rapido"),
+    ("FORM_FILL_MODE", "turbo", "Modo de llenado desconocido: turbo"),
+])
+def test_valores_invalidos_del_entorno_son_errores_de_uso(variable, value, message):
+    """Un valor inválido en el entorno se informa como error de uso de pytest, sin traceback."""
+    completed = subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider", "test/test_parallel.py"],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env=dict(os.environ, **{variable: value}),
+        capture_output=True, text=True,
+    )
+    assert completed.returncode == 4  # pytest.ExitCode.USAGE_ERROR
+    assert f"ERROR: {message}" in completed.stderr and "INTERNALERROR" not in completed.stderr
@@ -0,0 +1,138 @@
+# utils/api_client.py
+
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utils.log_config import get_logger
+
+logger = get_logger('api')
+
+# ====================================================================
+# --- CLIENTE DE API CON POOL DE CONEXIONES Y MÉTRICAS ---
+# ====================================================================
+
+DEFAULT_TIMEOUT = 10
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF = 0.3
+RETRY_STATUSES = (429, 502, 503, 504)
+
+
+class ApiClient:
+    """
+    Cliente HTTP sobre una requests.Session compartida: reutiliza conexiones
+    (keep-alive), aplica timeouts y reintentos con backoff, y registra por
+    cada request la latencia, el status, el tamaño del payload y si abrió
+    una conexión nueva.
+
+    requests no expone los tiempos de DNS ni de conexión; 'ttfb_ms' es el
+    tiempo hasta recibir los headers (response.elapsed) y 'total_ms' incluye
+    la descarga del cuerpo.
+    """
+
+    def __init__(self, base_url, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES,
+                 backoff=DEFAULT_BACKOFF, pool_maxsize=10):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.session = requests.Session()
+
+        # urllib3 solo reintenta los métodos idempotentes (GET, PUT, DELETE, ...):
+        # reintentar un POST puede crear recursos duplicados. Ver request(retry_unsafe=True).
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=RETRY_STATUSES,
+            raise_on_status=False,
+        )
+        self.adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry)
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+
+        # Todos los requests de la sesión y los del test en curso
+        self.records = []
+        self.test_records = []
+
+    # --- Requests ---
+
+    def request(self, method, path, retry_unsafe=False, **kwargs):
+        """
+        Envía un request a base_url + path y registra sus métricas.
+        Con retry_unsafe=True también se reintentan ante 429/502/503/504 los
+        métodos no idempotentes (POST, PATCH): solo si el llamador sabe que
+        repetir el request no duplica nada.
+        """
+        url = path if path.startswith("http") else f"{self.base_url}{path}"
+        kwargs.setdefault("timeout", self.timeout)
+
+        connections_before = self._open_connections()
+        start = time.perf_counter()
+        response = self.session.request(method, url, **kwargs)
+        if retry_unsafe and method.upper() not in Retry.DEFAULT_ALLOWED_METHODS:
+            for attempt in range(self.retries):
+                if response.status_code not in RETRY_STATUSES:
+                    break
+                time.sleep(self.backoff * 2 ** attempt)
+                response = self.session.request(method, url, **kwargs)
+        total = time.perf_counter() - start
+
+        record = {
+            "method": method,
+            "url": url,
+            "status": response.status_code,
+            "ttfb_ms": round(response.elapsed.total_seconds() * 1000, 2),
+            "total_ms": round(total * 1000, 2),
+            "bytes": len(response.content),
+            "new_connection": self._open_connections() > connections_before,
+        }
+        self.records.append(record)
+        self.test_records.append(record)
+        logger.debug("%s %s -> %s en %s ms", method, url, response.status_code, record['total_ms'])
+        return response
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path, **kwargs):
+        return self.request("PUT", path, **kwargs)
+
+    def patch(self, path, **kwargs):
+        return self.request("PATCH", path, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+    # --- Métricas ---
+
+    def begin_test(self):
+        """Reinicia los registros del test en curso."""
+        self.test_records = []
+
+    def stats(self):
+        """Resumen de la sesión: requests, conexiones nuevas y latencias."""
+        if not self.records:
+            return {"requests": 0}
+        totals = sorted(record["total_ms"] for record in self.records)
+        new_connections = sum(record["new_connection"] for record in self.records)
+        return {
+            "requests": len(self.records),
+            "new_connections": new_connections,
+            "reuse_ratio": 1 - new_connections / len(self.records),
+            "mean_ms": sum(totals) / len(totals),
+            "max_ms": totals[-1],
+            "bytes": sum(record["bytes"] for record in self.records),
+        }
+
+    def close(self):
+        self.session.close()
+
+    def _open_connections(self):
+        """Cantidad de conexiones abiertas hasta ahora por los pools de urllib3."""
+        pools = self.adapter.poolmanager.pools
+        return sum(pools[key].num_connections for key in pools.keys())
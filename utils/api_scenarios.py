@@ -0,0 +1,91 @@
+# utils/api_scenarios.py
+
+# ====================================================================
+# --- ESCENARIOS DE API COMPARTIDOS (tests funcionales y modo carga) ---
+# ====================================================================
+
+# Cada escenario define el request y las validaciones de su respuesta.
+# test/test_api.py y utils/load_runner.py usan exactamente las mismas
+# aserciones, así una regresión detectada bajo carga es la misma que fallaría
+# en la prueba funcional.
+
+
+class ApiScenario:
+    """Request de un escenario de API y la validación de su respuesta."""
+
+    def __init__(self, name, method, path, validate, payload=None):
+        self.name = name
+        self.method = method
+        self.path = path
+        self.payload = payload
+        self._validate = validate
+
+    def send(self, client):
+        """Envía el request con cualquier cliente con la interfaz de requests (get/post/...)."""
+        kwargs = {"json": self.payload} if self.payload is not None else {}
+        return getattr(client, self.method.lower())(self.path, **kwargs)
+
+    def validate(self, response):
+        """Lanza AssertionError si la respuesta no es la esperada; retorna el JSON."""
+        return self._validate(self, response)
+
+
+def _validate_get(scenario, response):
+    # 1. Validar el Status Code (200 OK)
+    assert response.status_code == 200, f"Error: Se esperaba Status 200, se obtuvo {response.status_code}"
+
+    # 2. Validar el formato de la respuesta
+    assert 'application/json' in response.headers.get('Content-Type'), "Error: El Content-Type no es JSON"
+
+    # 3. Validar el contenido
+    data = response.json()
+    resource_id = int(scenario.path.rsplit('/', 1)[-1])
+    assert data['id'] == resource_id, "Error: El ID del post no coincide"
+    assert 'title' in data, "Error: Falta el campo 'title'"
+    return data
+
+
+def _validate_post(scenario, response):
+    # 1. Validar el Status Code (201 Created)
+    assert response.status_code == 201, f"Error: Se esperaba Status 201, se obtuvo {response.status_code}"
+
+    # 2. Validar la respuesta JSON
+    response_data = response.json()
+    assert response_data['title'] == scenario.payload['title'], "Error: El título devuelto no coincide"
+    assert response_data['userId'] == scenario.payload['userId'], "Error: El userId devuelto no coincide"
+    assert 'id' in response_data, "Error: La respuesta no contiene un ID generado"
+    return response_data
+
+
+def _validate_put(scenario, response):
+    # 1. Validar el Status Code (200 OK)
+    assert response.status_code == 200, f"Error: Se esperaba Status 200, se obtuvo {response.status_code}"
+
+    # 2. Validar la respuesta JSON
+    response_data = response.json()
+    assert response_data['title'] == scenario.payload['title'], "Error: El título no se actualizó correctamente"
+    return response_data
+
+
+GET_POST = ApiScenario("get_post", "GET", "/posts/1", _validate_get)
+
+CREATE_POST = ApiScenario(
+    "create_post", "POST", "/posts", _validate_post,
+    payload={
+        "title": "Prueba de Integración Final",
+        "body": "Contenido del post creado por Ezequiel",
+        "userId": 1
+    },
+)
+
+UPDATE_POST = ApiScenario(
+    "update_post", "PUT", "/posts/1", _validate_put,
+    payload={
+        "id": 1,
+        "title": "Titulo Actualizado por PUT",
+        "body": "El cuerpo ha sido modificado en la prueba PUT",
+        "userId": 1
+    },
+)
+
+SCENARIOS = {scenario.name: scenario for scenario in (GET_POST, CREATE_POST, UPDATE_POST)}
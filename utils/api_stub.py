@@ -0,0 +1,263 @@
+# utils/api_stub.py
+
+import io
+import json
+import time
+import random
+import threading
+from urllib.parse import urlsplit, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from requests.adapters import BaseAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+from utils.log_config import get_logger
+
+logger = get_logger('api')
+
+# ====================================================================
+# --- STUB LOCAL DE JSONPLACEHOLDER (/posts) ---
+# ====================================================================
+
+SEED_POSTS = 100
+
+
+class StubConfig:
+    """
+    Comportamiento inyectable del stub:
+    - latency: segundos de demora por request, o una tupla (mínimo, máximo).
+    - error_rate: probabilidad (0 a 1) de responder 500 en lugar del resultado.
+    - payload_size: bytes de relleno agregados a cada post devuelto.
+    """
+
+    def __init__(self, latency=0.0, error_rate=0.0, payload_size=0, seed=None):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.payload_size = payload_size
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def delay(self):
+        if isinstance(self.latency, (tuple, list)):
+            with self._lock:
+                return self._random.uniform(*self.latency)
+        return self.latency
+
+    def should_fail(self):
+        if not self.error_rate:
+            return False
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+
+class PostsApi:
+    """
+    Lógica CRUD de /posts, independiente del transporte (servidor HTTP o
+    adaptador de requests). Imita las respuestas de JSONPlaceholder.
+    """
+
+    def __init__(self, config=None):
+        self.config = config or StubConfig()
+        self._lock = threading.Lock()
+        self._posts = {
+            post_id: {
+                "userId": (post_id - 1) // 10 + 1,
+                "id": post_id,
+                "title": f"post {post_id}",
+                "body": f"contenido del post {post_id}",
+            }
+            for post_id in range(1, SEED_POSTS + 1)
+        }
+        self._next_id = SEED_POSTS + 1
+
+    def handle(self, method, url, body=None):
+        """
+        Procesa un request y retorna (status, payload). 'body' son los bytes
+        del cuerpo (JSON) o None.
+        """
+        delay = self.config.delay()
+        if delay:
+            time.sleep(delay)
+        if self.config.should_fail():
+            return 500, {"error": "Error inyectado por el stub"}
+
+        parts = urlsplit(url)
+        segments = [segment for segment in parts.path.split('/') if segment]
+        if not segments or segments[0] != "posts" or len(segments) > 2:
+            return 404, {}
+
+        try:
+            data = json.loads(body) if body else {}
+        except ValueError:
+            return 400, {"error": "JSON inválido"}
+
+        if len(segments) == 1:
+            if method == "GET":
+                return 200, self._list(parse_qs(parts.query))
+            if method == "POST":
+                return 201, self._create(data)
+            return 404, {}
+
+        try:
+            post_id = int(segments[1])
+        except ValueError:
+            return 404, {}
+        if method == "GET":
+            return self._found(self._posts.get(post_id))
+        if method == "PUT":
+            return self._update(post_id, data, replace=True)
+        if method == "PATCH":
+            return self._update(post_id, data, replace=False)
+        if method == "DELETE":
+            with self._lock:
+                self._posts.pop(post_id, None)
+            return 200, {}
+        return 404, {}
+
+    # --- Operaciones ---
+
+    def _list(self, query):
+        with self._lock:
+            posts = list(self._posts.values())
+        if "userId" in query:
+            user_ids = {int(user_id) for user_id in query["userId"]}
+            posts = [post for post in posts if post["userId"] in user_ids]
+        return [self._padded(post) for post in posts]
+
+    def _create(self, data):
+        with self._lock:
+            post = dict(data, id=self._next_id)
+            self._posts[self._next_id] = post
+            self._next_id += 1
+        return self._padded(post)
+
+    def _update(self, post_id, data, replace):
+        with self._lock:
+            current = self._posts.get(post_id)
+            if current is None:
+                return 404, {}
+            post = dict(data) if replace else dict(current, **data)
+            post["id"] = post_id
+            self._posts[post_id] = post
+        return 200, self._padded(post)
+
+    def _found(self, post):
+        if post is None:
+            return 404, {}
+        return 200, self._padded(post)
+
+    def _padded(self, post):
+        if not self.config.payload_size:
+            return dict(post)
+        return dict(post, padding="x" * self.config.payload_size)
+
+
+# ====================================================================
+# --- TRANSPORTE 1: SERVIDOR HTTP EN PUERTO EFÍMERO ---
+# ====================================================================
+
+class _ApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Con keep-alive, headers y cuerpo salen en dos escrituras: sin TCP_NODELAY,
+    # Nagle + ACK diferido suman ~40 ms a cada request
+    disable_nagle_algorithm = True
+    api = None
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else None
+        status, payload = self.api.handle(self.command, self.path, body)
+        encoded = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ApiStubServer:
+    """Levanta el stub de /posts en 127.0.0.1 sobre un puerto efímero."""
+
+    def __init__(self, config=None, host="127.0.0.1", port=0):
+        self.api = PostsApi(config)
+        handler = type("ApiHandler", (_ApiHandler,), {"api": self.api})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="api-stub", daemon=True)
+        self._thread.start()
+        logger.info("Stub de JSONPlaceholder disponible en %s", self.base_url)
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+# ====================================================================
+# --- TRANSPORTE 2: ADAPTADOR EN PROCESO PARA requests ---
+# ====================================================================
+
+INPROCESS_BASE_URL = "http://jsonplaceholder.stub"
+
+
+class StubAdapter(BaseAdapter):
+    """Adaptador de requests que resuelve los requests en memoria, sin sockets."""
+
+    def __init__(self, api):
+        super().__init__()
+        self.api = api
+
+    def send(self, request, **kwargs):
+        body = request.body.encode("utf-8") if isinstance(request.body, str) else request.body
+        status, payload = self.api.handle(request.method, request.url, body)
+        encoded = json.dumps(payload).encode("utf-8")
+
+        response = Response()
+        response.status_code = status
+        response.reason = "OK" if status < 400 else "Error"
+        response.headers = CaseInsensitiveDict({
+            "Content-Type": "application/json; charset=utf-8",
+            "Content-Length": str(len(encoded)),
+        })
+        response.raw = io.BytesIO(encoded)
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        pass
+
+
+def mount_stub(session, config=None, base_url=INPROCESS_BASE_URL, api=None):
+    """
+    Monta el stub como adaptador de transporte en una requests.Session. Con
+    'api' se monta ese PostsApi (varias sesiones comparten estado y config).
+    Retorna el PostsApi para poder inspeccionar o ajustar su estado.
+    """
+    api = api or PostsApi(config)
+    session.mount(base_url, StubAdapter(api))
+    return api
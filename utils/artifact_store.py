@@ -0,0 +1,236 @@
+# utils/artifact_store.py
+
+import os
+import re
+import json
+import time
+import hashlib
+import threading
+
+from utils.log_config import get_logger
+from utils.parallel import REPORTS_DIR, worker_id
+
+logger = get_logger('artifacts')
+
+# ====================================================================
+# --- ALMACÉN DE ARTEFACTOS DIRECCIONADO POR CONTENIDO ---
+# ====================================================================
+
+# reports/artifacts/objects/<2 primeros hex>/<sha256>.<ext>  -> contenido único
+# reports/artifacts/runs/<run_id>_<worker>.json              -> manifiesto test -> artefactos
+ARTIFACTS_DIR = os.path.join(REPORTS_DIR, 'artifacts')
+
+# Archivos por ejecución escritos con artifact_dir(kind): reports/<kind>/<worker>/<nombre>_<run_id>.<ext>
+RUN_FILE_KINDS = ('traces', 'har', 'logs', 'timings')
+RUN_FILE_PATTERN = re.compile(r'_(\d{8}-\d{6}(?:-[0-9a-f]{6})?)\.\w+$')
+
+RETENTION_SETTINGS = {
+    'max_age_days': float(os.environ.get("ARTIFACT_MAX_AGE_DAYS", 14)),
+    'max_runs': int(os.environ.get("ARTIFACT_MAX_RUNS", 20)),
+    'max_mb': float(os.environ.get("ARTIFACT_MAX_MB", 500)),
+}
+
+
+def new_run_id():
+    """
+    Identificador de la ejecución (compartido por todos los workers de xdist).
+    El sufijo aleatorio distingue ejecuciones lanzadas en el mismo segundo.
+    """
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{os.urandom(3).hex()}"
+
+
+class ArtifactStore:
+    """
+    Guarda cada artefacto una sola vez, nombrado por el hash SHA-256 de su
+    contenido: el mismo fallo repetido no vuelve a ocupar disco. Cada
+    ejecución escribe un manifiesto que asocia cada test con sus artefactos,
+    y apply_retention() borra manifiestos viejos, los objetos que ya nadie
+    referencia y los archivos por ejecución (trazas, HAR, logs JSONL y
+    tiempos de página) de las ejecuciones descartadas.
+    """
+
+    def __init__(self, root=ARTIFACTS_DIR, run_id=None, base_dir=os.path.dirname(REPORTS_DIR)):
+        # Las rutas de los manifiestos y del reporte son relativas a base_dir (la raíz del proyecto)
+        self.base_dir = base_dir
+        self.set_root(root)
+        self.run_id = run_id or new_run_id()
+        self.entries = {}
+        self.stats = {'stored': 0, 'deduplicated': 0}
+        self._lock = threading.Lock()
+
+    def set_root(self, root):
+        """Ubica el almacén en 'root' (por ejemplo, un directorio temporal en los tests)."""
+        self.root = root
+        self.objects_dir = os.path.join(root, 'objects')
+        self.runs_dir = os.path.join(root, 'runs')
+        # Los directorios de RUN_FILE_KINDS son hermanos del almacén (reports/)
+        self.reports_dir = os.path.dirname(root)
+
+    # --- Objetos ---
+
+    def object_path(self, digest, extension, suffix=''):
+        """Ruta absoluta del objeto con ese hash (la extensión sólo ayuda al navegador)."""
+        return os.path.join(self.objects_dir, digest[:2], f"{digest}{suffix}.{extension}")
+
+    def locate(self, data, extension):
+        """Retorna (digest, ruta, ya_existe) para el contenido dado, sin escribirlo."""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.object_path(digest, extension)
+        return digest, path, os.path.exists(path)
+
+    def write(self, path, data):
+        """Escribe el objeto de forma atómica (dos workers pueden guardar el mismo contenido)."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, 'wb') as file:
+            file.write(data)
+        os.replace(temporary, path)
+
+    def put(self, data, extension):
+        """Guarda el contenido si todavía no existe. Retorna la ruta relativa a la raíz del proyecto."""
+        digest, path, exists = self.locate(data, extension)
+        if exists:
+            self.stats['deduplicated'] += 1
+        else:
+            self.write(path, data)
+            self.stats['stored'] += 1
+        return self.relative(path)
+
+    def relative(self, path):
+        """Ruta relativa a la raíz del proyecto, como la usa el reporte HTML."""
+        return os.path.relpath(path, self.base_dir).replace(os.path.sep, '/')
+
+    # --- Manifiesto ---
+
+    def record(self, test, kind, path):
+        """Asocia un artefacto (ruta relativa) con el test que lo produjo."""
+        with self._lock:
+            self.entries.setdefault(test, []).append({'kind': kind, 'path': path})
+
+    def write_manifest(self):
+        """Escribe el manifiesto de este proceso; retorna su ruta o None si no hubo artefactos."""
+        if not self.entries:
+            return None
+        os.makedirs(self.runs_dir, exist_ok=True)
+        path = os.path.join(self.runs_dir, f"{self.run_id}_{worker_id()}.json")
+        manifest = {
+            'run_id': self.run_id,
+            'worker': worker_id(),
+            'created': time.time(),
+            'artifacts': self.entries,
+        }
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(manifest, file, indent=2)
+        return path
+
+    def _manifests(self):
+        """Lista de (ruta, manifiesto) de todas las ejecuciones guardadas."""
+        if not os.path.isdir(self.runs_dir):
+            return []
+        manifests = []
+        for name in os.listdir(self.runs_dir):
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(self.runs_dir, name)
+            try:
+                with open(path, 'r', encoding='utf-8') as file:
+                    manifests.append((path, json.load(file)))
+            except (OSError, ValueError) as e:
+                logger.warning("Manifiesto ilegible %s: %s", path, e)
+        return manifests
+
+    def _objects(self):
+        """Diccionario ruta relativa -> bytes de todos los objetos guardados."""
+        sizes = {}
+        for directory, _, names in os.walk(self.objects_dir):
+            for name in names:
+                path = os.path.join(directory, name)
+                sizes[self.relative(path)] = os.path.getsize(path)
+        return sizes
+
+    def _run_files(self):
+        """Diccionario run_id -> [(ruta absoluta, bytes)] de los archivos por ejecución."""
+        files = {}
+        for kind in RUN_FILE_KINDS:
+            for directory, _, names in os.walk(os.path.join(self.reports_dir, kind)):
+                for name in names:
+                    match = RUN_FILE_PATTERN.search(name)
+                    if match:
+                        path = os.path.join(directory, name)
+                        files.setdefault(match.group(1), []).append((path, os.path.getsize(path)))
+        return files
+
+    # --- Retención ---
+
+    def apply_retention(self, max_age_days=None, max_runs=None, max_mb=None, now=None):
+        """
+        Aplica las políticas de retención (None desactiva cada una):
+        1. Borra los manifiestos de más de 'max_age_days' días.
+        2. Conserva sólo las 'max_runs' ejecuciones más recientes.
+        3. Borra los objetos que ningún manifiesto restante referencia.
+        4. Si los objetos y los archivos por ejecución superan 'max_mb', descarta
+           las ejecuciones más viejas (conservando al menos la última) hasta
+           entrar en el presupuesto.
+        Las ejecuciones descartadas pierden también sus archivos por ejecución
+        (trazas, HAR, logs y tiempos), aunque no hayan guardado artefactos.
+        Retorna un resumen con las ejecuciones y los bytes liberados.
+        """
+        now = now or time.time()
+        runs = {}
+
+        def run_entry(run_id):
+            return runs.setdefault(run_id, {'created': 0, 'paths': [], 'objects': set(), 'files': []})
+
+        for path, manifest in self._manifests():
+            run = run_entry(manifest.get('run_id'))
+            # La antigüedad se toma de la fecha de modificación de los archivos de la ejecución
+            run['created'] = max(run['created'], os.path.getmtime(path))
+            run['paths'].append(path)
+            for artifacts in manifest.get('artifacts', {}).values():
+                run['objects'].update(artifact['path'] for artifact in artifacts)
+        for run_id, files in self._run_files().items():
+            run = run_entry(run_id)
+            run['created'] = max([run['created']] + [os.path.getmtime(path) for path, _ in files])
+            run['files'] = files
+        ordered = sorted(runs, key=lambda run_id: runs[run_id]['created'], reverse=True)
+
+        keep = [
+            run_id for run_id in ordered
+            if max_age_days is None or now - runs[run_id]['created'] <= max_age_days * 86400
+        ]
+        if max_runs is not None:
+            keep = keep[:max_runs]
+
+        sizes = self._objects()
+        if max_mb is not None:
+            budget = max_mb * 1024 * 1024
+            while len(keep) > 1:
+                referenced = set().union(*(runs[run_id]['objects'] for run_id in keep))
+                used = sum(size for path, size in sizes.items() if path in referenced)
+                used += sum(size for run_id in keep for _, size in runs[run_id]['files'])
+                if used <= budget:
+                    break
+                keep.pop()
+
+        removed_runs = [run_id for run_id in ordered if run_id not in keep]
+        freed = 0
+        for run_id in removed_runs:
+            for path in runs[run_id]['paths']:
+                os.remove(path)
+            for path, size in runs[run_id]['files']:
+                os.remove(path)
+                freed += size
+
+        referenced = set().union(*(runs[run_id]['objects'] for run_id in keep)) if keep else set()
+        for path, size in sizes.items():
+            if path not in referenced:
+                os.remove(os.path.join(self.base_dir, path))
+                freed += size
+
+        if removed_runs or freed:
+            logger.info("Retención de artefactos: %d ejecuciones y %.0f KB eliminados", len(removed_runs), freed / 1024)
+        return {'removed_runs': removed_runs, 'freed_bytes': freed, 'kept_runs': len(keep)}
+
+
+# Un único almacén por proceso; el run_id lo fija conftest (igual en todos los workers)
+ARTIFACT_STORE = ArtifactStore()
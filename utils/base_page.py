@@ -1,95 +1,182 @@
 # utils/base_page.py
 
-import os
-import csv
 import time
 import logging
 
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import WebDriverException, TimeoutException
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import WebDriverException, TimeoutException, StaleElementReferenceException
 
-# Configuración básica de logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+from utils.browser_profiles import BROWSER_PROFILES, build_chrome_options, get_active_profile
+from utils.impact import IMPACT_RECORDER
+from utils.log_config import get_logger, page_logger
+from utils.network import apply_network_control, configure_options
+from utils.page_timing import PAGE_TIMINGS
+from utils.screenshots import SCREENSHOT_SETTINGS, SCREENSHOT_WRITER, capture_png
+from utils.driver_resolver import resolve_driver_path, DriverSetupError, STARTUP_TIMINGS
+from utils.ui_settings import (
+    BASE_URL, set_base_url, get_base_url, WAIT_SETTINGS, configure_waits,
+    FORM_FILL_MODES, FORM_SETTINGS, configure_form_fill,
+    ELEMENT_CACHE_SETTINGS, ELEMENT_CACHE_STATS, configure_element_cache,
+)
+
+# Los logs se configuran una sola vez desde conftest (ver utils/log_config.py)
+logger = get_logger('driver')
 
 # ====================================================================
 # --- FUNCIONES AUXILIARES DE DRIVER (Setup/Teardown) ---
 # ====================================================================
 
-def setup_driver():
+def setup_driver(profile=None):
     """
-    Inicializa y configura el WebDriver de Chrome utilizando WebDriver Manager
-    para asegurar la compatibilidad con el navegador instalado.
+    Inicializa y configura el WebDriver de Chrome. La ruta del chromedriver se
+    resuelve una sola vez por sesión (ver utils/driver_resolver.py).
+    'profile' selecciona un perfil de utils/browser_profiles.py; por defecto
+    se usa el perfil activo de la sesión.
+    Lanza DriverSetupError si el driver no se puede iniciar.
     """
+    profile = profile or get_active_profile()
+    # 1. Obtener la ruta del driver (cacheada tras la primera resolución)
+    service = ChromeService(resolve_driver_path())
+
     try:
-        # Configuración de opciones (ej. maximizar, ignorar errores)
-        options = webdriver.ChromeOptions()
-        options.add_argument('--start-maximized')
-        options.add_argument('--ignore-certificate-errors')
-        
-        # 1. Instalar y obtener el servicio del driver (si es necesario)
-        service = ChromeService(ChromeDriverManager().install())
+        # Configuración de opciones según el perfil (headless, estrategia de carga, etc.)
+        # y, si se pidió HAR, el log de rendimiento de Chrome
+        options = configure_options(build_chrome_options(profile))
         
         # 2. Inicializar el WebDriver
+        start = time.perf_counter()
         driver = webdriver.Chrome(service=service, options=options)
+        STARTUP_TIMINGS.launches.append(time.perf_counter() - start)
         
         # Configuración de espera implícita global
-        driver.implicitly_wait(10)
+        driver.implicitly_wait(BROWSER_PROFILES[profile]['implicit_wait'])
+
+        # Bloqueo de URLs y throttling vía DevTools (ver utils/network.py)
+        apply_network_control(driver)
         
-        logging.info("WebDriver de Chrome inicializado correctamente.")
+        logger.info("WebDriver de Chrome inicializado correctamente (perfil: %s).", profile)
         return driver
         
     except WebDriverException as e:
         # Esto captura errores comunes como la falta de conexión o problemas con la versión del driver
-        logging.critical(f"No se pudo inicializar el WebDriver: {e}")
-        # Se asegura de que el test falle correctamente si no hay driver
-        return None 
-    except Exception as e:
-        # Captura cualquier otro error inesperado
-        logging.critical(f"Ocurrió un error inesperado durante el setup del driver: {e}")
-        return None
+        logger.critical("No se pudo inicializar el WebDriver: %s", e)
+        raise DriverSetupError(f"No se pudo inicializar el WebDriver: {e.msg}") from e
 
 
 def teardown_driver(driver):
     """Cierra el navegador y finaliza la sesión del WebDriver."""
     if driver:
         driver.quit()
-        logging.info("WebDriver cerrado.")
+        logger.info("WebDriver cerrado.")
 
 
 # ====================================================================
-# --- FUNCIÓN AUXILIAR PARA LECTURA DE DATOS (CSV) ---
+# --- MOTOR DE ESPERAS ---
 # ====================================================================
 
-def get_csv_data(csv_file_name):
+# Los valores por defecto de las esperas y del llenado de formularios están en
+# utils/ui_settings.py (conftest los configura sin importar Selenium).
+FILL_FORM_SCRIPT = """
+    var fields = arguments[0], submit = arguments[1];
+    var find = function (locator) {
+        var by = locator[0], value = locator[1];
+        if (by === 'id') { return document.getElementById(value); }
+        if (by === 'css selector') { return document.querySelector(value); }
+        if (by === 'name') { return document.getElementsByName(value)[0] || null; }
+        if (by === 'class name') { return document.getElementsByClassName(value)[0] || null; }
+        if (by === 'tag name') { return document.getElementsByTagName(value)[0] || null; }
+        if (by === 'xpath') {
+            return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        }
+        throw new Error('Estrategia no soportada en fill_form: ' + by);
+    };
+    var elements = [];
+    for (var i = 0; i < fields.length; i++) {
+        var element = find(fields[i][0]);
+        if (!element) { return fields[i][0]; }
+        elements.push(element);
+    }
+    var submitElement = submit ? find(submit) : null;
+    if (submit && !submitElement) { return submit; }
+    for (var j = 0; j < elements.length; j++) {
+        // Se usa el setter nativo para que frameworks como React registren el cambio
+        var proto = Object.getPrototypeOf(elements[j]);
+        var setter = Object.getOwnPropertyDescriptor(proto, 'value').set;
+        setter.call(elements[j], fields[j][1]);
+        elements[j].dispatchEvent(new Event('input', {bubbles: true}));
+        elements[j].dispatchEvent(new Event('change', {bubbles: true}));
+    }
+    if (submitElement) { submitElement.click(); }
+    return null;
+"""
+
+
+class WaitBudgetExceeded(TimeoutException):
+    """Se agotó el presupuesto de espera del test."""
+
+
+class WaitBudget:
     """
-    Lee datos desde un archivo CSV.
-    Retorna una lista de tuplas donde cada tupla es una fila de datos.
+    Presupuesto de tiempo total que un test puede pasar esperando elementos.
+    Una vez agotado, cualquier espera falla de inmediato.
     """
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    # Construye la ruta al archivo CSV: utils/../data/users.csv
-    absolute_path = os.path.join(base_dir, '..', csv_file_name)
-    
-    test_data = []
-    try:
-        with open(absolute_path, 'r', newline='', encoding='utf-8') as file:
-            reader = csv.reader(file)
-            next(reader)  # Saltar la fila de encabezados
-            for row in reader:
-                test_data.append(tuple(row))
-        logging.info(f"Datos cargados exitosamente desde {csv_file_name}. Total de filas: {len(test_data)}")
-    except FileNotFoundError:
-        logging.error(f"Archivo no encontrado en: {absolute_path}")
-        # Devuelve una lista vacía para que la parametrización falle limpiamente
-        test_data.append(('', '', 'Error', 'Data_File_Missing')) 
-    except Exception as e:
-        logging.error(f"Error al leer el archivo CSV: {e}")
-        test_data.append(('', '', 'Error', 'CSV_Read_Error'))
-        
-    return test_data
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.spent = 0.0
+
+    def remaining(self):
+        return max(self.seconds - self.spent, 0.0)
+
+    def consume(self, elapsed):
+        self.spent += elapsed
+
+
+_active_budget = None
+
+
+def start_wait_budget(seconds):
+    """Inicia el presupuesto de espera del test actual (0 o None lo desactiva)."""
+    global _active_budget
+    _active_budget = WaitBudget(seconds) if seconds else None
+    return _active_budget
+
+
+def clear_wait_budget():
+    global _active_budget
+    _active_budget = None
+
+
+# ====================================================================
+# --- CACHÉ DE ELEMENTOS (opcional) ---
+# ====================================================================
+
+class CachedElement(WebElement):
+    """
+    WebElement guardado en la caché de una página. Si un comando falla con
+    StaleElementReferenceException (la página se re-renderizó o cambió de URL),
+    invalida la caché, vuelve a buscar el elemento por su locator y reintenta.
+    """
+
+    def __init__(self, page, locator, element):
+        super().__init__(element.parent, element.id)
+        self._page = page
+        self._locator = locator
+
+    def _execute(self, command, params=None):
+        try:
+            return super()._execute(command, dict(params or {}))
+        except StaleElementReferenceException:
+            ELEMENT_CACHE_STATS['stale_refreshes'] += 1
+            self._page.invalidate_cache()
+            fresh = self._page._wait_until(EC.presence_of_element_located(self._locator))
+            self._id = fresh.id
+            self._page._element_cache[self._locator] = (self, 'present')
+            return super()._execute(command, dict(params or {}))
 
 
 # ====================================================================
@@ -102,63 +189,221 @@ class BasePage:
     los Page Objects.
     """
     
-    def __init__(self, driver):
+    def __init__(self, driver, timeout=None, cache_elements=None):
         self.driver = driver
-        # Tiempo de espera explícita por defecto
-        self.wait = WebDriverWait(driver, 15) 
-        
+        # Tiempo de espera explícita por defecto (configurable por página o por llamada)
+        self.timeout = timeout if timeout is not None else WAIT_SETTINGS['timeout']
+
+        # Caché opcional de elementos por locator: se invalida en clics/envíos que
+        # pueden navegar y ante StaleElementReferenceException (ver CachedElement)
+        self.cache_elements = ELEMENT_CACHE_SETTINGS['enabled'] if cache_elements is None else cache_elements
+        self._element_cache = {}
+        # Logger de la categoría 'pages' con el nombre del Page Object en cada registro
+        self.log = page_logger(self)
+        IMPACT_RECORDER.note_page(self)
+
+    # --- Caché de Elementos ---
+
+    def _from_cache(self, by_locator, visible=False):
+        """Retorna el elemento cacheado (si se pide visible, solo si se cacheó visible)."""
+        if not self.cache_elements:
+            return None
+        entry = self._element_cache.get(by_locator)
+        if entry is not None and (entry[1] == 'visible' or not visible):
+            ELEMENT_CACHE_STATS['hits'] += 1
+            return entry[0]
+        ELEMENT_CACHE_STATS['misses'] += 1
+        return None
+
+    def _to_cache(self, by_locator, element, level):
+        if not self.cache_elements:
+            return element
+        cached = CachedElement(self, by_locator, element)
+        self._element_cache[by_locator] = (cached, level)
+        return cached
+
+    def invalidate_cache(self):
+        """Descarta los elementos cacheados (por ejemplo, tras una navegación)."""
+        if self._element_cache:
+            ELEMENT_CACHE_STATS['invalidations'] += 1
+            self._element_cache.clear()
+
+    # --- Motor de Esperas ---
+
+    def _wait_until(self, condition, timeout=None):
+        """
+        Ejecuta una espera explícita respetando el timeout por llamada y el
+        presupuesto de espera del test. Lanza WaitBudgetExceeded si el
+        presupuesto se agotó.
+        """
+        IMPACT_RECORDER.note_condition(condition)
+        timeout = self.timeout if timeout is None else timeout
+        budget = _active_budget
+        capped = False
+        if budget is not None:
+            if budget.remaining() <= 0:
+                raise WaitBudgetExceeded(f"Presupuesto de espera agotado ({budget.seconds}s).")
+            if budget.remaining() < timeout:
+                timeout, capped = budget.remaining(), True
+
+        start = time.perf_counter()
+        try:
+            result = WebDriverWait(
+                self.driver, timeout, poll_frequency=WAIT_SETTINGS['poll_frequency']
+            ).until(condition)
+            # La primera espera cumplida tras una transición marca la página como lista
+            PAGE_TIMINGS.collect(self.driver)
+            return result
+        except TimeoutException:
+            if capped:
+                raise WaitBudgetExceeded(f"Presupuesto de espera agotado ({budget.seconds}s).")
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            if budget is not None:
+                budget.consume(elapsed)
+            if self.log.isEnabledFor(logging.DEBUG):
+                duration_ms = round(elapsed * 1000, 1)
+                self.log.debug("Espera de %.1f ms", duration_ms, extra={'step': 'wait', 'duration_ms': duration_ms})
+
     # --- Métodos de Espera y Búsqueda ---
         
-    def find_element(self, by_locator):
+    def find_element(self, by_locator, timeout=None):
         """Busca y retorna un elemento esperando a que esté presente."""
+        IMPACT_RECORDER.note_locator(by_locator)
+        cached = self._from_cache(by_locator)
+        if cached is not None:
+            return cached
         try:
-            return self.wait.until(EC.presence_of_element_located(by_locator))
+            element = self._wait_until(EC.presence_of_element_located(by_locator), timeout)
+            return self._to_cache(by_locator, element, 'present')
         except TimeoutException:
-            logging.error(f"Tiempo de espera agotado buscando el elemento: {by_locator}")
+            self.log.error("Tiempo de espera agotado buscando el elemento: %s", by_locator)
             raise
         
-    def wait_for_visibility(self, by_locator):
+    def wait_for_visibility(self, by_locator, timeout=None):
         """Espera a que un elemento esté visible antes de retornarlo."""
+        IMPACT_RECORDER.note_locator(by_locator)
+        cached = self._from_cache(by_locator, visible=True)
+        if cached is not None:
+            return cached
         try:
-            return self.wait.until(EC.visibility_of_element_located(by_locator))
+            element = self._wait_until(EC.visibility_of_element_located(by_locator), timeout)
+            return self._to_cache(by_locator, element, 'visible')
         except TimeoutException:
-            logging.error(f"Tiempo de espera agotado esperando visibilidad del elemento: {by_locator}")
+            self.log.error("Tiempo de espera agotado esperando visibilidad del elemento: %s", by_locator)
             raise
 
-    def click_element(self, by_locator):
+    def click_element(self, by_locator, timeout=None):
         """Espera a que un elemento sea clickeable y luego hace clic."""
+        IMPACT_RECORDER.note_locator(by_locator)
         try:
-            element = self.wait.until(EC.element_to_be_clickable(by_locator))
+            element = self._wait_until(EC.element_to_be_clickable(by_locator), timeout)
+            PAGE_TIMINGS.mark(self.driver)
             element.click()
+            # El clic puede navegar o re-renderizar la página
+            self.invalidate_cache()
         except TimeoutException:
-            logging.error(f"Tiempo de espera agotado esperando que el elemento sea clickeable: {by_locator}")
+            self.log.error("Tiempo de espera agotado esperando que el elemento sea clickeable: %s", by_locator)
+            raise
+
+    def is_present_now(self, by_locator):
+        """Indica si el elemento está en el DOM en este momento, sin esperar."""
+        IMPACT_RECORDER.note_locator(by_locator)
+        return len(self.driver.find_elements(*by_locator)) > 0
+
+    def assert_present_now(self, by_locator):
+        """Retorna el elemento si está presente ahora mismo; si no, falla sin esperar."""
+        IMPACT_RECORDER.note_locator(by_locator)
+        elements = self.driver.find_elements(*by_locator)
+        assert elements, f"El elemento {by_locator} no está presente."
+        return elements[0]
+
+    def assert_absent(self, by_locator, timeout=None):
+        """
+        Verifica que el elemento no esté presente (o no sea visible), esperando
+        como máximo un timeout corto para que desaparezca.
+        """
+        IMPACT_RECORDER.note_locator(by_locator)
+        if timeout is None:
+            timeout = WAIT_SETTINGS['absent_timeout']
+        try:
+            self._wait_until(EC.invisibility_of_element_located(by_locator), timeout)
+        except WaitBudgetExceeded:
             raise
+        except TimeoutException:
+            raise AssertionError(f"El elemento {by_locator} sigue presente tras {timeout}s.")
     
+    # --- Formularios ---
+
+    def fill_form(self, values, submit=None, mode=None):
+        """
+        Completa un formulario a partir de {locator: valor} y, si se indica,
+        hace clic en 'submit'.
+        - mode='keys': busca cada campo y tipea con send_keys (fiel al usuario).
+        - mode='fast': asigna todos los valores y hace el clic en una sola llamada
+          al navegador, disparando los eventos input/change que escucha la app.
+        Por defecto se usa el modo configurado para la sesión.
+        """
+        mode = mode or FORM_SETTINGS['mode']
+        for locator in (*values, *([submit] if submit else [])):
+            IMPACT_RECORDER.note_locator(locator)
+        if mode == 'fast':
+            fields = [[list(locator), value] for locator, value in values.items()]
+            submit_locator = list(submit) if submit else None
+            if submit:
+                PAGE_TIMINGS.mark(self.driver)
+            missing = self.driver.execute_script(FILL_FORM_SCRIPT, fields, submit_locator)
+            if missing is not None:
+                # La página aún no terminó de cargar: se espera al campo faltante y se reintenta
+                self.find_element(tuple(missing))
+                missing = self.driver.execute_script(FILL_FORM_SCRIPT, fields, submit_locator)
+            assert missing is None, f"No se encontró el elemento del formulario: {missing}"
+            if submit:
+                self.invalidate_cache()
+            return
+
+        for locator, value in values.items():
+            self.find_element(locator).send_keys(value)
+        if submit:
+            self.click_element(submit)
+
+    # --- Lecturas en lote ---
+
+    def read_batch(self, script, ready_locator, *args):
+        """
+        Ejecuta un script de extracción que retorna null si la página todavía no
+        está lista. En el caso normal cuesta un único round trip; si retorna null,
+        espera a 'ready_locator' y lo ejecuta una vez más.
+        """
+        IMPACT_RECORDER.note_locator(ready_locator)
+        result = self.driver.execute_script(script, *args)
+        if result is None:
+            self.find_element(ready_locator)
+            result = self.driver.execute_script(script, *args)
+        PAGE_TIMINGS.collect(self.driver)
+        return result
+
     # --- Método de Captura de Pantalla (Requisito de Reporte) ---
 
-    def take_screenshot(self, test_name):
+    def take_screenshot(self, test_name, mode=None, locator=None):
         """
-        Toma una captura de pantalla y la guarda en la carpeta reports/.
-        Retorna la ruta relativa del archivo guardado.
+        Captura la pantalla en memoria y la encola en el escritor de fondo, que
+        la guarda en el almacén reports/artifacts/ junto con una miniatura.
+        'mode' es 'viewport', 'full' o 'element' (este último requiere 'locator').
+        Retorna el ScreenshotJob con las rutas relativas (desde la raíz del
+        proyecto) de la imagen y la miniatura, o None si falló la captura.
         """
         if not self.driver:
-            logging.error("No se puede tomar captura: el driver es None.")
+            self.log.error("No se puede tomar captura: el driver es None.")
             return None
-            
-        reports_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'reports')
-        
-        # Asegura que el directorio 'reports' exista
-        if not os.path.exists(reports_dir):
-            os.makedirs(reports_dir)
-            
-        timestamp = time.strftime("%Y%m%d-%H%M%S")
-        filename = f"{test_name}_{timestamp}.png"
-        screenshot_path = os.path.join(reports_dir, filename)
-        
+
+        mode = mode or SCREENSHOT_SETTINGS['mode']
         try:
-            self.driver.save_screenshot(screenshot_path)
-            # Devuelve la ruta relativa para adjuntar al reporte HTML
-            return os.path.join('reports', filename) 
+            element = self.driver.find_element(*locator) if mode == 'element' and locator else None
+            png = capture_png(self.driver, mode, element)
         except Exception as e:
-            logging.error(f"Fallo al tomar captura de pantalla para {test_name}: {e}")
-            return None
\ No newline at end of file
+            self.log.error("Fallo al tomar captura de pantalla para %s: %s", test_name, e)
+            return None
+        # La escritura a disco (y la miniatura) ocurre fuera del camino crítico del test
+        return SCREENSHOT_WRITER.submit(png)
\ No newline at end of file
@@ -0,0 +1,355 @@
+# utils/benchmarks.py
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+
+from selenium.webdriver.common.by import By
+
+from utils.base_page import setup_driver, teardown_driver, BasePage, DriverSetupError
+from utils.data_provider import DataSet
+from utils.log_config import get_logger
+from utils.session import authenticate
+from utils.inventory_page import InventoryPage
+from utils.cart_page import CartPage
+from utils.checkout_page import CheckoutPage
+from utils.local_server import LocalSiteServer
+from utils.artifact_store import ArtifactStore
+from utils.screenshots import ScreenshotWriter, capture_png
+from utils.load_runner import percentile
+
+logger = get_logger('timing')
+
+# ====================================================================
+# --- BENCHMARKS DEL PROPIO FRAMEWORK (con baseline versionado) ---
+# ====================================================================
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+DEFAULT_BASELINE_PATH = os.path.join(PROJECT_ROOT, 'data', 'benchmark_baseline.json')
+BASELINE_VERSION = 1
+
+DEFAULT_REPEATS = 15
+# Una métrica empeora si su mediana supera la del baseline en más de 'tolerance'
+# (relativo) y en más de 'floor_ms' (absoluto, para no fallar por ruido en
+# mediciones de microsegundos).
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_FLOOR_MS = 1.0
+
+
+class BenchmarkSkipped(Exception):
+    """El benchmark no puede ejecutarse en este entorno (por ejemplo, sin navegador)."""
+
+
+class BenchmarkContext:
+    """
+    Recursos compartidos entre benchmarks: la réplica local de Sauce Demo (para
+    que los tiempos no dependan de la red) y un navegador que se crea una sola
+    vez y sólo si algún benchmark lo necesita.
+    """
+
+    def __init__(self, site_url="local"):
+        self.site_url = site_url
+        self._server = None
+        self._driver = None
+        self._driver_error = None
+        self.tmp_dir = tempfile.mkdtemp(prefix="benchmarks-")
+
+    @property
+    def base_url(self):
+        if self.site_url != "local":
+            return self.site_url.rstrip('/') + '/'
+        if self._server is None:
+            self._server = LocalSiteServer().start()
+        return self._server.base_url
+
+    @property
+    def driver(self):
+        if self._driver is None and self._driver_error is None:
+            try:
+                self._driver = setup_driver()
+            except DriverSetupError as e:
+                self._driver_error = str(e).splitlines()[0]
+        if self._driver_error:
+            raise BenchmarkSkipped(f"navegador no disponible: {self._driver_error}")
+        return self._driver
+
+    def ensure_browser(self):
+        """Lanza BenchmarkSkipped si no se puede iniciar el navegador."""
+        return self.driver
+
+    def close(self):
+        if self._driver is not None:
+            teardown_driver(self._driver)
+        if self._server is not None:
+            self._server.stop()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+
+class Benchmark:
+    """
+    Un componente medido: 'run(context)' se ejecuta 'inner' veces por
+    repetición y se reporta el tiempo medio por llamada. 'setup(context)' se
+    ejecuta una vez antes de las repeticiones, fuera de la medición.
+    """
+
+    def __init__(self, name, run, setup=None, inner=1, max_repeats=None, description=""):
+        self.name = name
+        self.run = run
+        self.setup = setup
+        self.inner = inner
+        self.max_repeats = max_repeats
+        self.description = description
+
+    def measure(self, context, repeats):
+        if self.setup:
+            self.setup(context)
+        repeats = min(repeats, self.max_repeats or repeats)
+        samples = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            for _ in range(self.inner):
+                self.run(context)
+            samples.append((time.perf_counter() - start) * 1000 / self.inner)
+        samples.sort()
+        return {
+            'median_ms': round(statistics.median(samples), 3),
+            'p95_ms': round(percentile(samples, 0.95), 3),
+            'min_ms': round(samples[0], 3),
+            'repeats': repeats,
+        }
+
+
+# --- Componentes medidos ---
+
+def _csv_load(context):
+    list(DataSet("data/users.csv").where(expected_result="Error").stream())
+
+
+def _csv_load_cached(context):
+    DataSet("data/users.csv").where(expected_result="Error").rows()
+
+
+def _collection(context):
+    subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider"],
+        cwd=PROJECT_ROOT, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+
+def _screenshot_pipeline_setup(context):
+    context.writer = ScreenshotWriter(ArtifactStore(root=os.path.join(context.tmp_dir, 'artifacts'),
+                                                    base_dir=context.tmp_dir))
+    context.counter = 0
+
+
+def _screenshot_pipeline(context):
+    # Contenido distinto en cada llamada para medir la escritura y no la deduplicación
+    context.counter += 1
+    context.writer.submit(b"\x89PNG" + context.counter.to_bytes(8, 'big') + bytes(64 * 1024))
+    context.writer.flush()
+
+
+def _driver_startup(context):
+    context.ensure_browser()  # si no hay navegador, se omite sin intentar cada repetición
+    teardown_driver(setup_driver())
+
+
+def _open_inventory(context):
+    driver = context.driver
+    driver.get(context.base_url)
+    authenticate(driver, "standard_user", "secret_sauce", base_url=context.base_url)
+    context.page = BasePage(driver)
+
+
+def _find_element_raw(context):
+    context.driver.find_element(By.ID, "inventory_container")
+
+
+def _find_element(context):
+    context.page.find_element((By.ID, "inventory_container"))
+
+
+def _screenshot_capture(context):
+    capture_png(context.driver)
+
+
+def _checkout_flow(context):
+    """El mismo recorrido que test_05_checkout_completo, sobre la réplica local."""
+    driver = context.driver
+    driver.get(context.base_url)
+    driver.delete_all_cookies()
+    authenticate(driver, "standard_user", "secret_sauce", base_url=context.base_url)
+    inventory_page = InventoryPage(driver)
+    inventory_page.add_two_items_to_cart()
+    inventory_page.go_to_cart()
+    CartPage(driver).click_checkout()
+    checkout_page = CheckoutPage(driver)
+    checkout_page.enter_user_info("Ezequiel", "Cañete", "1600")
+    checkout_page.finish_checkout()
+    assert checkout_page.get_success_message() == "Thank you for your order!"
+
+
+BENCHMARKS = [
+    Benchmark("csv_load", _csv_load, inner=200, description="DataSet.stream filtrado sobre data/users.csv"),
+    Benchmark("csv_load_cached", _csv_load_cached, inner=200, description="DataSet.rows con la caché por mtime"),
+    Benchmark("collection", _collection, max_repeats=5, description="pytest --collect-only (subproceso)"),
+    Benchmark("screenshot_pipeline", _screenshot_pipeline, setup=_screenshot_pipeline_setup, inner=10,
+              description="submit + flush de una captura de 64 KB al almacén"),
+    Benchmark("driver_startup", _driver_startup, max_repeats=5, description="setup_driver + teardown_driver"),
+    Benchmark("find_element_raw", _find_element_raw, setup=_open_inventory, inner=20,
+              description="driver.find_element directo (referencia)"),
+    Benchmark("find_element", _find_element, setup=_open_inventory, inner=20,
+              description="BasePage.find_element (espera explícita)"),
+    Benchmark("screenshot_capture", _screenshot_capture, setup=_open_inventory, inner=5,
+              description="captura PNG en memoria"),
+    Benchmark("checkout_flow", _checkout_flow, max_repeats=5, description="flujo de test_05 en la réplica local"),
+]
+
+
+def run_benchmarks(repeats=DEFAULT_REPEATS, site_url="local", only=None):
+    """
+    Ejecuta los benchmarks y retorna {nombre: resultado}. Los que no pueden
+    ejecutarse en este entorno quedan como {'skipped': motivo}.
+    """
+    context = BenchmarkContext(site_url)
+    results = {}
+    try:
+        for benchmark in BENCHMARKS:
+            if only and benchmark.name not in only:
+                continue
+            try:
+                results[benchmark.name] = benchmark.measure(context, repeats)
+            except BenchmarkSkipped as e:
+                results[benchmark.name] = {'skipped': str(e)}
+            logger.debug("Benchmark %s: %s", benchmark.name, results[benchmark.name])
+    finally:
+        context.close()
+    return results
+
+
+# --- Baseline ---
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_baseline(path=DEFAULT_BASELINE_PATH):
+    """Lee el baseline; retorna None si todavía no existe."""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as file:
+        baseline = json.load(file)
+    if baseline.get('version') != BASELINE_VERSION:
+        raise ValueError(f"Versión de baseline no soportada: {baseline.get('version')}")
+    return baseline
+
+
+def write_baseline(results, path=DEFAULT_BASELINE_PATH, tolerance=DEFAULT_TOLERANCE, previous=None):
+    """
+    Guarda los resultados como baseline. Las métricas que se omitieron en esta
+    corrida conservan el valor del baseline anterior; las tolerancias por
+    métrica ('tolerances') también se conservan.
+    """
+    metrics = dict((previous or {}).get('metrics', {}))
+    metrics.update({name: result for name, result in results.items() if 'skipped' not in result})
+    baseline = {
+        'version': BASELINE_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': _git_commit(),
+        'environment': {'python': platform.python_version(), 'platform': platform.platform()},
+        'tolerance': (previous or {}).get('tolerance', tolerance),
+        'tolerances': (previous or {}).get('tolerances', {}),
+        'metrics': metrics,
+    }
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(baseline, file, indent=2)
+        file.write("\n")
+    return baseline
+
+
+def compare(results, baseline, tolerance=None, floor_ms=DEFAULT_FLOOR_MS):
+    """
+    Compara la mediana de cada métrica con el baseline. 'tolerance' sobrescribe
+    la del baseline; 'tolerances' del baseline fija valores por métrica. Las
+    métricas sin entrada en el baseline no se comparan (ver missing_from_baseline).
+    Retorna la lista de regresiones (vacía si no hay).
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline['metrics'].get(name)
+        if 'skipped' in result or reference is None:
+            continue
+        limit = baseline.get('tolerances', {}).get(name, tolerance if tolerance is not None else baseline['tolerance'])
+        current, previous = result['median_ms'], reference['median_ms']
+        if current > previous * (1 + limit) and current - previous > floor_ms:
+            regressions.append(
+                f"{name}: {current:.2f} ms vs baseline {previous:.2f} ms "
+                f"(+{(current / previous - 1):.0%}, tolerancia {limit:.0%})"
+            )
+    return regressions
+
+
+def missing_from_baseline(results, baseline):
+    """Métricas medidas que el baseline no tiene: se advierten para regenerarlo, no fallan."""
+    return [name for name, result in results.items() if 'skipped' not in result and name not in baseline['metrics']]
+
+
+def format_results(results, baseline=None):
+    """Tabla de texto con los resultados y su variación respecto del baseline."""
+    lines = [f"{'benchmark':<22}{'mediana ms':>12}{'p95 ms':>10}{'baseline':>10}{'cambio':>9}"]
+    for name, result in results.items():
+        if 'skipped' in result:
+            lines.append(f"{name:<22}  omitido: {result['skipped']}")
+            continue
+        reference = (baseline or {}).get('metrics', {}).get(name)
+        previous = f"{reference['median_ms']:>10.2f}" if reference else f"{'-':>10}"
+        change = f"{result['median_ms'] / reference['median_ms'] - 1:>+9.0%}" if reference else f"{'-':>9}"
+        lines.append(f"{name:<22}{result['median_ms']:>12.3f}{result['p95_ms']:>10.3f}{previous}{change}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks del framework con gating contra un baseline")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="Repeticiones por benchmark.")
+    parser.add_argument("--site-url", default="local", help="Sitio para los benchmarks de UI; 'local' usa la réplica.")
+    parser.add_argument("--only", help="Lista separada por comas de benchmarks a ejecutar.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="Archivo de baseline.")
+    parser.add_argument("--tolerance", type=float, help="Tolerancia relativa (0.25 = 25%%); por defecto la del baseline.")
+    parser.add_argument("--update-baseline", action="store_true", help="Guarda los resultados como nuevo baseline.")
+    args = parser.parse_args(argv)
+
+    only = set(args.only.split(',')) if args.only else None
+    results = run_benchmarks(args.repeats, args.site_url, only)
+    baseline = load_baseline(args.baseline)
+    print(format_results(results, baseline))
+
+    if args.update_baseline:
+        write_baseline(results, args.baseline, args.tolerance or DEFAULT_TOLERANCE, previous=baseline)
+        print(f"Baseline actualizado en {args.baseline}")
+        return 0
+    if baseline is None:
+        logger.warning("No hay baseline en %s; se ejecuta sin comparar (usar --update-baseline).", args.baseline)
+        return 0
+    for name in missing_from_baseline(results, baseline):
+        logger.warning("La métrica '%s' no tiene entrada en el baseline; regenerarlo con --update-baseline.", name)
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        logger.error("Regresión de rendimiento: %s", regression)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
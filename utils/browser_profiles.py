@@ -0,0 +1,91 @@
+# utils/browser_profiles.py
+
+import os
+
+# ====================================================================
+# --- PERFILES DEL NAVEGADOR ---
+# ====================================================================
+
+# 'faithful' reproduce la configuración original del framework (navegador
+# visible, carga completa de la página). 'fast' está pensado para CI:
+# headless, sin imágenes ni extensiones y con estrategia de carga 'eager'.
+# 'debug' deja el navegador visible con las DevTools abiertas.
+# La espera implícita es 0 en todos los perfiles: las esperas las maneja BasePage.
+BROWSER_PROFILES = {
+    'faithful': {
+        'headless': False,
+        'page_load_strategy': 'normal',
+        'window_size': None,
+        'block_images': False,
+        'arguments': ['--start-maximized', '--ignore-certificate-errors'],
+        'implicit_wait': 0,
+    },
+    'fast': {
+        'headless': True,
+        'page_load_strategy': 'eager',
+        'window_size': (1366, 768),
+        'block_images': True,
+        'arguments': [
+            '--ignore-certificate-errors',
+            '--disable-extensions',
+            '--disable-gpu',
+            '--no-sandbox',
+            '--disable-dev-shm-usage',
+        ],
+        'implicit_wait': 0,
+    },
+    'debug': {
+        'headless': False,
+        'page_load_strategy': 'normal',
+        'window_size': None,
+        'block_images': False,
+        'arguments': [
+            '--start-maximized',
+            '--ignore-certificate-errors',
+            '--auto-open-devtools-for-tabs',
+        ],
+        'implicit_wait': 0,
+    },
+}
+
+DEFAULT_PROFILE = 'faithful'
+
+_active_profile = os.environ.get("BROWSER_PROFILE", DEFAULT_PROFILE)
+
+
+def set_active_profile(name):
+    """Selecciona el perfil que usará setup_driver() por defecto."""
+    global _active_profile
+    if name not in BROWSER_PROFILES:
+        raise ValueError(f"Perfil de navegador desconocido: {name}. Opciones: {sorted(BROWSER_PROFILES)}")
+    _active_profile = name
+
+
+def get_active_profile():
+    """Retorna el nombre del perfil activo."""
+    return _active_profile
+
+
+def build_chrome_options(name):
+    """Construye las ChromeOptions correspondientes a un perfil."""
+    # Selenium se importa recién acá: conftest lee los perfiles al registrar sus
+    # opciones y una ejecución solo de API no debe cargarlo
+    from selenium import webdriver
+
+    profile = BROWSER_PROFILES[name]
+    options = webdriver.ChromeOptions()
+    options.page_load_strategy = profile['page_load_strategy']
+
+    for argument in profile['arguments']:
+        options.add_argument(argument)
+    if profile['headless']:
+        options.add_argument('--headless=new')
+    if profile['window_size']:
+        width, height = profile['window_size']
+        options.add_argument(f'--window-size={width},{height}')
+    if profile['block_images']:
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option(
+            'prefs', {'profile.managed_default_content_settings.images': 2}
+        )
+    return options
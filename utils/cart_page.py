@@ -15,6 +15,27 @@ class CartPage(BasePage):
     CART_ITEM_LIST = (By.CLASS_NAME, "cart_list")
     CART_ITEM = (By.CLASS_NAME, "cart_item")
     CHECKOUT_BUTTON = (By.ID, "checkout") # <-- ¡El localizador clave!
+
+    # Lee todos los ítems del carrito en una sola llamada (null si la lista aún no cargó)
+    CART_ITEMS_SCRIPT = """
+        var list = document.querySelector('.cart_list');
+        if (!list) { return null; }
+        var text = function (root, selector) {
+            var node = root.querySelector(selector);
+            return node ? node.innerText.trim() : null;
+        };
+        return Array.prototype.map.call(list.querySelectorAll('.cart_item'), function (item) {
+            var button = item.querySelector('button');
+            return {
+                name: text(item, '.inventory_item_name'),
+                price: text(item, '.inventory_item_price'),
+                description: text(item, '.inventory_item_desc'),
+                quantity: text(item, '.cart_quantity'),
+                button_id: button ? button.id : null,
+                button_text: button ? button.innerText.trim() : null
+            };
+        });
+    """
     
     # --- Constructor ---
     
@@ -28,25 +49,25 @@ class CartPage(BasePage):
         self.wait_for_visibility(self.HEADER_TITLE)
         assert self.CART_URL in self.driver.current_url, "No se cargó la página del carrito."
         
+    def get_items(self):
+        """
+        Retorna todos los ítems del carrito en un único round trip, como lista de
+        diccionarios con 'name', 'price', 'description', 'quantity', 'button_id'
+        y 'button_text'. Un carrito vacío retorna [] sin esperar.
+        """
+        return self.read_batch(self.CART_ITEMS_SCRIPT, self.CART_ITEM_LIST)
+
     def get_cart_item_count(self):
         """Cuenta la cantidad de ítems presentes en el carrito."""
-        # Se asume que get_cart_item_count regresa una lista de elementos
-        return len(self.driver.find_elements(*self.CART_ITEM))
+        return len(self.get_items())
         
     def get_item_names(self):
         """Retorna una lista con los nombres de los ítems en el carrito."""
-        item_names = []
-        # Encuentra todos los elementos del carrito
-        items = self.driver.find_elements(*self.CART_ITEM)
-        for item in items:
-            # Dentro de cada ítem, busca el nombre del producto
-            name_element = item.find_element(By.CLASS_NAME, "inventory_item_name")
-            item_names.append(name_element.text)
-        return item_names
+        return [item['name'] for item in self.get_items()]
 
     # --- MÉTODO AGREGADO PARA EL PROYECTO FINAL ---
     def click_checkout(self):
         """
         Hace clic en el botón 'Checkout' para iniciar el proceso de compra.
         """
-        self.find_element(self.CHECKOUT_BUTTON).click()
\ No newline at end of file
+        self.click_element(self.CHECKOUT_BUTTON)
\ No newline at end of file
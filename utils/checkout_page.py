@@ -2,7 +2,7 @@
 
 from selenium.webdriver.common.by import By
 from utils.base_page import BasePage
-import logging
+from utils.log_config import timed_step
 
 class CheckoutPage(BasePage):
     """
@@ -28,20 +28,26 @@ class CheckoutPage(BasePage):
         """
         Ingresa la información del usuario en el primer paso del checkout.
         """
-        logging.info("Ingresando información de checkout.")
-        self.find_element(self.FIRST_NAME_INPUT).send_keys(first_name)
-        self.find_element(self.LAST_NAME_INPUT).send_keys(last_name)
-        self.find_element(self.POSTAL_CODE_INPUT).send_keys(postal_code)
-        self.click_element(self.CONTINUE_BUTTON)
-        logging.info("Información ingresada. Navegando al Overview.")
+        self.log.info("Ingresando información de checkout.")
+        with timed_step(self.log, "enter_user_info"):
+            self.fill_form(
+                {
+                    self.FIRST_NAME_INPUT: first_name,
+                    self.LAST_NAME_INPUT: last_name,
+                    self.POSTAL_CODE_INPUT: postal_code,
+                },
+                submit=self.CONTINUE_BUTTON,
+            )
+        self.log.info("Información ingresada. Navegando al Overview.")
 
     def finish_checkout(self):
         """
         Completa el proceso de compra haciendo clic en el botón 'Finish'.
         """
-        logging.info("Navegando al paso final del checkout.")
-        self.click_element(self.FINISH_BUTTON)
-        logging.info("Checkout finalizado.")
+        self.log.info("Navegando al paso final del checkout.")
+        with timed_step(self.log, "finish_checkout"):
+            self.click_element(self.FINISH_BUTTON)
+        self.log.info("Checkout finalizado.")
         
     def get_success_message(self):
         """
@@ -30,8 +30,11 @@ class CheckoutPageStep1(BasePage):
         
     def fill_and_continue(self, first_name, last_name, zip_code):
         """Completa los campos de información personal y hace clic en Continuar."""
-        self.find_element(self.FIRST_NAME_INPUT).send_keys(first_name)
-        self.find_element(self.LAST_NAME_INPUT).send_keys(last_name)
-        self.find_element(self.ZIP_CODE_INPUT).send_keys(zip_code)
-        
-        self.find_element(self.CONTINUE_BUTTON).click()
\ No newline at end of file
+        self.fill_form(
+            {
+                self.FIRST_NAME_INPUT: first_name,
+                self.LAST_NAME_INPUT: last_name,
+                self.ZIP_CODE_INPUT: zip_code,
+            },
+            submit=self.CONTINUE_BUTTON,
+        )
\ No newline at end of file
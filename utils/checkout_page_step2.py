@@ -33,7 +33,7 @@ class CheckoutPageStep2(BasePage):
 
     def finish_order(self):
         """Hace clic en el botón FINISH para completar la compra."""
-        self.find_element(self.FINISH_BUTTON).click()
+        self.click_element(self.FINISH_BUTTON)
         
     def get_confirmation_message(self):
         """Obtiene el mensaje de confirmación final."""
@@ -0,0 +1,285 @@
+# utils/command_tracer.py
+
+import os
+import sys
+import json
+import math
+import time
+
+from utils.log_config import get_logger
+from utils.parallel import artifact_dir, worker_id
+
+logger = get_logger('artifacts')
+
+# ====================================================================
+# --- TRAZA DE COMANDOS DE WEBDRIVER ---
+# ====================================================================
+
+# Con el trazado activo, cada comando que el driver envía al navegador
+# (findElement, click, sendKeys, executeScript, ...) se registra con su inicio,
+# su duración, el método del Page Object que lo originó y el locator usado.
+# Por test se exporta una línea de tiempo en formato Chrome trace-event (se
+# abre en chrome://tracing o https://ui.perfetto.dev) y al final de la sesión
+# se resume la latencia p50/p95 por locator y por estrategia. Los scripts no
+# usan locator: se agrupan bajo la estrategia SCRIPT.
+
+TRACE_SETTINGS = {'enabled': os.environ.get("WEBDRIVER_TRACE", "0") == "1"}
+
+UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_PAGE_FILE = os.path.join(UTILS_DIR, 'base_page.py')
+
+# Estrategias de Selenium ('css selector') con el nombre de la constante de By
+STRATEGY_NAMES = {
+    'id': 'ID', 'xpath': 'XPATH', 'css selector': 'CSS_SELECTOR', 'class name': 'CLASS_NAME',
+    'name': 'NAME', 'tag name': 'TAG_NAME', 'link text': 'LINK_TEXT',
+    'partial link text': 'PARTIAL_LINK_TEXT',
+}
+
+# Variables locales de BasePage que contienen el locator de la operación en curso
+_LOCATOR_NAMES = ('by_locator', 'locator', 'ready_locator')
+
+# Comandos de script (nombres W3C y legacy): su latencia no es la de ningún locator
+SCRIPT_COMMANDS = {'w3cExecuteScript', 'w3cExecuteScriptAsync', 'executeScript', 'executeAsyncScript'}
+SCRIPT_STRATEGY = 'SCRIPT'
+
+
+def configure_tracing(enabled):
+    """Activa o desactiva el trazado de comandos."""
+    TRACE_SETTINGS['enabled'] = bool(enabled)
+
+
+def _caller_context(frame):
+    """
+    Recorre la pila desde el comando hacia afuera y retorna (método, locator):
+    el método es el más externo de un Page Object (por ejemplo
+    'CartPage.go_to_checkout') y el locator, el de la operación de BasePage
+    en curso. Ambos pueden ser None (por ejemplo, un driver.get del fixture).
+    """
+    method = locator = None
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if method is not None and not filename.startswith(UTILS_DIR):
+            break  # ya se salió de los Page Objects (por ejemplo, al test)
+        if filename.startswith(UTILS_DIR):
+            owner = frame.f_locals.get('self')
+            if locator is None and filename == BASE_PAGE_FILE:
+                for name in _LOCATOR_NAMES:
+                    value = frame.f_locals.get(name)
+                    if isinstance(value, tuple) and len(value) == 2:
+                        locator = value
+                        break
+                else:
+                    # CachedElement guarda el locator con el que se encontró
+                    value = getattr(owner, '_locator', None)
+                    if isinstance(value, tuple):
+                        locator = value
+            if owner is not None and hasattr(owner, '_wait_until'):
+                method = f"{type(owner).__name__}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return method, locator
+
+
+class CommandTracer:
+    """
+    Envuelve driver.execute para registrar cada comando. Los eventos del test
+    en curso van a 'events'; los de la sesión se acumulan por (estrategia,
+    locator, método) en histogramas de tamaño acotado (ver latency_stats()).
+    """
+
+    def __init__(self):
+        self.events = []
+        self.stats = {}
+        self._test_start = None
+
+    def install(self, driver):
+        """Envuelve el método execute del driver (una sola vez por driver)."""
+        if getattr(driver, '_command_tracer', None) is self:
+            return driver
+        original = driver.execute
+
+        def execute(command, params=None):
+            if not TRACE_SETTINGS['enabled']:
+                return original(command, params)
+            return self._execute(original, command, params)
+
+        driver.execute = execute
+        driver._command_tracer = self
+        return driver
+
+    def _execute(self, original, command, params):
+        method, locator = _caller_context(sys._getframe(2))
+        if command in SCRIPT_COMMANDS:
+            locator = None
+        elif locator is None and params and 'using' in params:
+            locator = (params['using'], params.get('value'))
+        start = time.perf_counter()
+        ok = False
+        try:
+            result = original(command, params)
+            ok = True
+            return result
+        finally:
+            end = time.perf_counter()
+            if command in SCRIPT_COMMANDS:
+                strategy = SCRIPT_STRATEGY
+            else:
+                strategy = STRATEGY_NAMES.get(locator[0], locator[0]) if locator else None
+            event = {
+                'command': command,
+                'start': start,
+                'ms': (end - start) * 1000,
+                'method': method,
+                'strategy': strategy,
+                'locator': locator[1] if locator else None,
+                'ok': ok,
+            }
+            self.events.append(event)
+            self._add_stat(strategy, event['locator'], method, event['ms'])
+
+    # --- Acumulado de la sesión ---
+
+    def _add_stat(self, strategy, locator, method, ms):
+        stat = self.stats.setdefault((strategy, locator, method), {'commands': 0, 'total_ms': 0.0, 'histogram': {}})
+        stat['commands'] += 1
+        stat['total_ms'] += ms
+        bucket = latency_bucket(ms)
+        stat['histogram'][bucket] = stat['histogram'].get(bucket, 0) + 1
+
+    def latency_stats(self):
+        """
+        Acumulado de la sesión como lista serializable (para la workeroutput de
+        xdist): [estrategia, locator, método, comandos, total_ms, [[bucket, cantidad], ...]].
+        """
+        return [
+            [strategy, locator, method, stat['commands'], round(stat['total_ms'], 3), sorted(stat['histogram'].items())]
+            for (strategy, locator, method), stat in self.stats.items()
+        ]
+
+    # --- Por test ---
+
+    def begin_test(self):
+        self.events = []
+        self._test_start = time.perf_counter()
+
+    def trace_events(self, test):
+        """
+        Eventos del test en formato Chrome trace-event (duraciones en µs). Los
+        comandos consecutivos de un mismo método del Page Object se agrupan en
+        un evento padre, así la espera entre sondeos queda a la vista.
+        """
+        origin = self._test_start if self._test_start is not None else (self.events[0]['start'] if self.events else 0)
+        us = lambda seconds: round((seconds - origin) * 1e6, 1)
+        trace = [
+            {'name': 'process_name', 'ph': 'M', 'pid': 1, 'args': {'name': test}},
+            {'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': 1, 'args': {'name': worker_id()}},
+        ]
+        span = None
+        for event in self.events:
+            end = event['start'] + event['ms'] / 1000
+            if span is not None and span['method'] == event['method']:
+                span['end'] = end
+            else:
+                if span is not None and span['method']:
+                    trace.append(self._span_event(span, us))
+                span = {'method': event['method'], 'start': event['start'], 'end': end}
+            args = {'ok': event['ok']}
+            if event['locator'] is not None:
+                args.update(strategy=event['strategy'], locator=event['locator'])
+            if event['method']:
+                args['method'] = event['method']
+            trace.append({
+                'name': event['command'], 'cat': 'webdriver', 'ph': 'X', 'pid': 1, 'tid': 1,
+                'ts': us(event['start']), 'dur': round(event['ms'] * 1000, 1), 'args': args,
+            })
+        if span is not None and span['method']:
+            trace.append(self._span_event(span, us))
+        return trace
+
+    @staticmethod
+    def _span_event(span, us):
+        return {
+            'name': span['method'], 'cat': 'page-object', 'ph': 'X', 'pid': 1, 'tid': 1,
+            'ts': us(span['start']), 'dur': round((span['end'] - span['start']) * 1e6, 1),
+        }
+
+    def write_trace(self, test, run_id):
+        """Escribe la línea de tiempo del test en reports/traces/<worker>/. Retorna la ruta o None."""
+        if not self.events:
+            return None
+        safe_name = test.replace("::", "_").replace("/", "_")
+        path = os.path.join(artifact_dir('traces'), f"{safe_name}_{run_id}.json")
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump({'traceEvents': self.trace_events(test), 'displayTimeUnit': 'ms'}, file)
+        logger.debug("Traza de WebDriver de %s: %d comandos en %s", test, len(self.events), path)
+        return path
+
+
+COMMAND_TRACER = CommandTracer()
+
+
+# ====================================================================
+# --- TABLA DE LATENCIAS ---
+# ====================================================================
+
+def latency_bucket(ms):
+    """Redondea la latencia a dos cifras significativas (error menor al 5 %)."""
+    return float(f"{ms:.2g}")
+
+
+def _histogram_percentile(histogram, fraction):
+    """Percentil por rango más cercano sobre un histograma {bucket: cantidad}."""
+    total = sum(histogram.values())
+    index = max(math.ceil(fraction * total) - 1, 0)
+    seen = 0
+    for bucket in sorted(histogram):
+        seen += histogram[bucket]
+        if seen > index:
+            return bucket
+    return None
+
+
+def latency_table(stats, key='locator'):
+    """
+    Agrupa el acumulado de latency_stats() (de uno o varios workers) por
+    locator ('locator'), por estrategia ('strategy') o por método ('method').
+    Retorna filas ordenadas por tiempo total, de mayor a menor; los
+    percentiles tienen la resolución de los buckets del histograma.
+    """
+    groups = {}
+    for strategy, locator, method, commands, total_ms, histogram in stats:
+        if key == 'locator':
+            if locator is None:
+                continue
+            group = (strategy, locator)
+        elif key == 'strategy':
+            if strategy is None:
+                continue
+            group = (strategy, '*')
+        else:
+            group = ('', method or '(fuera de Page Objects)')
+        merged = groups.setdefault(group, {'commands': 0, 'total_ms': 0.0, 'histogram': {}})
+        merged['commands'] += commands
+        merged['total_ms'] += total_ms
+        for bucket, count in histogram:
+            merged['histogram'][bucket] = merged['histogram'].get(bucket, 0) + count
+
+    rows = []
+    for group, merged in groups.items():
+        rows.append({
+            'group': group, 'commands': merged['commands'], 'total_ms': round(merged['total_ms'], 1),
+            'p50_ms': _histogram_percentile(merged['histogram'], 0.50),
+            'p95_ms': _histogram_percentile(merged['histogram'], 0.95),
+        })
+    return sorted(rows, key=lambda row: -row['total_ms'])
+
+
+def format_latency_table(rows, limit=15):
+    """Tabla de texto para la terminal."""
+    lines = [f"{'estrategia':<13}{'locator / método':<46}{'cmds':>6}{'p50 ms':>9}{'p95 ms':>9}{'total ms':>10}"]
+    for row in rows[:limit]:
+        strategy, name = row['group']
+        name = name if len(name) <= 44 else name[:41] + '...'
+        lines.append(
+            f"{strategy:<13}{name:<46}{row['commands']:>6}{row['p50_ms']:>9.1f}{row['p95_ms']:>9.1f}{row['total_ms']:>10.1f}"
+        )
+    return lines
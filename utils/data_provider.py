@@ -0,0 +1,172 @@
+# utils/data_provider.py
+
+import os
+import csv
+import json
+import threading
+from functools import lru_cache
+from collections import namedtuple
+
+from utils.log_config import get_logger
+
+logger = get_logger('data')
+
+# ====================================================================
+# --- PROVEEDOR DE DATOS DE PRUEBA (CSV / JSON / JSONL) ---
+# ====================================================================
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+FORMATS = ('csv', 'json', 'jsonl')
+
+# Filas ya parseadas por (ruta, mtime, tamaño, filtros, columnas): si el archivo
+# cambia, la clave cambia, se vuelve a leer y se descartan las entradas viejas.
+# Las vistas con predicados (lambdas) no se cachean: cada lambda nueva sería
+# una clave distinta y la caché crecería sin límite.
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _row_type(columns):
+    """
+    Clase namedtuple por conjunto de columnas (crearla es costoso: se reutiliza).
+    Las columnas que no son identificadores válidos ('first name', 'class')
+    se renombran por posición (_0, _1, ...).
+    """
+    return namedtuple('Row', columns, rename=True)
+
+
+class DataFileError(FileNotFoundError):
+    """El archivo de datos no existe o no se puede leer."""
+
+
+def boolean(value):
+    """Conversor para columnas booleanas de CSV ('true'/'false', 'si'/'no', '1'/'0')."""
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ('true', 'si', 'sí', 'yes', '1')
+
+
+class DataSet:
+    """
+    Origen de datos con columnas nombradas y tipadas.
+
+    - stream() lee el archivo fila por fila (CSV y JSONL no se cargan enteros
+      en memoria) y aplica los filtros sobre la marcha.
+    - rows() materializa el resultado y lo cachea según el mtime del archivo,
+      para parametrizar tests sin releer el archivo en cada colección.
+    - where() y select() retornan una vista nueva; el DataSet original no cambia.
+
+    Cada fila es una namedtuple, así que sirve directo en pytest.mark.parametrize:
+
+        USERS = DataSet("data/users.csv")
+        USERS.where(expected_result="Error").rows()
+    """
+
+    def __init__(self, path, schema=None, format=None):
+        self.path = path if os.path.isabs(path) else os.path.join(PROJECT_ROOT, path)
+        self.format = format or os.path.splitext(path)[1].lstrip('.').lower()
+        if self.format not in FORMATS:
+            raise ValueError(f"Formato de datos no soportado: {self.format}. Opciones: {FORMATS}")
+        # columna -> conversor (int, float, boolean, ...); el resto queda como viene
+        self.schema = dict(schema or {})
+        self._filters = ()
+        self._columns = None
+
+    # --- Vistas ---
+
+    def where(self, predicate=None, **equals):
+        """
+        Filtra las filas: where(expected_result="Error") compara por igualdad
+        (con el valor ya tipado) y where(lambda row: ...) aplica un predicado.
+        """
+        view = self._copy()
+        if equals:
+            view._filters += (tuple(sorted(equals.items())),)
+        if predicate is not None:
+            view._filters += (predicate,)
+        return view
+
+    def select(self, *columns):
+        """Limita (y ordena) las columnas de cada fila."""
+        view = self._copy()
+        view._columns = columns
+        return view
+
+    def _copy(self):
+        view = DataSet.__new__(DataSet)
+        view.__dict__.update(self.__dict__)
+        return view
+
+    # --- Lectura ---
+
+    def stream(self):
+        """Generador de filas (namedtuples) tipadas y filtradas, leyendo el archivo de a una."""
+        for record in self._records():
+            record = {key: self.schema[key](value) if key in self.schema else value
+                      for key, value in record.items()}
+            if not all(self._matches(record, condition) for condition in self._filters):
+                continue
+            columns = self._columns or tuple(record)
+            yield _row_type(tuple(columns))(*(record.get(column) for column in columns))
+
+    __iter__ = stream
+
+    def rows(self):
+        """
+        Lista de filas, cacheada hasta que el archivo cambie (mtime o tamaño).
+        Si la vista tiene un predicado se lee el archivo sin cachear.
+        """
+        stat = self._stat()
+        if any(callable(condition) for condition in self._filters):
+            return list(self.stream())
+        key = (self.path, stat.st_mtime_ns, stat.st_size, self._filters, self._columns,
+               tuple(sorted(self.schema.items(), key=lambda item: item[0])))
+        with _cache_lock:
+            if key in _cache:
+                return _cache[key]
+        rows = list(self.stream())
+        with _cache_lock:
+            # Las lecturas de versiones anteriores del archivo ya no se van a pedir
+            for stale in [cached for cached in _cache if cached[0] == self.path and cached[1:3] != key[1:3]]:
+                del _cache[stale]
+            _cache[key] = rows
+        logger.info("Datos cargados desde %s: %d filas.", os.path.relpath(self.path, PROJECT_ROOT), len(rows))
+        return rows
+
+    @staticmethod
+    def _matches(record, condition):
+        if callable(condition):
+            return condition(record)
+        return all(record.get(column) == value for column, value in condition)
+
+    def _stat(self):
+        try:
+            return os.stat(self.path)
+        except OSError as e:
+            raise DataFileError(f"No se encontró el archivo de datos: {self.path}") from e
+
+    def _records(self):
+        """Diccionarios crudos del archivo, en orden."""
+        self._stat()
+        with open(self.path, 'r', newline='', encoding='utf-8') as file:
+            if self.format == 'csv':
+                yield from csv.DictReader(file)
+            elif self.format == 'jsonl':
+                for number, line in enumerate(file, start=1):
+                    if line.strip():
+                        try:
+                            yield json.loads(line)
+                        except ValueError as e:
+                            raise ValueError(f"{self.path}:{number}: JSON inválido ({e})") from e
+            else:
+                # JSON no se puede leer por partes: para datasets grandes usar JSONL
+                data = json.load(file)
+                yield from (data['rows'] if isinstance(data, dict) else data)
+
+
+def clear_cache():
+    """Vacía la caché de filas parseadas."""
+    with _cache_lock:
+        _cache.clear()
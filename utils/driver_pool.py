@@ -0,0 +1,100 @@
+# utils/driver_pool.py
+
+from selenium.common.exceptions import WebDriverException
+from urllib3.exceptions import HTTPError
+
+from utils.base_page import setup_driver, teardown_driver, get_base_url
+from utils.log_config import get_logger
+
+logger = get_logger('driver')
+
+# ====================================================================
+# --- POOL DE WEBDRIVERS REUTILIZABLES ENTRE TESTS ---
+# ====================================================================
+
+# Un chromedriver muerto no responde con WebDriverException sino con errores
+# de conexión (urllib3.exceptions.MaxRetryError, ConnectionRefusedError, ...)
+DEAD_SESSION_ERRORS = (WebDriverException, HTTPError, ConnectionError)
+
+class DriverPool:
+    """
+    Mantiene navegadores abiertos durante toda la sesión para no pagar el
+    arranque de Chrome en cada test.
+
+    Al devolver un driver al pool se limpia su estado (ventanas extra,
+    cookies, localStorage, sessionStorage) y se navega a la URL base.
+    Si la sesión no responde o la limpieza falla, el driver se descarta
+    y el siguiente test recibe uno nuevo.
+    """
+
+    def __init__(self, factory=setup_driver, base_url=None, max_idle=1):
+        self.factory = factory
+        self.base_url = base_url or get_base_url()
+        self.max_idle = max_idle
+        self._idle = []
+
+        # Estadísticas del pool (se reportan al final de la sesión)
+        self.hits = 0
+        self.misses = 0
+        self.discarded = 0
+
+    def acquire(self):
+        """Retorna un driver limpio, reutilizando uno libre si existe."""
+        if self._idle:
+            self.hits += 1
+            return self._idle.pop()
+
+        self.misses += 1
+        return self.factory()
+
+    def release(self, driver, poisoned=False):
+        """
+        Devuelve un driver al pool. Se descarta si está marcado como
+        envenenado, si la sesión murió o si el pool ya está lleno.
+        """
+        if driver is None:
+            return
+        if poisoned or len(self._idle) >= self.max_idle or not self._reset(driver):
+            self._discard(driver)
+            return
+        self._idle.append(driver)
+
+    def close(self):
+        """Cierra todos los navegadores libres al terminar la sesión."""
+        while self._idle:
+            teardown_driver(self._idle.pop())
+
+    def stats(self):
+        """Retorna las estadísticas de uso del pool."""
+        return {'hits': self.hits, 'misses': self.misses, 'discarded': self.discarded}
+
+    # --- Métodos internos ---
+
+    def _reset(self, driver):
+        """
+        Deja el navegador en el estado de un driver recién creado.
+        Retorna False si la sesión está muerta o no se pudo limpiar.
+        """
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            # Las cookies y el storage se limpian sobre el origen de la URL base
+            driver.get(self.base_url)
+            driver.delete_all_cookies()
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            return True
+        except DEAD_SESSION_ERRORS as e:
+            logger.warning("Driver descartado del pool, la sesión no se pudo limpiar: %s", getattr(e, 'msg', None) or e)
+            return False
+
+    def _discard(self, driver):
+        self.discarded += 1
+        try:
+            teardown_driver(driver)
+        except DEAD_SESSION_ERRORS:
+            # La sesión ya estaba muerta, no hay nada que cerrar
+            pass
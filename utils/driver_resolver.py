@@ -0,0 +1,123 @@
+# utils/driver_resolver.py
+
+import os
+import time
+
+from utils.log_config import get_logger
+
+logger = get_logger('driver')
+
+# ====================================================================
+# --- RESOLUCIÓN DEL BINARIO DE CHROMEDRIVER ---
+# ====================================================================
+
+DRIVER_BINARY_NAMES = ("chromedriver", "chromedriver.exe")
+
+
+class DriverSetupError(RuntimeError):
+    """Error al resolver el chromedriver o al iniciar el navegador."""
+
+
+class StartupTimings:
+    """
+    Acumula los tiempos de arranque para poder separarlos del tiempo de
+    los tests: la resolución del driver (una vez por sesión) y cada
+    lanzamiento del navegador.
+    """
+
+    def __init__(self):
+        self.resolution = None
+        self.launches = []
+
+    def summary(self):
+        total_launch = sum(self.launches)
+        return {
+            'resolution_s': self.resolution,
+            'launch_count': len(self.launches),
+            'launch_total_s': total_launch,
+            'launch_mean_s': total_launch / len(self.launches) if self.launches else None,
+        }
+
+
+STARTUP_TIMINGS = StartupTimings()
+
+# Configuración de resolución (se completa desde conftest o variables de entorno)
+_config = {
+    'driver_path': os.environ.get("CHROMEDRIVER_PATH"),
+    'cache_dir': os.environ.get("CHROMEDRIVER_CACHE"),
+}
+_resolved_path = None
+_resolution_error = None
+
+
+def configure_driver_resolution(driver_path=None, cache_dir=None):
+    """
+    Fija la ruta explícita del chromedriver y/o el directorio de caché local.
+    Invalida la ruta resuelta previamente.
+    """
+    global _resolved_path, _resolution_error
+    if driver_path:
+        _config['driver_path'] = driver_path
+    if cache_dir:
+        _config['cache_dir'] = cache_dir
+    _resolved_path = None
+    _resolution_error = None
+
+
+def resolve_driver_path():
+    """
+    Retorna la ruta del chromedriver, resolviéndola una sola vez por sesión.
+    Orden: ruta explícita, caché local pre-poblada y por último WebDriver Manager.
+    Lanza DriverSetupError si no se puede resolver; el error también se
+    cachea para que el resto de los tests falle de inmediato.
+    """
+    global _resolved_path, _resolution_error
+    if _resolved_path:
+        return _resolved_path
+    if _resolution_error:
+        raise _resolution_error
+
+    start = time.perf_counter()
+    try:
+        if _config['driver_path']:
+            path = _config['driver_path']
+            if not os.path.isfile(path):
+                raise DriverSetupError(f"El chromedriver configurado no existe: {path}")
+        elif _config['cache_dir']:
+            path = _find_in_cache(_config['cache_dir'])
+        else:
+            path = _install_with_manager()
+    except DriverSetupError as e:
+        _resolution_error = e
+        logger.critical("%s", e)
+        raise
+
+    _resolved_path = path
+    STARTUP_TIMINGS.resolution = time.perf_counter() - start
+    logger.info("Chromedriver resuelto en %s (%.2fs)", path, STARTUP_TIMINGS.resolution)
+    return path
+
+
+def _find_in_cache(cache_dir):
+    """Busca el chromedriver más reciente dentro de un directorio de caché."""
+    candidates = []
+    for root, _dirs, files in os.walk(cache_dir):
+        for name in files:
+            if name in DRIVER_BINARY_NAMES:
+                candidates.append(os.path.join(root, name))
+    if not candidates:
+        raise DriverSetupError(f"No se encontró chromedriver en la caché local: {cache_dir}")
+    return max(candidates, key=os.path.getmtime)
+
+
+def _install_with_manager():
+    """Resuelve el driver con WebDriver Manager (requiere red la primera vez)."""
+    from webdriver_manager.chrome import ChromeDriverManager
+    try:
+        return ChromeDriverManager().install()
+    except Exception as e:
+        raise DriverSetupError(
+            "WebDriver Manager no pudo obtener el chromedriver. "
+            "Sin red, configure CHROMEDRIVER_PATH o CHROMEDRIVER_CACHE. "
+            f"Detalle: {e}"
+        ) from e
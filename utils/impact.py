@@ -0,0 +1,291 @@
+# utils/impact.py
+
+import os
+import re
+import ast
+import sys
+import json
+import time
+import importlib
+import subprocess
+
+from utils.log_config import get_logger
+from utils.parallel import REPORTS_DIR
+
+logger = get_logger('framework')
+
+# ====================================================================
+# --- SELECCIÓN DE TESTS POR IMPACTO DE LOS CAMBIOS ---
+# ====================================================================
+
+# Durante una ejecución con registro, cada test anota:
+# - 'modules': archivos de utils/ cuyo código se ejecutó (vía sys.setprofile),
+# - 'classes': Page Objects instanciados (con sus clases base de utils/),
+# - 'locators': locators de los Page Objects que se usaron, por valor: se
+#   identifican con el índice de todas las clases de utils/*_page.py, así que
+#   cuentan aunque se usen desde un BasePage genérico (por ejemplo, en
+#   utils/session.py) o dentro de una condición de espera.
+# Con un conjunto de archivos cambiados (o un rango de git) se seleccionan
+# solo los tests que ejercitaron lo que cambió.
+
+PROJECT_ROOT = os.path.dirname(REPORTS_DIR)
+UTILS_DIR = os.path.join(PROJECT_ROOT, 'utils')
+DEFAULT_MAP_PATH = os.path.join(REPORTS_DIR, 'impact_map.json')
+MAP_VERSION = 1
+DEFAULT_FULL_RUN_EVERY = 10
+
+_HUNK = re.compile(r'^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@')
+
+
+def _relative(path):
+    return os.path.relpath(path, PROJECT_ROOT).replace(os.path.sep, '/')
+
+
+def _is_locator(value):
+    return isinstance(value, tuple) and len(value) == 2 and all(isinstance(part, str) for part in value)
+
+
+def build_locator_index():
+    """
+    Índice valor del locator -> ["utils/x_page.py::Clase.ATRIBUTO", ...] con los
+    locators definidos en todas las clases de los módulos utils/*_page.py.
+    """
+    index = {}
+    for filename in sorted(os.listdir(UTILS_DIR)):
+        if not filename.endswith('_page.py'):
+            continue
+        module = importlib.import_module(f"utils.{filename[:-3]}")
+        for cls in vars(module).values():
+            if not isinstance(cls, type) or cls.__module__ != module.__name__:
+                continue
+            for name, value in vars(cls).items():
+                if _is_locator(value):
+                    index.setdefault(value, []).append(f"{_relative(module.__file__)}::{cls.__name__}.{name}")
+    return index
+
+
+def condition_locators(condition, depth=0):
+    """
+    Locators capturados por una condición de espera: los EC.* de Selenium los
+    guardan en su closure y EC.any_of/all_of guardan las condiciones que combinan.
+    """
+    found = []
+    if depth > 3:
+        return found
+    for cell in getattr(condition, '__closure__', None) or ():
+        try:
+            value = cell.cell_contents
+        except ValueError:
+            continue
+        if _is_locator(value):
+            found.append(value)
+        elif isinstance(value, (tuple, list)):
+            for item in value:
+                if _is_locator(item):
+                    found.append(item)
+                elif callable(item):
+                    found.extend(condition_locators(item, depth + 1))
+        elif callable(value):
+            found.extend(condition_locators(value, depth + 1))
+    return found
+
+
+# --- Registro en tiempo de ejecución ---
+
+class ImpactRecorder:
+    """Registra lo que ejercita el test en curso; inactivo (sin costo) fuera de start/stop."""
+
+    def __init__(self):
+        self.active = None
+        self._seen_code = set()
+        self._locator_index = None
+
+    def start(self):
+        """Abre el registro de un test; se activa con resume() en cada fase (setup, call, teardown)."""
+        if self._locator_index is None:
+            # Se construye fuera del perfilado: importar los Page Objects no es código del test
+            self._locator_index = build_locator_index()
+        self.active = {'modules': set(), 'classes': set(), 'locators': set()}
+        self._seen_code = set()
+
+    def stop(self):
+        sys.setprofile(None)
+        entry, self.active = self.active, None
+        return {key: sorted(values) for key, values in entry.items()} if entry else None
+
+    def resume(self):
+        if self.active is not None:
+            sys.setprofile(self._profile)
+
+    def suspend(self):
+        sys.setprofile(None)
+
+    def _profile(self, frame, event, arg):
+        if event != 'call':
+            return
+        code = frame.f_code
+        if code in self._seen_code:
+            return
+        self._seen_code.add(code)
+        if code.co_filename.startswith(UTILS_DIR) and code.co_filename != __file__:
+            self.active['modules'].add(_relative(code.co_filename))
+
+    def note_page(self, page):
+        """Anota la clase del Page Object y sus clases base definidas en utils/."""
+        if self.active is None:
+            return
+        for cls in type(page).__mro__:
+            if cls.__module__.startswith('utils.'):
+                self.active['classes'].add(f"{_relative(sys.modules[cls.__module__].__file__)}::{cls.__name__}")
+
+    def note_locator(self, locator):
+        """Anota el locator usado con los atributos de clase que lo definen (en cualquier Page Object)."""
+        if self.active is None:
+            return
+        self.active['locators'].update(self._locator_index.get(tuple(locator), ()))
+
+    def note_condition(self, condition):
+        """Anota los locators de una condición de espera (EC.* o combinaciones con any_of/all_of)."""
+        if self.active is None:
+            return
+        for locator in condition_locators(condition):
+            self.note_locator(locator)
+
+
+IMPACT_RECORDER = ImpactRecorder()
+
+
+# --- Mapa de dependencias ---
+
+class ImpactMap:
+    """Mapa test -> {'modules', 'classes', 'locators'} persistido entre ejecuciones."""
+
+    def __init__(self, path=DEFAULT_MAP_PATH):
+        self.path = path
+        self.tests = {}
+        self.runs_since_full = 0
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as file:
+                    data = json.load(file)
+                if data.get('version') == MAP_VERSION:
+                    self.tests = data['tests']
+                    self.runs_since_full = data.get('runs_since_full', 0)
+            except (OSError, ValueError) as e:
+                logger.warning("Mapa de impacto ilegible (%s); se ignora.", e)
+
+    def update(self, entries):
+        self.tests.update(entries)
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as file:
+            json.dump({
+                'version': MAP_VERSION,
+                'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'runs_since_full': self.runs_since_full,
+                'tests': dict(sorted(self.tests.items())),
+            }, file, indent=2)
+
+
+# --- Cambios ---
+
+def git_changes(diff_range):
+    """
+    Archivos cambiados en un rango de git (por ejemplo 'origin/main...HEAD')
+    y, para cada uno, las líneas modificadas del archivo nuevo.
+    """
+    output = subprocess.run(
+        ["git", "diff", "-U0", "--no-color", diff_range], cwd=PROJECT_ROOT,
+        capture_output=True, text=True, check=True,
+    ).stdout
+    changes, current = {}, None
+    for line in output.splitlines():
+        if line.startswith('diff --git '):
+            # 'diff --git a/ruta b/ruta': en un archivo borrado no hay '+++ b/...'
+            current = line.split(' b/', 1)[-1]
+            changes.setdefault(current, set())
+        elif line.startswith('+++ '):
+            if line.endswith('/dev/null'):
+                current = None
+        else:
+            match = _HUNK.match(line)
+            if match and current:
+                start, count = int(match.group(1)), int(match.group(2) or 1)
+                # Un hunk que solo borra líneas (count 0) se ancla en la línea anterior al borrado
+                changes[current].update(range(start, start + max(count, 1)))
+    return changes
+
+
+def changed_symbols(path, lines):
+    """
+    Traduce las líneas cambiadas de un módulo de utils/ a los símbolos que
+    tocan: {'path::Clase'} o {'path::Clase.LOCATOR'} si solo cambiaron
+    asignaciones de locators. Retorna None si algún cambio está fuera de una
+    clase (imports, funciones, constantes del módulo): afecta al módulo entero.
+    """
+    absolute = os.path.join(PROJECT_ROOT, path)
+    if not lines or not os.path.exists(absolute):
+        return None
+    with open(absolute, 'r', encoding='utf-8') as file:
+        tree = ast.parse(file.read())
+
+    symbols = set()
+    for line in lines:
+        owner = next((node for node in tree.body
+                      if isinstance(node, ast.ClassDef) and node.lineno <= line <= node.end_lineno), None)
+        if owner is None:
+            return None
+        statement = next((node for node in owner.body if node.lineno <= line <= node.end_lineno), None)
+        is_locator = (
+            isinstance(statement, ast.Assign) and isinstance(statement.value, ast.Tuple)
+            and all(isinstance(target, ast.Name) for target in statement.targets)
+        )
+        if is_locator:
+            symbols.update(f"{path}::{owner.name}.{target.id}" for target in statement.targets)
+        else:
+            symbols.add(f"{path}::{owner.name}")
+    return symbols
+
+
+def _owner_class(symbol):
+    """'utils/x.py::Clase.LOCATOR' o 'utils/x.py::Clase' -> 'utils/x.py::Clase'."""
+    path, _, name = symbol.partition('::')
+    return f"{path}::{name.split('.')[0]}"
+
+
+def select_tests(nodeids, impact_map, changes):
+    """
+    Retorna (seleccionados, motivo). 'changes' es {archivo: líneas cambiadas}
+    (conjunto vacío si solo se conoce el archivo). Se ejecuta todo si cambió
+    algo que el mapa no modela (conftest, configuración, datos, la réplica).
+    """
+    selected = set()
+    # Solo los Page Objects quedan registrados en 'classes': un cambio dentro de
+    # cualquier otra clase (ApiClient, DriverPool, ...) se trata como cambio del módulo
+    recorded_classes = {name for entry in impact_map.tests.values() for name in entry['classes']}
+    for path, lines in changes.items():
+        if path.startswith('test/') and path.endswith('.py') and os.path.basename(path) != 'conftest.py':
+            selected.update(nodeid for nodeid in nodeids if nodeid.startswith(path + '::'))
+        elif path.startswith('utils/') and path.endswith('.py'):
+            symbols = changed_symbols(path, lines)
+            if symbols is not None and not all(_owner_class(symbol) in recorded_classes for symbol in symbols):
+                symbols = None
+            for nodeid in nodeids:
+                entry = impact_map.tests.get(nodeid)
+                if entry is None:
+                    continue
+                if symbols is None:
+                    hit = path in entry['modules']
+                else:
+                    hit = any(symbol in entry['classes'] or symbol in entry['locators'] for symbol in symbols)
+                if hit:
+                    selected.add(nodeid)
+        elif path.endswith('.md'):
+            continue
+        else:
+            return list(nodeids), f"cambió {path}, que no está en el mapa"
+
+    # Los tests que el mapa todavía no conoce se ejecutan siempre
+    selected.update(nodeid for nodeid in nodeids if nodeid not in impact_map.tests)
+    return [nodeid for nodeid in nodeids if nodeid in selected], f"{len(changes)} archivos cambiados"
@@ -2,7 +2,7 @@
 
 from selenium.webdriver.common.by import By
 from utils.base_page import BasePage
-import logging
+from utils.log_config import timed_step
 
 class InventoryPage(BasePage):
     """
@@ -29,6 +29,26 @@ class InventoryPage(BasePage):
     CART_BADGE = (By.CLASS_NAME, "shopping_cart_badge")
     CART_ICON = (By.CLASS_NAME, "shopping_cart_link")
 
+    # Lee todo el catálogo en una sola llamada (null si el inventario aún no cargó)
+    CATALOG_SCRIPT = """
+        if (!document.getElementById('inventory_container')) { return null; }
+        var text = function (root, selector) {
+            var node = root.querySelector(selector);
+            return node ? node.innerText.trim() : null;
+        };
+        return Array.prototype.map.call(document.querySelectorAll('.inventory_item'), function (item) {
+            var button = item.querySelector('button');
+            return {
+                name: text(item, '.inventory_item_name'),
+                price: text(item, '.inventory_item_price'),
+                description: text(item, '.inventory_item_desc'),
+                button_id: button ? button.id : null,
+                button_text: button ? button.innerText.trim() : null,
+                in_cart: button ? button.id.indexOf('remove-') === 0 : false
+            };
+        });
+    """
+
     # --- Métodos de Interacción ---
 
     def is_inventory_visible(self):
@@ -39,46 +59,56 @@ class InventoryPage(BasePage):
             element = self.wait_for_visibility(self.TITLE_INVENTORY)
             return element.text == "Products"
         except Exception:
-            logging.error("No se pudo verificar la visibilidad del inventario.")
+            self.log.error("No se pudo verificar la visibilidad del inventario.")
             return False
 
+    def get_catalog(self):
+        """
+        Retorna todos los productos del inventario en un único round trip, como
+        lista de diccionarios con 'name', 'price', 'description', 'button_id',
+        'button_text' e 'in_cart'.
+        """
+        return self.read_batch(self.CATALOG_SCRIPT, self.INVENTORY_CONTAINER)
+
     def get_first_product_details(self):
         """
         Obtiene el nombre y precio del primer producto listado.
         """
-        logging.info("Obteniendo detalles del primer producto.")
-        
-        # El método find_element ya usa self.wait.until(EC.presence_of_element_located)
-        name_element = self.find_element(self.FIRST_PRODUCT_NAME)
-        price_element = self.find_element(self.FIRST_PRODUCT_PRICE)
+        self.log.info("Obteniendo detalles del primer producto.")
         
+        # Una sola llamada al navegador en lugar de buscar nombre y precio por separado
+        catalogo = self.get_catalog()
+        assert catalogo, "ERROR: El inventario no lista ningún producto."
+        primer_producto = catalogo[0]
+
         return {
-            'nombre': name_element.text,
-            'precio': price_element.text
+            'nombre': primer_producto['name'],
+            'precio': primer_producto['price']
         }
 
     def add_two_items_to_cart(self):
         """
         Añade la Mochila y la Linterna al carrito y retorna el contador (badge).
         """
-        logging.info("Añadiendo dos productos al carrito.")
+        self.log.info("Añadiendo dos productos al carrito.")
 
-        # 1. Añadir el primer producto
-        self.find_element(self.ADD_TO_CART_BACKPACK).click()
+        with timed_step(self.log, "add_two_items_to_cart"):
+            # 1. Añadir el primer producto
+            self.find_element(self.ADD_TO_CART_BACKPACK).click()
 
-        # 2. Añadir el segundo producto
-        self.find_element(self.ADD_TO_CART_BIKE_LIGHT).click()
+            # 2. Añadir el segundo producto
+            self.find_element(self.ADD_TO_CART_BIKE_LIGHT).click()
 
-        # 3. Obtener el texto del contador del carrito. 
-        # CORRECCIÓN 2: Eliminación de 'timeout=2' para evitar el TypeError
-        self.wait_for_visibility(self.CART_BADGE)
-        
-        badge_element = self.find_element(self.CART_BADGE)
-        return badge_element.text
+            # 3. Obtener el texto del contador del carrito. 
+            # CORRECCIÓN 2: Eliminación de 'timeout=2' para evitar el TypeError
+            self.wait_for_visibility(self.CART_BADGE)
+            
+            badge_element = self.find_element(self.CART_BADGE)
+            return badge_element.text
         
     def go_to_cart(self):
         """
         Navega a la página del carrito de compras.
         """
-        logging.info("Navegando al carrito de compras.")
+        self.log.info("Navegando al carrito de compras.")
         self.click_element(self.CART_ICON)
\ No newline at end of file
@@ -0,0 +1,290 @@
+# utils/load_runner.py
+
+import os
+import sys
+import json
+import math
+import time
+import random
+import asyncio
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.api_client import ApiClient
+from utils.api_scenarios import SCENARIOS
+from utils.api_stub import ApiStubServer, PostsApi, StubConfig, mount_stub, INPROCESS_BASE_URL
+from utils.log_config import get_logger
+
+logger = get_logger('api')
+
+# ====================================================================
+# --- MODO CARGA: ESCENARIOS DE test_api.py CONCURRENTES CON ASYNCIO ---
+# ====================================================================
+
+DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'load_config.json')
+
+# Métricas que admite 'slo' (un máximo por escenario o para 'all')
+SLO_METRICS = ('p50_ms', 'p95_ms', 'p99_ms', 'max_error_rate')
+
+
+def load_config(path=DEFAULT_CONFIG_PATH):
+    """Lee la configuración de carga (workload, duración, concurrencia y SLOs)."""
+    with open(path, 'r', encoding='utf-8') as file:
+        config = json.load(file)
+    unknown = set(config['workload']) - set(SCENARIOS)
+    if unknown:
+        raise ValueError(f"Escenarios desconocidos en el workload: {sorted(unknown)}")
+    _validate_slo(config.get('slo', {}))
+    return config
+
+
+def _validate_slo(slo):
+    unknown = sorted({metric for thresholds in slo.values() for metric in thresholds} - set(SLO_METRICS))
+    if unknown:
+        raise ValueError(f"Métricas de SLO desconocidas: {unknown}. Opciones: {list(SLO_METRICS)}")
+
+
+def percentile(sorted_values, fraction):
+    """Percentil por rango más cercano sobre una lista ya ordenada."""
+    if not sorted_values:
+        return None
+    index = max(math.ceil(fraction * len(sorted_values)) - 1, 0)
+    return sorted_values[index]
+
+
+class LoadResult:
+    """Latencias y errores por escenario de una corrida de carga."""
+
+    def __init__(self):
+        self.latencies = {}
+        self.errors = {}
+        self.elapsed = 0.0
+
+    def add(self, scenario, latency_ms, error=None):
+        self.latencies.setdefault(scenario, []).append(latency_ms)
+        if error:
+            by_kind = self.errors.setdefault(scenario, {})
+            by_kind[error] = by_kind.get(error, 0) + 1
+
+    def summary(self):
+        """Throughput, percentiles y errores por escenario y para el total ('all')."""
+        groups = dict(self.latencies)
+        groups['all'] = [latency for values in self.latencies.values() for latency in values]
+        summary = {}
+        for name, values in groups.items():
+            values = sorted(values)
+            if name == 'all':
+                errors = {}
+                for by_kind in self.errors.values():
+                    for kind, count in by_kind.items():
+                        errors[kind] = errors.get(kind, 0) + count
+            else:
+                errors = self.errors.get(name, {})
+            error_count = sum(errors.values())
+            summary[name] = {
+                'requests': len(values),
+                'throughput_rps': len(values) / self.elapsed if self.elapsed else 0.0,
+                'p50_ms': percentile(values, 0.50),
+                'p95_ms': percentile(values, 0.95),
+                'p99_ms': percentile(values, 0.99),
+                'error_rate': error_count / len(values) if values else 0.0,
+                'errors': errors,
+            }
+        return summary
+
+
+def check_slo(summary, slo):
+    """
+    Compara el resumen con los umbrales del config. 'slo' se indexa por
+    escenario o 'all', por ejemplo {"all": {"p95_ms": 800, "max_error_rate": 0.01}}.
+    Retorna la lista de violaciones (vacía si se cumplen todos). Lanza
+    ValueError si alguna métrica no está en SLO_METRICS.
+    """
+    _validate_slo(slo)
+    violations = []
+    for name, thresholds in slo.items():
+        stats = summary.get(name)
+        if stats is None or not stats['requests']:
+            continue
+        for metric, limit in thresholds.items():
+            if metric == 'max_error_rate':
+                value = stats['error_rate']
+            else:
+                value = stats[metric]
+            if value is not None and value > limit:
+                violations.append(f"{name}: {metric}={value:.2f} supera el umbral {limit}")
+    return violations
+
+
+def _describe_error(exc):
+    if isinstance(exc, AssertionError):
+        return f"assert: {str(exc).splitlines()[0]}"
+    return type(exc).__name__
+
+
+def _execute(client, scenario):
+    """Envía y valida un escenario en un hilo del executor. Retorna (latencia_ms, error)."""
+    start = time.perf_counter()
+    try:
+        response = scenario.send(client)
+        latency_ms = (time.perf_counter() - start) * 1000
+    except Exception as e:
+        return (time.perf_counter() - start) * 1000, _describe_error(e)
+    try:
+        scenario.validate(response)
+    except Exception as e:
+        return latency_ms, (f"status {response.status_code}" if response.status_code >= 400 else _describe_error(e))
+    return latency_ms, None
+
+
+async def run_load(client_factory, workload, duration_s, concurrency, rate_per_s=None, seed=None):
+    """
+    Reproduce los escenarios según sus pesos durante 'duration_s' segundos.
+    Sin 'rate_per_s' corre en lazo cerrado con 'concurrency' usuarios virtuales;
+    con 'rate_per_s' lanza requests a tasa fija (lazo abierto), limitando los
+    requests en vuelo a 'concurrency'. En ese modo la latencia se mide desde el
+    instante programado, para no ocultar el tiempo en cola.
+
+    asyncio solo planifica: cada request (bloqueante, con requests) corre en un
+    ThreadPoolExecutor del tamaño de la concurrencia. requests.Session no es
+    segura entre hilos, así que cada hilo crea su propio cliente con
+    'client_factory' la primera vez que lo usa; al terminar se cierran todos.
+    """
+    chooser = random.Random(seed)
+    names = list(workload)
+    weights = [workload[name] for name in names]
+    result = LoadResult()
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="load")
+    thread_state = threading.local()
+    clients = []
+
+    def execute_in_thread(scenario):
+        client = getattr(thread_state, 'client', None)
+        if client is None:
+            client = thread_state.client = client_factory()
+            clients.append(client)
+        return _execute(client, scenario)
+
+    async def one_request(scheduled=None):
+        scenario = SCENARIOS[chooser.choices(names, weights)[0]]
+        latency_ms, error = await loop.run_in_executor(executor, execute_in_thread, scenario)
+        if scheduled is not None:
+            latency_ms = (time.perf_counter() - scheduled) * 1000
+        result.add(scenario.name, latency_ms, error)
+
+    start = time.perf_counter()
+    deadline = start + duration_s
+    try:
+        if rate_per_s:
+            semaphore = asyncio.Semaphore(concurrency)
+            tasks = []
+
+            async def throttled(scheduled):
+                async with semaphore:
+                    await one_request(scheduled)
+
+            interval = 1.0 / rate_per_s
+            next_at = start
+            while next_at < deadline:
+                await asyncio.sleep(max(next_at - time.perf_counter(), 0))
+                tasks.append(asyncio.ensure_future(throttled(next_at)))
+                next_at += interval
+            await asyncio.gather(*tasks)
+        else:
+            async def virtual_user():
+                while time.perf_counter() < deadline:
+                    await one_request()
+
+            await asyncio.gather(*(virtual_user() for _ in range(concurrency)))
+    finally:
+        result.elapsed = time.perf_counter() - start
+        executor.shutdown(wait=True)
+        for client in clients:
+            client.close()
+    return result
+
+
+def build_client(base_url, stub_api=None):
+    """
+    ApiClient de un hilo de carga: sin reintentos (los errores deben verse) y
+    con una sola conexión. En modo 'inprocess' monta 'stub_api', compartido por
+    todos los hilos para que los escenarios vean el mismo estado y la misma
+    latencia y errores inyectados.
+    """
+    client = ApiClient(base_url, retries=0, pool_maxsize=1)
+    if base_url == INPROCESS_BASE_URL:
+        mount_stub(client.session, base_url=base_url, api=stub_api)
+    return client
+
+
+def run_from_config(base_url, config, stub_config=None):
+    """
+    Ejecuta la carga descrita en el config y retorna (resumen, violaciones de SLO).
+    'stub_config' (StubConfig) configura el stub en modo 'inprocess'.
+    """
+    stub_api = PostsApi(stub_config) if base_url == INPROCESS_BASE_URL else None
+    result = asyncio.run(run_load(
+        lambda: build_client(base_url, stub_api),
+        config['workload'],
+        config['duration_s'],
+        config.get('concurrency', 1),
+        rate_per_s=config.get('rate_per_s'),
+        seed=config.get('seed'),
+    ))
+    summary = result.summary()
+    return summary, check_slo(summary, config.get('slo', {}))
+
+
+def format_summary(summary):
+    """Tabla de texto con los resultados por escenario."""
+    lines = [f"{'escenario':<14}{'requests':>9}{'rps':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'errores':>9}"]
+    for name, stats in sorted(summary.items(), key=lambda item: item[0] == 'all'):
+        lines.append(
+            f"{name:<14}{stats['requests']:>9}{stats['throughput_rps']:>9.1f}"
+            f"{stats['p50_ms'] or 0:>9.1f}{stats['p95_ms'] or 0:>9.1f}{stats['p99_ms'] or 0:>9.1f}"
+            f"{stats['error_rate']:>9.1%}"
+        )
+        for kind, count in stats['errors'].items():
+            lines.append(f"{'':<14}  {count} x {kind}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Modo carga de los escenarios de test_api.py")
+    parser.add_argument("--base-url", default="https://jsonplaceholder.typicode.com",
+                        help="URL de la API; 'stub' levanta el stub local e 'inprocess' lo monta sin sockets.")
+    parser.add_argument("--config", default=DEFAULT_CONFIG_PATH, help="Archivo JSON con workload y SLOs.")
+    parser.add_argument("--duration", type=float, help="Sobrescribe duration_s del config.")
+    parser.add_argument("--concurrency", type=int, help="Sobrescribe concurrency del config.")
+    parser.add_argument("--rate", type=float, help="Sobrescribe rate_per_s del config.")
+    parser.add_argument("--stub-latency", type=float, default=0.0, help="Latencia del stub en ms ('stub' e 'inprocess').")
+    parser.add_argument("--stub-error-rate", type=float, default=0.0, help="Tasa de errores 500 del stub (0 a 1).")
+    parser.add_argument("--stub-payload-size", type=int, default=0, help="Bytes de relleno por post del stub.")
+    args = parser.parse_args(argv)
+    stub_config = StubConfig(
+        latency=args.stub_latency / 1000, error_rate=args.stub_error_rate, payload_size=args.stub_payload_size,
+    )
+
+    config = load_config(args.config)
+    for key, value in (('duration_s', args.duration), ('concurrency', args.concurrency), ('rate_per_s', args.rate)):
+        if value is not None:
+            config[key] = value
+
+    if args.base_url == "stub":
+        with ApiStubServer(stub_config) as server:
+            summary, violations = run_from_config(server.base_url, config)
+    elif args.base_url == "inprocess":
+        summary, violations = run_from_config(INPROCESS_BASE_URL, config, stub_config)
+    else:
+        summary, violations = run_from_config(args.base_url, config)
+
+    print(format_summary(summary))
+    for violation in violations:
+        logger.error("SLO incumplido: %s", violation)
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+# utils/local_server.py
+
+import os
+import threading
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+from utils.log_config import get_logger
+
+logger = get_logger('framework')
+
+# ====================================================================
+# --- SERVIDOR LOCAL CON LA RÉPLICA DE SAUCE DEMO ---
+# ====================================================================
+
+LOCAL_SITE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'saucedemo_local')
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    """Sirve archivos estáticos sin escribir cada request en la consola."""
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalSiteServer:
+    """
+    Servidor HTTP en el mismo proceso (un hilo por request) que sirve la
+    réplica estática de Sauce Demo en un puerto efímero de 127.0.0.1.
+    """
+
+    def __init__(self, directory=LOCAL_SITE_DIR, host="127.0.0.1", port=0):
+        handler = partial(_QuietHandler, directory=directory)
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="local-saucedemo", daemon=True)
+        self._thread.start()
+        logger.info("Réplica local de Sauce Demo disponible en %s", self.base_url)
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
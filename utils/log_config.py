@@ -0,0 +1,182 @@
+# utils/log_config.py
+
+import os
+import copy
+import json
+import time
+import queue
+import logging
+import logging.handlers
+from contextlib import contextmanager
+
+from utils.parallel import artifact_dir, worker_id
+
+# ====================================================================
+# --- LOGGING DEL FRAMEWORK (por categoría, en cola y con sink JSONL) ---
+# ====================================================================
+
+# Cada módulo usa el logger de su categoría ('saucedemo.<categoría>') con
+# formato diferido ("%s"): si el nivel de la categoría descarta el mensaje, no
+# se arma el texto. La configuración se hace una sola vez desde conftest:
+# - un QueueHandler en 'saucedemo' que solo encola (el test nunca espera I/O),
+# - un QueueListener en un hilo de fondo que escribe el JSONL del worker.
+# Los registros se propagan al logger raíz, así que pytest los sigue
+# capturando y mostrando con los fallos (y en vivo con --log-cli-level).
+
+ROOT_LOGGER = 'saucedemo'
+
+CATEGORIES = {
+    'pages': "Page Objects y sesión (acciones, esperas y errores de la UI)",
+    'driver': "Creación, pool y resolución del WebDriver",
+    'network': "Control de red y HAR",
+    'api': "ApiClient, stub de la API y modo carga",
+    'artifacts': "Capturas, almacén de artefactos y trazas",
+    'timing': "Tiempos de página, benchmarks y planificación",
+    'data': "Datos de prueba",
+    'framework': "Resto del framework (servidores locales, selección por impacto)",
+    'tests': "Los propios tests y fixtures",
+}
+
+DEFAULT_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
+
+# Contexto del test en curso (lo fija conftest al empezar cada test)
+_context = {'test': None}
+_listener = None
+
+
+def get_logger(category):
+    """Logger de una categoría del framework, por ejemplo get_logger('pages')."""
+    if category not in CATEGORIES:
+        raise ValueError(f"Categoría de log desconocida: {category}. Opciones: {sorted(CATEGORIES)}")
+    return logging.getLogger(f"{ROOT_LOGGER}.{category}")
+
+
+class _PageAdapter(logging.LoggerAdapter):
+    """Agrega el Page Object sin descartar el 'extra' de cada llamada (ver timed_step)."""
+
+    def process(self, msg, kwargs):
+        kwargs['extra'] = {**self.extra, **(kwargs.get('extra') or {})}
+        return msg, kwargs
+
+
+def page_logger(page):
+    """Logger de 'pages' que agrega el nombre del Page Object a cada registro."""
+    return _PageAdapter(get_logger('pages'), {'page': type(page).__name__})
+
+
+def set_test_context(test):
+    """Test en curso (nodeid) que se adjunta a cada registro; None al terminar."""
+    _context['test'] = test
+
+
+def parse_levels(spec):
+    """'pages=DEBUG,api=WARNING' -> {'pages': 'DEBUG', 'api': 'WARNING'} (valida categoría y nivel)."""
+    levels = {}
+    for item in filter(None, (part.strip() for part in (spec or "").split(","))):
+        category, _, level = item.partition("=")
+        level = level.strip().upper()
+        if category not in CATEGORIES or not isinstance(logging.getLevelName(level), int):
+            raise ValueError(f"Nivel de log inválido '{item}': se espera categoría=NIVEL, con categoría en {sorted(CATEGORIES)}.")
+        levels[category] = level
+    return levels
+
+
+@contextmanager
+def timed_step(logger, step, level=logging.DEBUG):
+    """Registra la duración de un paso en el campo 'duration_ms' (solo si el nivel está activo)."""
+    if not logger.isEnabledFor(level):
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration_ms = round((time.perf_counter() - start) * 1000, 1)
+        logger.log(level, "Paso %s: %.1f ms", step, duration_ms, extra={'step': step, 'duration_ms': duration_ms})
+
+
+class _ContextFilter(logging.Filter):
+    """Agrega test y worker en el hilo que emite (el listener no conoce el test en curso)."""
+
+    def filter(self, record):
+        if not hasattr(record, 'test'):
+            record.test = _context['test']
+        record.worker = worker_id()
+        return True
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    Como el QueueHandler estándar, pero conserva la excepción como texto
+    aparte para el sink JSONL en lugar de mezclarla con el mensaje.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg, record.args, record.exc_info = record.message, None, None
+        return record
+
+
+class JsonLineFormatter(logging.Formatter):
+    """Un objeto JSON por línea con los campos estructurados del framework."""
+
+    FIELDS = ('test', 'worker', 'page', 'step', 'duration_ms')
+
+    def format(self, record):
+        data = {
+            'ts': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(record.created)) + f".{int(record.msecs):03d}",
+            'level': record.levelname,
+            'category': record.name[len(ROOT_LOGGER) + 1:] or ROOT_LOGGER,
+            'message': record.getMessage(),
+        }
+        for field in self.FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                data[field] = value
+        if record.exc_text:
+            data['exception'] = record.exc_text
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+def configure_logging(levels=None, default_level=DEFAULT_LEVEL, jsonl_run_id=None):
+    """
+    Configura los niveles por categoría y, si se indica un run_id, el sink
+    JSONL en reports/logs/<worker>/framework_<run_id>.jsonl. Es idempotente:
+    una segunda llamada reemplaza la configuración anterior.
+    """
+    shutdown_logging()
+    root = logging.getLogger(ROOT_LOGGER)
+    root.setLevel(default_level.upper())
+    for category in CATEGORIES:
+        get_logger(category).setLevel((levels or {}).get(category, logging.NOTSET))
+
+    if jsonl_run_id is None:
+        return None
+    global _listener
+    path = os.path.join(artifact_dir('logs'), f"framework_{jsonl_run_id}.jsonl")
+    sink = logging.FileHandler(path, encoding='utf-8', delay=True)
+    sink.setFormatter(JsonLineFormatter())
+    records = queue.SimpleQueue()
+    handler = _QueueHandler(records)
+    handler.addFilter(_ContextFilter())
+    root.addHandler(handler)
+    _listener = logging.handlers.QueueListener(records, sink, respect_handler_level=True)
+    _listener.start()
+    return path
+
+
+def shutdown_logging():
+    """Vacía la cola, detiene el hilo de escritura y quita los handlers del framework."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+    root = logging.getLogger(ROOT_LOGGER)
+    for handler in list(root.handlers):
+        if isinstance(handler, _QueueHandler):
+            root.removeHandler(handler)
@@ -1,12 +1,11 @@
 # utils/login_page.py
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-import logging
 
 # Se asume que BasePage está en utils.base_page
 from utils.base_page import BasePage 
+from utils.log_config import timed_step
 
 class LoginPage(BasePage):
     """
@@ -22,6 +21,8 @@ class LoginPage(BasePage):
     
     # Locator para el mensaje de error (usado en Test 04)
     ERROR_MESSAGE = (By.CSS_SELECTOR, "h3[data-test='error']") 
+    # El mensaje aparece de inmediato tras el clic: no hace falta el timeout completo
+    ERROR_MESSAGE_TIMEOUT = 5
     
     # Locator para verificar la carga de la página de inventario (usado en espera)
     INVENTORY_CONTAINER = (By.ID, "inventory_container") 
@@ -32,10 +33,12 @@ class LoginPage(BasePage):
         """
         Realiza la acción de login con las credenciales proporcionadas.
         """
-        logging.info(f"Intentando login con usuario: {username}")
-        self.find_element(self.USERNAME_INPUT).send_keys(username)
-        self.find_element(self.PASSWORD_INPUT).send_keys(password)
-        self.click_element(self.LOGIN_BUTTON)
+        self.log.info("Intentando login con usuario: %s", username)
+        with timed_step(self.log, "login"):
+            self.fill_form(
+                {self.USERNAME_INPUT: username, self.PASSWORD_INPUT: password},
+                submit=self.LOGIN_BUTTON,
+            )
         # La verificación de éxito o fallo se deja a la capa de test.
         
     def get_error_message(self):
@@ -45,11 +48,11 @@ class LoginPage(BasePage):
         """
         # Espera que el mensaje de error sea visible y luego obtiene su texto
         try:
-            error_element = self.wait_for_visibility(self.ERROR_MESSAGE)
-            logging.warning("Mensaje de error detectado.")
+            error_element = self.wait_for_visibility(self.ERROR_MESSAGE, timeout=self.ERROR_MESSAGE_TIMEOUT)
+            self.log.warning("Mensaje de error detectado.")
             return error_element.text
         except TimeoutException:
-            logging.error("No se encontró el mensaje de error tras el login fallido.")
+            self.log.error("No se encontró el mensaje de error tras el login fallido.")
             # Si no lo encuentra, lanza una excepción para fallar el test
             raise
 
@@ -58,12 +61,12 @@ class LoginPage(BasePage):
         [CORRECCIÓN para Tests 02, 05]
         Espera explícitamente a que la página de inventario cargue después de un login exitoso.
         """
-        logging.info("Esperando la carga de la página de inventario...")
+        self.log.info("Esperando la carga de la página de inventario...")
         try:
             # Espera a que el contenedor principal del inventario esté presente en el DOM
-            self.wait.until(EC.presence_of_element_located(self.INVENTORY_CONTAINER))
-            logging.info("Página de inventario cargada.")
+            self.find_element(self.INVENTORY_CONTAINER)
+            self.log.info("Página de inventario cargada.")
             return True
         except TimeoutException:
-            logging.error("Tiempo de espera agotado: Fallo al cargar la página de inventario después del login.")
+            self.log.error("Tiempo de espera agotado: Fallo al cargar la página de inventario después del login.")
             return False
\ No newline at end of file
@@ -0,0 +1,250 @@
+# utils/network.py
+
+import os
+import json
+from datetime import datetime, timezone
+
+from utils.log_config import get_logger
+from utils.parallel import artifact_dir
+
+logger = get_logger('network')
+
+# ====================================================================
+# --- CONTROL DE RED VÍA DEVTOOLS (bloqueo, throttling y HAR) ---
+# ====================================================================
+
+# setup_driver() aplica esta configuración a cada Chrome que crea:
+# - bloqueo de URLs por patrón (comodín '*', como en Network.setBlockedURLs) y
+#   por tipo de recurso (imágenes, fuentes, media, hojas de estilo),
+# - throttling opcional para emular enlaces lentos,
+# - registro HAR de los requests de cada test, armado a partir del log de
+#   rendimiento de Chrome (eventos Network.* de DevTools).
+
+# Los valores de las variables de entorno se aplican (y validan) con
+# configure_network() al final de esta sección
+NETWORK_SETTINGS = {'block_patterns': [], 'block_types': [], 'throttle': None, 'har': False}
+
+# Network.setBlockedURLs solo acepta patrones de URL; bloquear por tipo de
+# recurso con el dominio Fetch requiere escuchar eventos, que execute_cdp_cmd no
+# permite. Cada tipo se traduce a los patrones de sus extensiones habituales.
+RESOURCE_TYPE_PATTERNS = {
+    'image': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.webp', '*.ico'],
+    'font': ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot'],
+    'media': ['*.mp4', '*.webm', '*.ogg', '*.mp3', '*.wav'],
+    'stylesheet': ['*.css'],
+}
+
+# Perfiles de throttling de las DevTools de Chrome (latencia en ms, throughput en bytes/s)
+THROTTLE_PROFILES = {
+    'slow-3g': {'latency': 2000, 'downloadThroughput': 500 * 1000 / 8 * 0.8, 'uploadThroughput': 500 * 1000 / 8 * 0.8},
+    'fast-3g': {'latency': 562.5, 'downloadThroughput': 1.6 * 1000 * 1000 / 8 * 0.9, 'uploadThroughput': 750 * 1000 / 8 * 0.9},
+    'dsl': {'latency': 5, 'downloadThroughput': 2 * 1000 * 1000 / 8, 'uploadThroughput': 1 * 1000 * 1000 / 8},
+}
+
+
+def configure_network(block_patterns=None, block_types=None, throttle=None, har=None):
+    """Ajusta la configuración de red de los próximos drivers (None conserva el valor actual)."""
+    if block_types is not None:
+        unknown = set(block_types) - set(RESOURCE_TYPE_PATTERNS)
+        if unknown:
+            raise ValueError(f"Tipos de recurso desconocidos: {sorted(unknown)}. Opciones: {sorted(RESOURCE_TYPE_PATTERNS)}")
+        NETWORK_SETTINGS['block_types'] = list(block_types)
+    if throttle is not None:
+        if throttle != 'none' and throttle not in THROTTLE_PROFILES:
+            raise ValueError(f"Perfil de throttling desconocido: {throttle}. Opciones: {sorted(THROTTLE_PROFILES)}")
+        NETWORK_SETTINGS['throttle'] = None if throttle == 'none' else throttle
+    if block_patterns is not None:
+        NETWORK_SETTINGS['block_patterns'] = list(block_patterns)
+    if har is not None:
+        NETWORK_SETTINGS['har'] = bool(har)
+
+
+# Un valor inválido en el entorno falla al importar, con el mismo mensaje que la opción de pytest
+configure_network(
+    block_patterns=[p for p in os.environ.get("NETWORK_BLOCK", "").split(",") if p],
+    block_types=[t for t in os.environ.get("NETWORK_BLOCK_TYPES", "").split(",") if t],
+    throttle=os.environ.get("NETWORK_THROTTLE") or None,
+    har=os.environ.get("NETWORK_HAR", "0") == "1",
+)
+
+
+def blocked_url_patterns():
+    """Patrones efectivos a bloquear (los explícitos más los de los tipos de recurso)."""
+    patterns = list(NETWORK_SETTINGS['block_patterns'])
+    for resource_type in NETWORK_SETTINGS['block_types']:
+        patterns.extend(RESOURCE_TYPE_PATTERNS[resource_type])
+    return patterns
+
+
+def configure_options(options):
+    """Con HAR activo, pide a Chrome el log de rendimiento (eventos Network.*)."""
+    if NETWORK_SETTINGS['har']:
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    return options
+
+
+def apply_network_control(driver):
+    """Aplica bloqueo y throttling al driver recién creado vía DevTools."""
+    patterns = blocked_url_patterns()
+    throttle = NETWORK_SETTINGS['throttle']
+    if not patterns and not throttle:
+        return
+    driver.execute_cdp_cmd('Network.enable', {})
+    if patterns:
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+    if throttle:
+        driver.execute_cdp_cmd('Network.emulateNetworkConditions', dict(THROTTLE_PROFILES[throttle], offline=False))
+    logger.info("Control de red activo: %d patrones bloqueados, throttling: %s.", len(patterns), throttle or 'no')
+
+
+# ====================================================================
+# --- HAR A PARTIR DEL LOG DE RENDIMIENTO ---
+# ====================================================================
+
+def _iso(wall_time):
+    return datetime.fromtimestamp(wall_time, tz=timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+def _span(timing, start, end):
+    """Duración de una fase de Resource Timing de DevTools (-1 si no ocurrió)."""
+    if timing.get(start, -1) < 0 or timing.get(end, -1) < 0:
+        return -1
+    return round(timing[end] - timing[start], 3)
+
+
+def _entry(request):
+    """Entrada HAR de un request con sus eventos de DevTools ya agrupados."""
+    response = request.get('response') or {}
+    timing = response.get('timing') or {}
+    end = request.get('end', request['start'])
+    total_ms = round((end - request['start']) * 1000, 3)
+
+    timings = {'blocked': -1, 'dns': -1, 'connect': -1, 'ssl': -1, 'send': 0, 'wait': 0, 'receive': 0}
+    if timing:
+        first = next((timing[key] for key in ('dnsStart', 'connectStart', 'sendStart') if timing.get(key, -1) >= 0), 0)
+        headers_end = timing.get('receiveHeadersEnd', 0)
+        timings.update(
+            blocked=round(first, 3),
+            dns=_span(timing, 'dnsStart', 'dnsEnd'),
+            connect=_span(timing, 'connectStart', 'connectEnd'),
+            ssl=_span(timing, 'sslStart', 'sslEnd'),
+            send=max(_span(timing, 'sendStart', 'sendEnd'), 0),
+            wait=max(round(headers_end - timing.get('sendEnd', 0), 3), 0),
+            receive=max(round((end - timing['requestTime']) * 1000 - headers_end, 3), 0),
+        )
+
+    entry = {
+        'startedDateTime': _iso(request['wall_time']),
+        'time': total_ms,
+        'request': {
+            'method': request['method'], 'url': request['url'], 'httpVersion': response.get('protocol', ''),
+            'headers': [], 'queryString': [], 'cookies': [], 'headersSize': -1, 'bodySize': -1,
+        },
+        'response': {
+            'status': response.get('status', 0), 'statusText': response.get('statusText', ''),
+            'httpVersion': response.get('protocol', ''), 'headers': [], 'cookies': [],
+            'content': {'size': -1, 'mimeType': response.get('mimeType', '')},
+            'redirectURL': '', 'headersSize': -1, 'bodySize': -1,
+            '_transferSize': request.get('bytes', 0),
+        },
+        'cache': {},
+        'timings': timings,
+        '_resourceType': request.get('type', 'Other'),
+    }
+    if 'error' in request:
+        entry['_error'] = request['error']
+    if request.get('blocked'):
+        entry['_blocked'] = request['blocked']
+    return entry
+
+
+def build_har(log_entries, page_id="page_1", title=""):
+    """
+    Arma un HAR 1.2 a partir de las entradas de driver.get_log('performance').
+    Cada request junta requestWillBeSent, responseReceived y loadingFinished
+    (bytes transferidos y fin) o loadingFailed (error, bloqueo).
+    """
+    requests = {}
+    order = []
+    for log_entry in log_entries:
+        message = json.loads(log_entry['message'])['message']
+        method, params = message.get('method', ''), message.get('params', {})
+        if not method.startswith('Network.'):
+            continue
+        request = requests.get(params.get('requestId'))
+        if method == 'Network.requestWillBeSent':
+            if request is None:
+                request = requests[params['requestId']] = {}
+                order.append(params['requestId'])
+            # Ante una redirección se reemplaza el request por el último destino
+            request.update(
+                url=params['request']['url'], method=params['request']['method'],
+                start=params['timestamp'], wall_time=params['wallTime'], type=params.get('type', 'Other'),
+            )
+        elif request is None:
+            continue
+        elif method == 'Network.responseReceived':
+            request['response'] = params['response']
+        elif method == 'Network.loadingFinished':
+            request['end'] = params['timestamp']
+            request['bytes'] = int(params.get('encodedDataLength', 0))
+        elif method == 'Network.loadingFailed':
+            request['end'] = params['timestamp']
+            request['error'] = params.get('errorText', '')
+            request['blocked'] = params.get('blockedReason')
+
+    entries = [_entry(requests[request_id]) for request_id in order if 'url' in requests[request_id]]
+    for entry in entries:
+        entry['pageref'] = page_id
+    pages = []
+    if entries:
+        pages.append({'id': page_id, 'title': title or page_id,
+                      'startedDateTime': entries[0]['startedDateTime'], 'pageTimings': {}})
+    return {'log': {'version': '1.2', 'creator': {'name': 'saucedemo-framework', 'version': '1.0'},
+                    'pages': pages, 'entries': entries}}
+
+
+def summarize_har(har):
+    """Totales de un HAR: requests, bloqueados, fallidos, bytes transferidos y requests por tipo."""
+    entries = har['log']['entries']
+    by_type = {}
+    for entry in entries:
+        by_type[entry['_resourceType']] = by_type.get(entry['_resourceType'], 0) + 1
+    return {
+        'requests': len(entries),
+        'blocked': sum(1 for entry in entries if entry.get('_blocked')),
+        'failed': sum(1 for entry in entries if '_error' in entry and not entry.get('_blocked')),
+        'bytes': sum(entry['response']['_transferSize'] for entry in entries),
+        'time_ms': round(max((entry['time'] for entry in entries), default=0), 1),
+        'by_type': by_type,
+    }
+
+
+class NetworkRecorder:
+    """HAR por test a partir del log de rendimiento del driver (solo con HAR activo)."""
+
+    def __init__(self):
+        self.summaries = []
+
+    def begin_test(self, driver):
+        """Descarta los eventos acumulados (por ejemplo, del test anterior en un driver del pool)."""
+        if NETWORK_SETTINGS['har']:
+            driver.get_log('performance')
+
+    def write_har(self, driver, test, run_id):
+        """Escribe el HAR del test en reports/har/<worker>/. Retorna (ruta, resumen) o (None, None)."""
+        if not NETWORK_SETTINGS['har']:
+            return None, None
+        har = build_har(driver.get_log('performance'), page_id=test, title=test)
+        if not har['log']['entries']:
+            return None, None
+        summary = summarize_har(har)
+        self.summaries.append(summary)
+        safe_name = test.replace("::", "_").replace("/", "_")
+        path = os.path.join(artifact_dir('har'), f"{safe_name}_{run_id}.har")
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(har, file)
+        return path, summary
+
+
+NETWORK_RECORDER = NetworkRecorder()
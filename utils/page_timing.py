@@ -0,0 +1,203 @@
+# utils/page_timing.py
+
+import os
+import json
+import weakref
+from urllib.parse import urlsplit
+
+from utils.log_config import get_logger
+from utils.parallel import artifact_dir
+
+logger = get_logger('timing')
+
+# ====================================================================
+# --- TIEMPOS DE CARGA DEL NAVEGADOR POR TRANSICIÓN DE PÁGINA ---
+# ====================================================================
+
+# Cada transición (clic que navega, envío de formulario o driver.get) se marca
+# en el navegador antes de la acción y se mide cuando la página siguiente está
+# lista. Hay dos casos:
+# - 'navigation': se cargó un documento nuevo (cambia performance.timeOrigin);
+#   se leen Navigation Timing y Paint Timing del documento nuevo.
+# - 'route': la SPA cambió de URL sin recargar (Sauce Demo usa react-router);
+#   un requestAnimationFrame registra el primer cuadro con la URL nueva.
+# En ambos casos 'transition_ms' va desde la marca hasta que la página nueva
+# está lista, medido con el reloj del navegador (sin la latencia de WebDriver).
+
+TIMING_SETTINGS = {'enabled': os.environ.get("PAGE_TIMING", "0") == "1"}
+
+# Métricas de un registro que se pueden usar en un presupuesto
+TIMING_METRICS = (
+    'transition_ms', 'ttfb_ms', 'dom_interactive_ms', 'dom_content_loaded_ms',
+    'load_ms', 'first_paint_ms', 'first_contentful_paint_ms',
+)
+
+MARK_SCRIPT = """
+    var from = location.href;
+    var state = {start: performance.now(), from: from, end: null};
+    window.__pageTransition = state;
+    var watch = function () {
+        if (window.__pageTransition !== state || performance.now() - state.start > 30000) { return; }
+        if (location.href !== from) { state.end = performance.now(); return; }
+        requestAnimationFrame(watch);
+    };
+    requestAnimationFrame(watch);
+    return {url: from, time_origin: performance.timeOrigin, start: state.start};
+"""
+
+COLLECT_SCRIPT = """
+    var state = window.__pageTransition || null;
+    if (state && state.end === null && location.href !== state.from) { state.end = performance.now(); }
+    var nav = performance.getEntriesByType('navigation')[0];
+    var paint = {};
+    performance.getEntriesByType('paint').forEach(function (entry) { paint[entry.name] = entry.startTime; });
+    return {
+        url: location.href,
+        time_origin: performance.timeOrigin,
+        transition: state ? {start: state.start, end: state.end} : null,
+        navigation: nav ? {
+            ttfb: nav.responseStart,
+            dom_interactive: nav.domInteractive,
+            dom_content_loaded: nav.domContentLoadedEventEnd,
+            load: nav.loadEventEnd,
+            transfer_size: nav.transferSize
+        } : null,
+        paint: paint
+    };
+"""
+
+
+def configure_page_timing(enabled):
+    """Activa o desactiva la medición de tiempos por transición."""
+    TIMING_SETTINGS['enabled'] = bool(enabled)
+
+
+def step_name(url):
+    """Nombre del paso a partir de la URL: 'login', 'inventory', 'cart', 'checkout-step-one', ..."""
+    page = urlsplit(url).path.rstrip('/').rsplit('/', 1)[-1]
+    if not page or page.startswith('index'):
+        return 'login'
+    return page[:-len('.html')] if page.endswith('.html') else page
+
+
+def _ms(value):
+    """Los campos de Navigation Timing valen 0 mientras el evento no ocurrió."""
+    return round(value, 1) if value else None
+
+
+class PageTimings:
+    """
+    Registros de tiempos de la sesión y del test en curso. Las marcas
+    pendientes se guardan por driver (cada driver tiene a lo sumo una
+    transición en curso).
+    """
+
+    def __init__(self):
+        self.records = []
+        self.test_records = []
+        self._pending = weakref.WeakKeyDictionary()
+
+    # --- Medición ---
+
+    def mark(self, driver):
+        """Marca el inicio de una transición; antes cierra la anterior si ya navegó."""
+        if not TIMING_SETTINGS['enabled']:
+            return
+        self.collect(driver)
+        try:
+            self._pending[driver] = driver.execute_script(MARK_SCRIPT)
+        except Exception as e:
+            logger.debug("No se pudo marcar la transición: %s", e)
+
+    def collect(self, driver):
+        """
+        Si hay una transición pendiente y la URL ya cambió, lee los tiempos del
+        navegador y agrega el registro. Retorna el registro o None.
+        """
+        mark = self._pending.get(driver) if TIMING_SETTINGS['enabled'] else None
+        if mark is None:
+            return None
+        try:
+            data = driver.execute_script(COLLECT_SCRIPT)
+        except Exception as e:
+            logger.debug("No se pudieron leer los tiempos de la página: %s", e)
+            return None
+
+        navigated = data['time_origin'] != mark['time_origin']
+        if not navigated and data['url'] == mark['url']:
+            return None  # todavía no navegó: la marca sigue pendiente
+        del self._pending[driver]
+
+        record = {'step': step_name(data['url']), 'from': step_name(mark['url']), 'url': data['url']}
+        if navigated:
+            navigation = data['navigation'] or {}
+            # Ambos relojes se llevan a tiempo absoluto (ms desde epoch) para compararlos
+            ready = navigation.get('dom_content_loaded') or 0
+            record.update({
+                'kind': 'navigation',
+                'transition_ms': _ms(data['time_origin'] + ready - mark['time_origin'] - mark['start']) if ready else None,
+                'ttfb_ms': _ms(navigation.get('ttfb')),
+                'dom_interactive_ms': _ms(navigation.get('dom_interactive')),
+                'dom_content_loaded_ms': _ms(navigation.get('dom_content_loaded')),
+                'load_ms': _ms(navigation.get('load')),
+                'first_paint_ms': _ms(data['paint'].get('first-paint')),
+                'first_contentful_paint_ms': _ms(data['paint'].get('first-contentful-paint')),
+                'transfer_bytes': navigation.get('transfer_size'),
+            })
+        else:
+            transition = data['transition'] or {}
+            end = transition.get('end')
+            record.update({
+                'kind': 'route',
+                'transition_ms': _ms(end - transition['start']) if end is not None else None,
+            })
+        self.records.append(record)
+        self.test_records.append(record)
+        logger.debug("Transición %s -> %s: %s ms (%s)", record['from'], record['step'], record['transition_ms'], record['kind'])
+        return record
+
+    def get(self, driver, url):
+        """driver.get() medido como transición."""
+        self.mark(driver)
+        driver.get(url)
+        self.collect(driver)
+
+    # --- Registros ---
+
+    def begin_test(self):
+        """Reinicia los registros del test en curso."""
+        self.test_records = []
+
+    def last(self, step):
+        """Último registro del test en curso para el paso indicado, o None."""
+        for record in reversed(self.test_records):
+            if record['step'] == step:
+                return record
+        return None
+
+    def assert_budget(self, step, **budgets):
+        """
+        Verifica los presupuestos del último registro del paso en el test en
+        curso, por ejemplo assert_budget('inventory', dom_content_loaded_ms=800).
+        Lanza AssertionError si falta el registro, la métrica o se supera el umbral.
+        """
+        record = self.last(step)
+        assert record is not None, f"No hay tiempos registrados para el paso '{step}' en este test."
+        for metric, limit in budgets.items():
+            assert metric in TIMING_METRICS, f"Métrica desconocida: {metric}. Opciones: {TIMING_METRICS}"
+            value = record.get(metric)
+            assert value is not None, f"El paso '{step}' ({record['kind']}) no tiene la métrica {metric}."
+            assert value <= limit, f"Presupuesto superado en '{step}': {metric}={value} ms > {limit} ms."
+
+    def write_jsonl(self, test, run_id):
+        """Agrega los registros del test al JSONL de la ejecución (uno por worker)."""
+        if not self.test_records:
+            return None
+        path = os.path.join(artifact_dir('timings'), f"page_timings_{run_id}.jsonl")
+        with open(path, 'a', encoding='utf-8') as file:
+            for record in self.test_records:
+                file.write(json.dumps(dict(record, test=test)) + "\n")
+        return path
+
+
+PAGE_TIMINGS = PageTimings()
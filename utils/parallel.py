@@ -0,0 +1,33 @@
+# utils/parallel.py
+
+import os
+
+# ====================================================================
+# --- SOPORTE PARA EJECUCIÓN EN PARALELO (pytest-xdist) ---
+# ====================================================================
+
+REPORTS_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'reports'))
+
+
+def worker_id():
+    """
+    Retorna el id del worker de xdist ('gw0', 'gw1', ...) o 'main' si la
+    ejecución no es paralela.
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+def is_xdist_worker(config):
+    """Indica si el proceso actual es un worker de xdist."""
+    return hasattr(config, "workerinput")
+
+
+def artifact_dir(kind):
+    """
+    Retorna (y crea si hace falta) el directorio de artefactos de este worker,
+    por ejemplo reports/traces/gw0.
+    """
+    path = os.path.join(REPORTS_DIR, kind, worker_id())
+    os.makedirs(path, exist_ok=True)
+    return path
+
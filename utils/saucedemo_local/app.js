@@ -0,0 +1,266 @@
+// Réplica local mínima de www.saucedemo.com para ejecutar las pruebas de UI sin red.
+// Expone los mismos ids, clases y atributos data-test que usan los Page Objects de utils/.
+(function () {
+  "use strict";
+
+  var SESSION_COOKIE = "session-username";
+  var CART_KEY = "cart-contents";
+  var PASSWORD = "secret_sauce";
+  var USERS = ["standard_user", "locked_out_user", "problem_user",
+               "performance_glitch_user", "error_user", "visual_user"];
+  var TAX_RATE = 0.08;
+
+  // Catálogo en el orden por defecto del sitio real (A-Z)
+  var PRODUCTS = [
+    {id: 4, slug: "sauce-labs-backpack", name: "Sauce Labs Backpack", price: 29.99,
+     desc: "carry.allTheThings() with the sleek, streamlined Sly Pack that melds uncompromising style with unequaled laptop and tablet protection."},
+    {id: 0, slug: "sauce-labs-bike-light", name: "Sauce Labs Bike Light", price: 9.99,
+     desc: "A red light isn't the desired state in testing but it sure helps when riding your bike at night. Water-resistant with 3 lighting modes, 1 AAA battery included."},
+    {id: 1, slug: "sauce-labs-bolt-t-shirt", name: "Sauce Labs Bolt T-Shirt", price: 15.99,
+     desc: "Get your testing superhero on with the Sauce Labs bolt T-shirt. From American Apparel, 100% ringspun combed cotton, heather gray with red bolt."},
+    {id: 5, slug: "sauce-labs-fleece-jacket", name: "Sauce Labs Fleece Jacket", price: 49.99,
+     desc: "It's not every day that you come across a midweight quarter-zip fleece jacket capable of handling everything from a relaxing day outdoors to a busy day at the office."},
+    {id: 2, slug: "sauce-labs-onesie", name: "Sauce Labs Onesie", price: 7.99,
+     desc: "Rib snap infant onesie for the junior automation engineer in development. Reinforced 3-snap bottom closure, two-needle hemmed sleeved and bottom won't unravel."},
+    {id: 3, slug: "test.allthethings()-t-shirt-(red)", name: "Test.allTheThings() T-Shirt (Red)", price: 15.99,
+     desc: "This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard to automate a few tests. Super-soft and comfy ringspun combed cotton."}
+  ];
+
+  // --- Sesión y carrito ---
+
+  function getCookie(name) {
+    var match = document.cookie.match(new RegExp("(?:^|; )" + name + "=([^;]*)"));
+    return match ? decodeURIComponent(match[1]) : null;
+  }
+
+  function sessionUser() {
+    return getCookie(SESSION_COOKIE);
+  }
+
+  function getCart() {
+    try {
+      return JSON.parse(window.localStorage.getItem(CART_KEY)) || [];
+    } catch (e) {
+      return [];
+    }
+  }
+
+  function setCart(ids) {
+    window.localStorage.setItem(CART_KEY, JSON.stringify(ids));
+    renderBadge();
+  }
+
+  function productById(id) {
+    for (var i = 0; i < PRODUCTS.length; i++) {
+      if (PRODUCTS[i].id === id) { return PRODUCTS[i]; }
+    }
+    return null;
+  }
+
+  function formatPrice(value) {
+    return "$" + value.toFixed(2);
+  }
+
+  function el(tag, attrs, text) {
+    var node = document.createElement(tag);
+    Object.keys(attrs || {}).forEach(function (key) { node.setAttribute(key, attrs[key]); });
+    if (text !== undefined) { node.textContent = text; }
+    return node;
+  }
+
+  // --- Componentes compartidos ---
+
+  function renderBadge() {
+    var link = document.querySelector(".shopping_cart_link");
+    if (!link) { return; }
+    var badge = link.querySelector(".shopping_cart_badge");
+    var count = getCart().length;
+    if (count === 0) {
+      if (badge) { link.removeChild(badge); }
+      return;
+    }
+    if (!badge) {
+      badge = el("span", {"class": "shopping_cart_badge", "data-test": "shopping-cart-badge"});
+      link.appendChild(badge);
+    }
+    badge.textContent = String(count);
+  }
+
+  function cartButton(product) {
+    var inCart = getCart().indexOf(product.id) !== -1;
+    var prefix = inCart ? "remove-" : "add-to-cart-";
+    var button = el("button", {
+      "class": "btn btn_small btn_inventory " + (inCart ? "btn_secondary" : "btn_primary"),
+      "id": prefix + product.slug,
+      "data-test": prefix + product.slug,
+      "name": prefix + product.slug
+    }, inCart ? "Remove" : "Add to cart");
+    button.addEventListener("click", function () {
+      var cart = getCart();
+      var index = cart.indexOf(product.id);
+      if (index === -1) { cart.push(product.id); } else { cart.splice(index, 1); }
+      setCart(cart);
+      button.parentNode.replaceChild(cartButton(product), button);
+    });
+    return button;
+  }
+
+  function itemDescription(product) {
+    var label = el("div", {"class": "inventory_item_label"});
+    var link = el("a", {"href": "#", "id": "item_" + product.id + "_title_link",
+                        "data-test": "item-" + product.id + "-title-link"});
+    link.appendChild(el("div", {"class": "inventory_item_name", "data-test": "inventory-item-name"}, product.name));
+    label.appendChild(link);
+    label.appendChild(el("div", {"class": "inventory_item_desc", "data-test": "inventory-item-desc"}, product.desc));
+    return label;
+  }
+
+  // --- Páginas ---
+
+  function loginPage() {
+    var form = document.getElementById("login_form");
+    var error = document.querySelector(".error-message-container");
+
+    function showError(message) {
+      error.innerHTML = "";
+      error.classList.add("error");
+      error.appendChild(el("h3", {"data-test": "error"}, message));
+    }
+
+    var denied = new URLSearchParams(window.location.search).get("denied");
+    if (denied) {
+      showError("Epic sadface: You can only access '/" + denied + "' when you are logged in.");
+    }
+
+    form.addEventListener("submit", function (event) {
+      event.preventDefault();
+      var username = document.getElementById("user-name").value;
+      var password = document.getElementById("password").value;
+      if (!username) { return showError("Epic sadface: Username is required"); }
+      if (!password) { return showError("Epic sadface: Password is required"); }
+      if (USERS.indexOf(username) === -1 || password !== PASSWORD) {
+        return showError("Epic sadface: Username and password do not match any user in this service");
+      }
+      if (username === "locked_out_user") {
+        return showError("Epic sadface: Sorry, this user has been locked out.");
+      }
+      document.cookie = SESSION_COOKIE + "=" + encodeURIComponent(username) + "; path=/";
+      window.location.href = "inventory.html";
+    });
+  }
+
+  function inventoryPage() {
+    var list = document.querySelector(".inventory_list");
+    PRODUCTS.forEach(function (product) {
+      var item = el("div", {"class": "inventory_item", "data-test": "inventory-item"});
+      var body = el("div", {"class": "inventory_item_description"});
+      body.appendChild(itemDescription(product));
+      var pricebar = el("div", {"class": "pricebar"});
+      pricebar.appendChild(el("div", {"class": "inventory_item_price", "data-test": "inventory-item-price"},
+                              formatPrice(product.price)));
+      pricebar.appendChild(cartButton(product));
+      body.appendChild(pricebar);
+      item.appendChild(body);
+      list.appendChild(item);
+    });
+  }
+
+  function cartItems(container, withButtons) {
+    getCart().forEach(function (id) {
+      var product = productById(id);
+      if (!product) { return; }
+      var item = el("div", {"class": "cart_item", "data-test": "inventory-item"});
+      item.appendChild(el("div", {"class": "cart_quantity", "data-test": "item-quantity"}, "1"));
+      var body = el("div", {"class": "cart_item_label"});
+      body.appendChild(itemDescription(product));
+      var pricebar = el("div", {"class": "item_pricebar"});
+      pricebar.appendChild(el("div", {"class": "inventory_item_price", "data-test": "inventory-item-price"},
+                              formatPrice(product.price)));
+      if (withButtons) {
+        var remove = el("button", {"class": "btn btn_secondary btn_small cart_button",
+                                   "id": "remove-" + product.slug, "data-test": "remove-" + product.slug},
+                        "Remove");
+        remove.addEventListener("click", function () {
+          setCart(getCart().filter(function (other) { return other !== id; }));
+          container.removeChild(item);
+        });
+        pricebar.appendChild(remove);
+      }
+      body.appendChild(pricebar);
+      item.appendChild(body);
+      container.appendChild(item);
+    });
+  }
+
+  function cartPage() {
+    cartItems(document.querySelector(".cart_list"), true);
+    document.getElementById("checkout").addEventListener("click", function () {
+      window.location.href = "checkout-step-one.html";
+    });
+    document.getElementById("continue-shopping").addEventListener("click", function () {
+      window.location.href = "inventory.html";
+    });
+  }
+
+  function checkoutStepOnePage() {
+    var form = document.getElementById("checkout_info_form");
+    var error = document.querySelector(".error-message-container");
+    form.addEventListener("submit", function (event) {
+      event.preventDefault();
+      var fields = [["first-name", "First Name"], ["last-name", "Last Name"], ["postal-code", "Postal Code"]];
+      for (var i = 0; i < fields.length; i++) {
+        if (!document.getElementById(fields[i][0]).value) {
+          error.innerHTML = "";
+          error.classList.add("error");
+          error.appendChild(el("h3", {"data-test": "error"}, "Error: " + fields[i][1] + " is required"));
+          return;
+        }
+      }
+      window.location.href = "checkout-step-two.html";
+    });
+    document.getElementById("cancel").addEventListener("click", function () {
+      window.location.href = "cart.html";
+    });
+  }
+
+  function checkoutStepTwoPage() {
+    cartItems(document.querySelector(".cart_list"), false);
+    var subtotal = getCart().reduce(function (sum, id) {
+      var product = productById(id);
+      return sum + (product ? product.price : 0);
+    }, 0);
+    var tax = Math.round(subtotal * TAX_RATE * 100) / 100;
+    document.querySelector(".summary_subtotal_label").textContent = "Item total: " + formatPrice(subtotal);
+    document.querySelector(".summary_tax_label").textContent = "Tax: " + formatPrice(tax);
+    document.querySelector(".summary_total_label").textContent = "Total: " + formatPrice(subtotal + tax);
+    document.getElementById("finish").addEventListener("click", function () {
+      window.localStorage.removeItem(CART_KEY);
+      window.location.href = "checkout-complete.html";
+    });
+  }
+
+  function checkoutCompletePage() {
+    document.getElementById("back-to-products").addEventListener("click", function () {
+      window.location.href = "inventory.html";
+    });
+  }
+
+  var PAGES = {
+    "login": loginPage,
+    "inventory": inventoryPage,
+    "cart": cartPage,
+    "checkout-step-one": checkoutStepOnePage,
+    "checkout-step-two": checkoutStepTwoPage,
+    "checkout-complete": checkoutCompletePage
+  };
+
+  var page = document.body.getAttribute("data-page");
+  if (page !== "login" && !sessionUser()) {
+    // Igual que el sitio real: sin sesión se vuelve al login con un mensaje de error
+    var path = window.location.pathname.replace(/^.*\//, "");
+    window.location.replace("./?denied=" + encodeURIComponent(path));
+    return;
+  }
+  PAGES[page]();
+  renderBadge();
+})();
@@ -0,0 +1,106 @@
+# utils/scheduler.py
+
+import os
+import json
+import heapq
+import statistics
+
+from utils.log_config import get_logger
+from utils.parallel import REPORTS_DIR
+
+logger = get_logger('timing')
+
+# ====================================================================
+# --- PLANIFICACIÓN POR DURACIÓN (workers de xdist y shards de CI) ---
+# ====================================================================
+
+DEFAULT_HISTORY_PATH = os.path.join(REPORTS_DIR, 'test_durations.json')
+HISTORY_VERSION = 1
+# Estimación para un test sin historial ni tests parecidos con historial
+DEFAULT_ESTIMATE_S = 1.0
+# Peso de la última medición en el promedio móvil (suaviza corridas atípicas)
+SMOOTHING = 0.5
+
+
+def _function_id(nodeid):
+    """'test/x.py::test_a[param]' -> 'test/x.py::test_a' (todas las parametrizaciones)."""
+    return nodeid.split('[', 1)[0]
+
+
+def _module_id(nodeid):
+    return nodeid.split('::', 1)[0]
+
+
+class DurationHistory:
+    """
+    Historial local de duraciones por test (setup + call + teardown, en
+    segundos), actualizado con un promedio móvil exponencial al final de
+    cada ejecución.
+    """
+
+    def __init__(self, path=DEFAULT_HISTORY_PATH):
+        self.path = path
+        self.durations = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError) as e:
+            logger.warning("Historial de duraciones ilegible (%s); se ignora.", e)
+            return {}
+        if data.get('version') != HISTORY_VERSION:
+            return {}
+        return data.get('durations', {})
+
+    def estimate(self, nodeid):
+        """
+        Duración estimada de un test. Sin historial propio usa, en orden, la
+        mediana de las otras parametrizaciones del mismo test, la del mismo
+        módulo, la de todos los tests conocidos o DEFAULT_ESTIMATE_S.
+        """
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        for key in (_function_id, _module_id):
+            similar = [value for other, value in self.durations.items() if key(other) == key(nodeid)]
+            if similar:
+                return statistics.median(similar)
+        if self.durations:
+            return statistics.median(self.durations.values())
+        return DEFAULT_ESTIMATE_S
+
+    def update(self, measured):
+        """Incorpora las duraciones medidas en esta ejecución ({nodeid: segundos})."""
+        for nodeid, seconds in measured.items():
+            previous = self.durations.get(nodeid)
+            self.durations[nodeid] = seconds if previous is None else SMOOTHING * seconds + (1 - SMOOTHING) * previous
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as file:
+            durations = {nodeid: round(seconds, 4) for nodeid, seconds in sorted(self.durations.items())}
+            json.dump({'version': HISTORY_VERSION, 'durations': durations}, file, indent=2)
+
+
+def longest_first(nodeids, estimate):
+    """Ordena los tests de mayor a menor duración estimada (desempate por nodeid)."""
+    return sorted(nodeids, key=lambda nodeid: (-estimate(nodeid), nodeid))
+
+
+def plan_shards(nodeids, count, estimate):
+    """
+    Reparte los tests en 'count' shards con la heurística LPT: cada test, del
+    más largo al más corto, va al shard con menos carga acumulada. Retorna una
+    lista de {'tests': [...], 'predicted_s': segundos} (determinista: todos los
+    procesos que planifican con el mismo historial obtienen el mismo reparto).
+    """
+    shards = [{'tests': [], 'predicted_s': 0.0} for _ in range(count)]
+    heap = [(0.0, index) for index in range(count)]
+    for nodeid in longest_first(nodeids, estimate):
+        load, index = heapq.heappop(heap)
+        shards[index]['tests'].append(nodeid)
+        shards[index]['predicted_s'] = load + estimate(nodeid)
+        heapq.heappush(heap, (shards[index]['predicted_s'], index))
+    return shards
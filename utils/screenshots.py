@@ -0,0 +1,139 @@
+# utils/screenshots.py
+
+import io
+import os
+import time
+import queue
+import base64
+import threading
+
+from utils.artifact_store import ARTIFACT_STORE
+from utils.log_config import get_logger
+
+# Pillow es opcional: sin él se guarda sólo la imagen completa y el reporte la escala
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+logger = get_logger('artifacts')
+
+# ====================================================================
+# --- CAPTURAS DE PANTALLA ASÍNCRONAS (imagen completa + miniatura) ---
+# ====================================================================
+
+SCREENSHOT_MODES = ('viewport', 'full', 'element')
+
+SCREENSHOT_SETTINGS = {
+    'mode': os.environ.get("SCREENSHOT_MODE", "viewport"),
+    'thumbnail_size': (300, 200),
+    'thumbnail_quality': 70,
+}
+
+
+def configure_screenshots(mode=None):
+    """Ajusta el modo de captura usado por defecto ('viewport', 'full' o 'element')."""
+    if mode is not None:
+        if mode not in SCREENSHOT_MODES:
+            raise ValueError(f"Modo de captura desconocido: {mode}. Opciones: {SCREENSHOT_MODES}")
+        SCREENSHOT_SETTINGS['mode'] = mode
+
+
+def capture_png(driver, mode='viewport', element=None):
+    """
+    Captura la pantalla en memoria y retorna los bytes PNG:
+    - 'viewport': lo visible en la ventana.
+    - 'full': la página completa vía CDP (Page.captureScreenshot); si el driver
+      no lo soporta, cae a 'viewport'.
+    - 'element': sólo el elemento indicado; sin elemento, cae a 'viewport'.
+    """
+    if mode == 'element' and element is not None:
+        return element.screenshot_as_png
+    if mode == 'full' and hasattr(driver, 'execute_cdp_cmd'):
+        try:
+            result = driver.execute_cdp_cmd(
+                "Page.captureScreenshot", {"format": "png", "captureBeyondViewport": True}
+            )
+            return base64.b64decode(result['data'])
+        except Exception as e:
+            logger.warning("Captura de página completa no disponible (%s); se usa el viewport.", e)
+    return driver.get_screenshot_as_png()
+
+
+class ScreenshotJob:
+    """Capturas pendientes de escritura: rutas relativas de la imagen y su miniatura."""
+
+    def __init__(self, path, thumbnail):
+        self.path = path
+        self.thumbnail = thumbnail
+
+
+class ScreenshotWriter:
+    """
+    Escribe las capturas en un hilo de fondo dentro del almacén de artefactos
+    (un archivo por contenido: una captura idéntica a otra ya guardada no se
+    vuelve a escribir). submit() sólo calcula el hash y encola los bytes, y
+    retorna de inmediato las rutas donde quedarán los archivos; flush() espera
+    a que la cola se vacíe (se llama al terminar la sesión).
+    """
+
+    def __init__(self, store=ARTIFACT_STORE):
+        self.store = store
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._pending = set()
+        self.stats = {'queued': 0, 'deduplicated': 0, 'written': 0, 'failed': 0, 'bytes': 0, 'write_s': 0.0}
+
+    def submit(self, png):
+        """Encola una captura PNG y retorna su ScreenshotJob con las rutas relativas."""
+        digest, path, exists = self.store.locate(png, 'png')
+        thumbnail = self.store.object_path(digest, 'jpg', suffix='_thumb') if Image is not None else None
+        job = ScreenshotJob(self.store.relative(path), self.store.relative(thumbnail) if thumbnail else None)
+
+        with self._lock:
+            if exists or path in self._pending:
+                self.stats['deduplicated'] += 1
+                return job
+            self._pending.add(path)
+        self._ensure_started()
+        self.stats['queued'] += 1
+        self._queue.put((png, path, thumbnail))
+        return job
+
+    def flush(self):
+        """Bloquea hasta que todas las capturas encoladas estén escritas."""
+        self._queue.join()
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="screenshot-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            png, path, thumbnail = self._queue.get()
+            start = time.perf_counter()
+            try:
+                if thumbnail:
+                    image = Image.open(io.BytesIO(png))
+                    image.thumbnail(SCREENSHOT_SETTINGS['thumbnail_size'])
+                    buffer = io.BytesIO()
+                    image.convert('RGB').save(buffer, 'JPEG', quality=SCREENSHOT_SETTINGS['thumbnail_quality'])
+                    self.store.write(thumbnail, buffer.getvalue())
+                self.store.write(path, png)
+                self.stats['written'] += 1
+                self.stats['bytes'] += len(png)
+            except Exception as e:
+                self.stats['failed'] += 1
+                logger.error("Fallo al escribir la captura %s: %s", path, e)
+            finally:
+                with self._lock:
+                    self._pending.discard(path)
+                self.stats['write_s'] += time.perf_counter() - start
+                self._queue.task_done()
+
+
+# Un único escritor por proceso (cada worker de xdist tiene el suyo)
+SCREENSHOT_WRITER = ScreenshotWriter()
@@ -0,0 +1,132 @@
+# utils/session.py
+
+import json
+
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+from utils.base_page import BasePage, get_base_url
+from utils.log_config import get_logger
+from utils.login_page import LoginPage
+from utils.inventory_page import InventoryPage
+from utils.page_timing import PAGE_TIMINGS
+
+logger = get_logger('pages')
+
+# ====================================================================
+# --- AUTENTICACIÓN SIN PASAR POR LA UI DE LOGIN ---
+# ====================================================================
+
+# Sauce Demo guarda la sesión en esta cookie, cuyo valor es el nombre de usuario
+SESSION_COOKIE = "session-username"
+INVENTORY_PATH = "inventory.html"
+
+# Tiempo máximo para decidir si la cookie fue aceptada
+SESSION_CHECK_TIMEOUT = 5
+
+# El carrito se guarda en localStorage como una lista JSON de ids de producto
+CART_STORAGE_KEY = "cart-contents"
+PRODUCT_IDS = {
+    "sauce-labs-backpack": 4,
+    "sauce-labs-bike-light": 0,
+    "sauce-labs-bolt-t-shirt": 1,
+    "sauce-labs-fleece-jacket": 5,
+    "sauce-labs-onesie": 2,
+    "test.allthethings()-t-shirt-(red)": 3,
+}
+
+# Páginas desde las que puede arrancar un test con el carrito precargado
+CART_PAGE = "cart.html"
+CHECKOUT_STEP_ONE_PAGE = "checkout-step-one.html"
+CHECKOUT_STEP_TWO_PAGE = "checkout-step-two.html"
+
+
+def inject_session(driver, username, base_url=None):
+    """
+    Inyecta la cookie de sesión y navega directamente al inventario.
+    El driver debe estar ya en el dominio del sitio (ver fixture login_setup).
+    """
+    base_url = base_url or get_base_url()
+    driver.add_cookie({"name": SESSION_COOKIE, "value": username, "path": "/"})
+    PAGE_TIMINGS.get(driver, base_url + INVENTORY_PATH)
+
+
+def is_session_active(driver):
+    """
+    Verifica si el inventario cargó. Si la cookie no es aceptada el sitio
+    redirige al login, por lo que se espera a cualquiera de las dos páginas.
+    """
+    page = BasePage(driver)
+    try:
+        page._wait_until(
+            EC.any_of(
+                EC.presence_of_element_located(LoginPage.INVENTORY_CONTAINER),
+                EC.presence_of_element_located(LoginPage.LOGIN_BUTTON),
+            ),
+            timeout=SESSION_CHECK_TIMEOUT,
+        )
+    except TimeoutException:
+        return False
+    return page.is_present_now(LoginPage.INVENTORY_CONTAINER)
+
+
+def authenticate(driver, username, password, base_url=None):
+    """
+    Establece la sesión inyectando la cookie. Si la verificación falla
+    (por ejemplo, si el sitio cambió su mecanismo de sesión) hace el login por UI.
+    Retorna el método utilizado: 'cookie' o 'ui'.
+    """
+    base_url = base_url or get_base_url()
+    inject_session(driver, username, base_url)
+    if is_session_active(driver):
+        logger.info("Sesión de '%s' establecida por cookie.", username)
+        return 'cookie'
+
+    logger.warning("La inyección de la cookie de sesión no funcionó; se usa el login por UI.")
+    driver.delete_cookie(SESSION_COOKIE)
+    PAGE_TIMINGS.get(driver, base_url)
+    login_page = LoginPage(driver)
+    login_page.login(username, password)
+    assert login_page.wait_for_inventory_page(), "ERROR: La página de inventario no cargó después del login."
+    return 'ui'
+
+
+# ====================================================================
+# --- PRECARGA DEL CARRITO ---
+# ====================================================================
+
+def seed_cart(driver, products, start_page=CART_PAGE, base_url=None):
+    """
+    Escribe el contenido del carrito directamente en el localStorage y navega
+    a 'start_page' (carrito o pasos del checkout) con una sola navegación.
+    'products' son los identificadores usados en los botones del inventario,
+    por ejemplo "sauce-labs-backpack". Requiere una sesión activa.
+    Retorna el texto del badge del carrito, verificado contra lo precargado.
+    Si 'products' está vacía, limpia el carrito y retorna "" (la aplicación no muestra
+    el badge, así que no hay nada que verificar).
+    """
+    base_url = base_url or get_base_url()
+    unknown = [product for product in products if product not in PRODUCT_IDS]
+    if unknown:
+        raise ValueError(f"Productos desconocidos: {unknown}. Opciones: {sorted(PRODUCT_IDS)}")
+
+    if not products:
+        driver.execute_script("window.localStorage.removeItem(arguments[0]);", CART_STORAGE_KEY)
+        PAGE_TIMINGS.get(driver, base_url + start_page)
+        logger.info("Carrito vaciado en %s.", start_page)
+        return ""
+
+    product_ids = [PRODUCT_IDS[product] for product in products]
+    driver.execute_script(
+        "window.localStorage.setItem(arguments[0], arguments[1]);",
+        CART_STORAGE_KEY, json.dumps(product_ids),
+    )
+    PAGE_TIMINGS.get(driver, base_url + start_page)
+
+    # Una única lectura del badge confirma que la aplicación reconoció el carrito
+    badge = BasePage(driver).find_element(InventoryPage.CART_BADGE, timeout=SESSION_CHECK_TIMEOUT).text
+    assert badge == str(len(product_ids)), (
+        f"ERROR: El carrito precargado no fue reconocido (badge '{badge}', se esperaba '{len(product_ids)}')."
+    )
+    logger.info("Carrito precargado con %d productos en %s.", len(product_ids), start_page)
+    return badge
@@ -0,0 +1,171 @@
+# utils/startup_report.py
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import subprocess
+
+from utils.log_config import get_logger
+
+logger = get_logger('timing')
+
+# ====================================================================
+# --- TIEMPO DE ARRANQUE DE PYTEST (importaciones y colección) ---
+# ====================================================================
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+DEFAULT_BUDGET_PATH = os.path.join(PROJECT_ROOT, 'data', 'startup_budget.json')
+BUDGET_VERSION = 1
+
+# Paquetes que solo deben cargarse si algún test seleccionado pide la fixture 'driver'
+BROWSER_MODULES = ('selenium', 'webdriver_manager')
+
+# Formato de cada línea de 'python -X importtime': "import time: self | cumulative | módulo",
+# con el nombre indentado según la profundidad de la importación
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)\s*$")
+COLLECTED_LINE = re.compile(r"(\d+)(?:/\d+)? tests? collected.* in ([\d.]+)s")
+
+
+def load_budget(path=DEFAULT_BUDGET_PATH):
+    """Lee los presupuestos de arranque por escenario; retorna None si el archivo no existe."""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as file:
+        budget = json.load(file)
+    if budget.get('version') != BUDGET_VERSION:
+        raise ValueError(f"Versión de presupuesto de arranque no soportada: {budget.get('version')}")
+    return budget
+
+
+def parse_importtime(text):
+    """
+    Convierte la salida de -X importtime en una lista de dicts con el módulo,
+    su tiempo propio y acumulado en milisegundos y la profundidad (0 = importado
+    directamente por el código, no por otro módulo).
+    """
+    entries = []
+    for line in text.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append({
+                'module': module,
+                'self_ms': int(self_us) / 1000,
+                'cumulative_ms': int(cumulative_us) / 1000,
+                'depth': len(indent) // 2,
+            })
+    return entries
+
+
+def package_times(entries):
+    """Tiempo propio de importación sumado por paquete raíz ('selenium', 'utils', ...), en ms."""
+    totals = {}
+    for entry in entries:
+        package = entry['module'].split('.')[0]
+        totals[package] = totals.get(package, 0.0) + entry['self_ms']
+    return totals
+
+
+def measure_startup(pytest_args, cwd=PROJECT_ROOT):
+    """
+    Ejecuta 'pytest --collect-only' con -X importtime en un proceso nuevo (sin
+    módulos ya cargados) y retorna el tiempo total, el de importación, el de
+    colección, los tests recolectados y el tiempo de importación por módulo.
+    """
+    # Sin captura (-s): pytest redirige stderr durante la colección y se perderían
+    # las importaciones del conftest y de los módulos de test
+    command = [sys.executable, "-X", "importtime", "-m", "pytest", "--collect-only", "-q", "-s",
+               "-p", "no:cacheprovider", *pytest_args]
+    start = time.perf_counter()
+    completed = subprocess.run(command, cwd=cwd, capture_output=True, text=True)
+    total_ms = (time.perf_counter() - start) * 1000
+    if completed.returncode not in (0, 5):  # 5: no se recolectó ningún test
+        raise RuntimeError(f"La colección falló ({completed.returncode}):\n{completed.stdout[-2000:]}")
+
+    entries = parse_importtime(completed.stderr)
+    collected = COLLECTED_LINE.search(completed.stdout)
+    packages = package_times(entries)
+    return {
+        'args': list(pytest_args),
+        'total_ms': round(total_ms, 1),
+        'import_ms': round(sum(entry['self_ms'] for entry in entries), 1),
+        'collection_ms': round(float(collected.group(2)) * 1000, 1) if collected else None,
+        'tests': int(collected.group(1)) if collected else 0,
+        'packages': packages,
+        'modules': entries,
+        'browser_modules': [name for name in BROWSER_MODULES if name in packages],
+    }
+
+
+def check_budget(result, budget):
+    """
+    Compara una medición con el presupuesto de su escenario ('max_total_ms',
+    'max_import_ms', 'max_collection_ms' y 'forbidden_modules').
+    Retorna la lista de violaciones (vacía si cumple).
+    """
+    violations = []
+    for key, label in (('total_ms', "total"), ('import_ms', "importaciones"), ('collection_ms', "colección")):
+        limit = budget.get(f"max_{key}")
+        if limit is not None and result.get(key) is not None and result[key] > limit:
+            violations.append(f"{label}: {result[key]:.0f} ms (presupuesto {limit:.0f} ms)")
+    loaded = [name for name in budget.get('forbidden_modules', ()) if name in result['packages']]
+    if loaded:
+        violations.append(f"módulos no permitidos cargados: {', '.join(loaded)}")
+    return violations
+
+
+def format_report(result, limit=15):
+    """Resumen de texto: tiempos del arranque y los paquetes que más tardan en importarse."""
+    lines = [
+        f"total: {result['total_ms']:.0f} ms  importaciones: {result['import_ms']:.0f} ms  "
+        f"colección: {result['collection_ms'] or 0:.0f} ms  tests: {result['tests']}  "
+        f"navegador: {', '.join(result['browser_modules']) or 'no cargado'}",
+        f"{'paquete':<32}{'ms':>9}",
+    ]
+    for package, ms in sorted(result['packages'].items(), key=lambda item: -item[1])[:limit]:
+        lines.append(f"{package:<32}{ms:>9.1f}")
+    own = sorted((entry for entry in result['modules'] if entry['module'].startswith(('utils.', 'test.'))),
+                 key=lambda entry: -entry['cumulative_ms'])[:limit]
+    if own:
+        lines.append(f"{'módulo del framework (acumulado)':<32}{'ms':>9}")
+        for entry in own:
+            lines.append(f"{entry['module']:<32}{entry['cumulative_ms']:>9.1f}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tiempo de arranque de pytest por escenario, con presupuesto")
+    parser.add_argument("--scenario", help="Escenario del presupuesto a medir; por defecto todos.")
+    parser.add_argument("--budget", default=DEFAULT_BUDGET_PATH, help="Archivo de presupuestos de arranque.")
+    parser.add_argument("--limit", type=int, default=15, help="Cantidad de paquetes y módulos a listar.")
+    parser.add_argument("pytest_args", nargs="*", help="Argumentos de pytest a medir en lugar de un escenario (después de '--').")
+    args = parser.parse_args(argv)
+
+    budget = load_budget(args.budget)
+    if args.pytest_args:
+        scenarios = {'custom': {'args': args.pytest_args}}
+    elif budget is None:
+        parser.error(f"No hay presupuesto en {args.budget}; indicar argumentos de pytest.")
+    else:
+        scenarios = budget['scenarios']
+        if args.scenario:
+            if args.scenario not in scenarios:
+                parser.error(f"Escenario desconocido: {args.scenario}. Opciones: {sorted(scenarios)}")
+            scenarios = {args.scenario: scenarios[args.scenario]}
+
+    failed = False
+    for name, scenario in scenarios.items():
+        result = measure_startup(scenario['args'])
+        print(f"== {name}: pytest {' '.join(scenario['args'])}")
+        print(format_report(result, args.limit))
+        for violation in check_budget(result, scenario):
+            logger.error("Presupuesto de arranque excedido en %s: %s", name, violation)
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
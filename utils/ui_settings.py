@@ -0,0 +1,71 @@
+# utils/ui_settings.py
+
+import os
+
+# ====================================================================
+# --- CONFIGURACIÓN DE LA UI (sin dependencias de Selenium) ---
+# ====================================================================
+
+# conftest registra sus opciones y las aplica con estos valores en todas las
+# ejecuciones; al no importar Selenium, una ejecución solo de API no lo carga.
+# utils/base_page.py los re-exporta para los Page Objects.
+
+# URL base del sitio bajo prueba (el sitio real por defecto; ver set_base_url)
+BASE_URL = "https://www.saucedemo.com/"
+_base_url = BASE_URL
+
+
+def set_base_url(url):
+    """Cambia la URL base de la sesión (por ejemplo, a la réplica local)."""
+    global _base_url
+    _base_url = url if url.endswith('/') else url + '/'
+
+
+def get_base_url():
+    """Retorna la URL base activa, siempre terminada en '/'."""
+    return _base_url
+
+# --- Esperas ---
+
+# Todas las esperas del framework son explícitas y pasan por BasePage._wait_until.
+# La espera implícita del driver queda en 0 (ver utils/browser_profiles.py) para
+# que una búsqueda fallida no sume ambos tiempos de espera.
+WAIT_SETTINGS = {
+    'timeout': float(os.environ.get("WAIT_TIMEOUT", 15)),
+    'poll_frequency': float(os.environ.get("WAIT_POLL_INTERVAL", 0.5)),
+    'absent_timeout': 2,
+}
+
+
+def configure_waits(timeout=None, poll_frequency=None):
+    """Ajusta el timeout por defecto y el intervalo de sondeo de las esperas."""
+    if timeout is not None:
+        WAIT_SETTINGS['timeout'] = timeout
+    if poll_frequency is not None:
+        WAIT_SETTINGS['poll_frequency'] = poll_frequency
+
+# --- Llenado de formularios ---
+
+# Modo de llenado de formularios: 'keys' tipea carácter por carácter (como un
+# usuario); 'fast' asigna los valores por script y dispara los eventos input/change.
+FORM_FILL_MODES = ('keys', 'fast')
+FORM_SETTINGS = {'mode': os.environ.get("FORM_FILL_MODE", 'keys')}
+
+
+def configure_form_fill(mode=None):
+    """Selecciona el modo de llenado de formularios por defecto ('keys' o 'fast')."""
+    if mode is not None:
+        if mode not in FORM_FILL_MODES:
+            raise ValueError(f"Modo de llenado desconocido: {mode}. Opciones: {FORM_FILL_MODES}")
+        FORM_SETTINGS['mode'] = mode
+
+# --- Caché de elementos ---
+
+ELEMENT_CACHE_SETTINGS = {'enabled': os.environ.get("ELEMENT_CACHE", "0") == "1"}
+ELEMENT_CACHE_STATS = {'hits': 0, 'misses': 0, 'invalidations': 0, 'stale_refreshes': 0}
+
+
+def configure_element_cache(enabled=None):
+    """Activa o desactiva la caché de elementos por defecto de los Page Objects."""
+    if enabled is not None:
+        ELEMENT_CACHE_SETTINGS['enabled'] = enabled